@@ -8,6 +8,7 @@ a = Analysis(
     datas=[
         ('*.png', '.'),
         ('sans.ttf', '.'),
+        ('styles/*.qss', 'styles'),
         ('modern_updater.py', '.'),
         ('update_config.py', '.'),
         ('localization.py', '.'),
@@ -12,15 +12,60 @@ import json
 import shutil
 import re
 import os
+import io
+import gzip
 import random
+import functools
+import time
+import traceback
+import webbrowser
+import subprocess
+import locale
+import collections
+import codecs
+from concurrent.futures import ThreadPoolExecutor, Future, wait, as_completed, FIRST_COMPLETED
 from pathlib import Path
 from html import escape
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from urllib.request import urlopen
+from urllib.request import urlopen, Request
 from urllib.error import URLError
+import urllib.parse
+
+# HTTP сессия для Steam API (переиспользует TCP/TLS соединения между запросами)
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+    print("Библиотека requests недоступна, используется urllib")
+
+# Быстрый разбор JSON (orjson принимает bytes напрямую, без decode); _dumps возвращает UTF-8 bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _loads = orjson.loads
+    _dumps = lambda obj, indent=False: orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads = lambda data: json.loads(data.decode('utf-8') if isinstance(data, bytes) else data)
+    _dumps = lambda obj, indent=False: json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None, separators=None if indent else (',', ':')
+    ).encode('utf-8')
+
+# Реестр Windows (путь установки Steam для автоопределения папки игры)
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# Подробный отладочный вывод (полные ответы Steam API и т.п.) - только с L4D2_ADDON_MANAGER_DEBUG=1
+DEBUG = os.environ.get("L4D2_ADDON_MANAGER_DEBUG") == "1"
 
 # Импортируем современную систему обновлений
 try:
@@ -53,7 +98,147 @@ except ImportError:
         return "ru"
 
 CONFIG_FILE = Path.home() / ".l4d2_mod_manager_config.json"
+CARD_BATCH_SIZE = 40  # Сколько карточек аддонов создается за раз (остальные - по мере прокрутки)
 STEAM_API_URL = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
+STEAM_COLLECTION_API_URL = "https://api.steampowered.com/ISteamRemoteStorage/GetCollectionDetails/v1/"
+STEAM_COLLECTION_CACHE_TTL = 10 * 60  # Состав коллекции повторно не запрашивается 10 минут
+STEAM_API_MAX_IDS = 100  # Максимум publishedfileids в одном запросе к Steam API
+STEAM_DETAILS_CACHE_FILE = Path.home() / ".l4d2_steam_details_cache.json"
+STEAM_DETAILS_CACHE_TTL = 24 * 60 * 60  # Информация из Steam считается свежей 24 часа
+
+# Предкомпилированные регулярные выражения для очистки описаний от BBCode
+_BBCODE_RE = re.compile(r'\[[^\]]{0,500}\]')  # Длина тега ограничена, чтобы не было долгого перебора
+_WS_RE = re.compile(r'\s+')
+
+# Строка подключения аддона в gameinfo.txt: Game left4dead2\addons\workshop\ID
+_GAMEINFO_WORKSHOP_LINE_RE = re.compile(r'^\s*Game\s+left4dead2\\addons\\workshop\\(\S+)\s*$')
+
+# Прогресс SteamCMD ("123 / 456 bytes") и недопустимые символы в имени файла
+_BYTES_RE = re.compile(rb'(\d+)\s*/\s*(\d+)\s*bytes', re.IGNORECASE)
+# "Success. Downloaded item <id> to ..." - мод из серии скачан
+_DOWNLOADED_ITEM_RE = re.compile(rb'downloaded item (\d+)', re.IGNORECASE)
+_INVALID_NAME_RE = re.compile(r'[<>:"/\\|?*]')
+# Итоговое имя .vpk: дополнительно управляющие символы, которые Windows не разрешает в именах
+_UNSAFE_WIN_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Разбор HTML страницы коллекции Steam
+_WORKSHOP_ID_RE = re.compile(r'sharedfiles/filedetails/\?id=(\d+)')
+_WORKSHOP_TITLE_RE = re.compile(r'<div class="workshopItemTitle">([^<]+)</div>')
+# Пути библиотек Steam в steamapps/libraryfolders.vdf
+_VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')
+# ID из ссылки на страницу Workshop (?id=...)
+_URL_ID_RE = re.compile(r'id=(\d+)')
+
+# Вывод SteamCMD читается байтами и декодируется (в кодировке консоли) только для показа
+STEAMCMD_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+# Неблокирующее чтение pipe на Windows (PeekNamedPipe) - без отдельного потока чтения
+try:
+    import msvcrt
+    import ctypes
+    from ctypes import wintypes
+    _PeekNamedPipe = ctypes.windll.kernel32.PeekNamedPipe
+    _PeekNamedPipe.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD,
+                               ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p]
+    _PeekNamedPipe.restype = wintypes.BOOL
+    PEEK_PIPE_AVAILABLE = True
+except (ImportError, AttributeError, OSError):
+    PEEK_PIPE_AVAILABLE = False
+
+# Копирование файла средствами Windows (CopyFileExW, копирует ядро без буфера в Python)
+try:
+    import ctypes
+    from ctypes import wintypes
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD]
+    _CopyFileExW.restype = wintypes.BOOL
+    COPYFILE_EX_AVAILABLE = True
+except (ImportError, AttributeError, OSError):
+    COPYFILE_EX_AVAILABLE = False
+
+
+def open_steam_api(data, timeout=5, url=STEAM_API_URL):
+    """Отправляет POST запрос к Steam API (ответ запрашивается сжатым gzip)"""
+    request = Request(url, data=data, headers={'Accept-Encoding': 'gzip'})
+    return urlopen(request, timeout=timeout)
+
+
+def read_steam_json(response):
+    """Разбирает JSON прямо из ответа Steam API без промежуточной копии тела"""
+    if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+        response = gzip.GzipFile(fileobj=response)
+    if ORJSON_AVAILABLE:
+        return _loads(response.read())
+    return json.load(io.TextIOWrapper(response, encoding='utf-8'))
+
+
+def load_steam_details_cache():
+    """Загружает кэш ответов Steam API (id -> title/description/preview_url/fetched_at)"""
+    try:
+        if STEAM_DETAILS_CACHE_FILE.exists():
+            with open(STEAM_DETAILS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"Ошибка загрузки кэша Steam: {e}")
+    return {}
+
+
+def save_steam_details_cache(cache):
+    """Сохраняет кэш ответов Steam API на диск"""
+    try:
+        with open(STEAM_DETAILS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"Ошибка сохранения кэша Steam: {e}")
+
+
+_steam_session = None
+
+
+def get_steam_session():
+    """Возвращает общую requests.Session с пулом keep-alive соединений"""
+    global _steam_session
+    if _steam_session is None:
+        _steam_session = requests.Session()
+        # Временные ошибки Steam (429/5xx) повторяются в том же соединении; POST к Steam API идемпотентен
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({'GET', 'POST'})
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+        _steam_session.mount('https://', adapter)
+    return _steam_session
+
+
+def close_steam_session():
+    """Закрывает общую сессию и ее keep-alive соединения"""
+    global _steam_session
+    if _steam_session is not None:
+        _steam_session.close()
+        _steam_session = None
+
+
+def steam_api_request(post_data, timeout=5, url=STEAM_API_URL):
+    """Запрашивает GetPublishedFileDetails (или другой метод по url) и возвращает разобранный JSON"""
+    if REQUESTS_AVAILABLE:
+        response = get_steam_session().post(url, data=post_data, timeout=timeout, stream=True)
+        response.raise_for_status()
+        if ORJSON_AVAILABLE:
+            return _loads(response.content)
+        # requests сам распаковывает gzip, читаем JSON потоком из сырого ответа
+        response.raw.decode_content = True
+        return json.load(io.TextIOWrapper(response.raw, encoding='utf-8'))
+    
+    data = urllib.parse.urlencode(post_data).encode('utf-8')
+    return read_steam_json(open_steam_api(data, timeout=timeout, url=url))
+
+
+# Составы коллекций: id -> (время запроса, результат get_collection_items)
+_collection_cache = {}
 
 
 def get_resource_path(filename):
@@ -78,6 +263,361 @@ def get_resource_path(filename):
     return base_path / filename
 
 
+# Тексты таблиц стилей из папки styles (файл читается с диска один раз)
+_QSS_CACHE = {}
+
+
+def load_stylesheet(name):
+    """Возвращает содержимое styles/<name> (кэшируется); пустую строку если файла нет"""
+    qss = _QSS_CACHE.get(name)
+    if qss is None:
+        try:
+            qss = get_resource_path(f"styles/{name}").read_text(encoding='utf-8')
+        except OSError as e:
+            print(f"Не удалось загрузить стили {name}: {e}")
+            qss = ""
+        _QSS_CACHE[name] = qss
+    return qss
+
+
+def scan_workshop_enabled(path):
+    """За один проход os.scandir находит ID, у которых есть и ID.vpk, и папка ID"""
+    vpk_ids = set()
+    folder_ids = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith('.vpk'):
+                stem = name[:-4]
+                if stem.isdigit():
+                    vpk_ids.add(stem)
+            elif name.isdigit() and entry.is_dir():
+                folder_ids.add(name)
+    return vpk_ids & folder_ids
+
+
+def _fast_rm_addon(path):
+    """Удаляет плоскую папку аддона (pak01_*.vpk) без рекурсии shutil.rmtree; отсутствие папки не ошибка"""
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)  # Редкий случай: вложенная папка
+        else:
+            os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_copy(src, dst):
+    """Копирует файл через CopyFileExW на Windows, иначе shutil.copyfile (без copystat, как и остальное копирование)"""
+    if COPYFILE_EX_AVAILABLE:
+        if not _CopyFileExW(str(src), str(dst), None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    shutil.copyfile(src, dst)
+
+
+def rapid_rmtree(path, workers=4):
+    """Удаляет папку: файлы параллельно в пуле потоков, затем папки снизу вверх.
+    Ошибки не прерывают удаление - в конце выбрасывается OSError со списком"""
+    files = []
+    dirs = []
+    for root, dirnames, filenames in os.walk(path, topdown=False):
+        files.extend(os.path.join(root, name) for name in filenames)
+        dirs.append(root)
+    
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(os.unlink, f): f for f in files}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as e:
+                errors.append(f"{futures[future]}: {e}")
+    
+    # os.walk(topdown=False) отдает вложенные папки раньше родительских
+    for d in dirs:
+        try:
+            os.rmdir(d)
+        except OSError as e:
+            errors.append(f"{d}: {e}")
+    
+    if errors:
+        raise OSError(f"Не удалось удалить {len(errors)} объектов:\n" + "\n".join(errors[:5]))
+
+
+class _RmTreeTask(QRunnable):
+    """Удаление папки в пуле потоков Qt (ошибки игнорируются, если не передан future)"""
+    
+    def __init__(self, path, future=None):
+        super().__init__()
+        self.path = path
+        self.future = future
+    
+    def run(self):
+        if self.future is None:
+            shutil.rmtree(self.path, ignore_errors=True)
+            return
+        try:
+            rapid_rmtree(self.path)
+        except Exception as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(None)
+
+
+def remove_tree_async(path):
+    """Запускает удаление временной папки в фоне, не блокируя GUI-поток"""
+    QThreadPool.globalInstance().start(_RmTreeTask(path))
+
+
+def _fast_rmtree(path):
+    """Запускает rapid_rmtree в пуле потоков Qt и сразу возвращает Future с результатом"""
+    future = Future()
+    QThreadPool.globalInstance().start(_RmTreeTask(path, future))
+    return future
+
+
+def _wait_future(future):
+    """Ждет завершения Future в локальном цикле событий (GUI не блокируется) и возвращает результат"""
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setInterval(100)
+    timer.timeout.connect(lambda: future.done() and loop.quit())
+    timer.start()
+    if not future.done():
+        loop.exec()
+    timer.stop()
+    return future.result()
+
+
+def _pipe_bytes_available(pipe):
+    """Сколько байт можно прочитать из pipe без блокировки (0 если pipe закрыт)"""
+    if not PEEK_PIPE_AVAILABLE:
+        return 0
+    available = wintypes.DWORD(0)
+    handle = msvcrt.get_osfhandle(pipe.fileno())
+    if not _PeekNamedPipe(handle, None, 0, None, ctypes.byref(available), None):
+        return 0
+    return available.value
+
+
+# Первое слово строки SteamCMD -> тип строки (одна проверка по словарю вместо цепочки поиска подстрок)
+_STEAMCMD_LINE_KINDS = {
+    b'fatal': 'fatal',
+    b'loading': 'connect',
+    b'connecting': 'connect',
+    b'logging': 'login',
+    b'waiting': 'wait',
+    b'checking': 'wait',
+    b'downloading': 'download',
+    b'success': 'success',
+    b'success.': 'success',
+}
+
+
+def _classify_steamcmd_line(line_lower):
+    """Определяет тип строки вывода SteamCMD (bytes в нижнем регистре); None - ничего интересного"""
+    kind = _STEAMCMD_LINE_KINDS.get(line_lower.split(b' ', 1)[0])
+    if kind is not None:
+        return kind
+    
+    # Ключевое слово не в начале строки - проверяем подстроки в прежнем порядке
+    if b"fatal error" in line_lower:
+        return 'fatal'
+    if b"loading steam api" in line_lower or b"connecting" in line_lower:
+        return 'connect'
+    if b"logging in" in line_lower or b"anonymous" in line_lower:
+        return 'login'
+    if b"waiting for" in line_lower or b"checking" in line_lower:
+        return 'wait'
+    if b"downloading" in line_lower:
+        return 'download'
+    if b"success" in line_lower:
+        return 'success'
+    return None
+
+
+def _format_bytes(bytes_val, precision=2):
+    """Форматирует размер в байтах в B / KB / MB / GB"""
+    if bytes_val < 1024:
+        return f"{int(bytes_val)} B"  # Скорость приходит float - дробные байты не показываем
+    elif bytes_val < 1048576:
+        return f"{bytes_val / 1024:.{precision}f} KB"
+    elif bytes_val < 1073741824:
+        return f"{bytes_val / 1048576:.{precision}f} MB"
+    return f"{bytes_val / 1073741824:.{precision}f} GB"
+
+
+def _fast_tree_size(root):
+    """Суммарный размер файлов в папке (os.scandir со стеком, stat берется из DirEntry); нет папки - 0"""
+    total = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    return total
+
+
+def _tail(path, n=10):
+    """Последние n строк файла (в байтах): файл читается с конца блоками по 8 КБ, а не целиком"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        buf = b''
+        while size > 0 and buf.count(b'\n') <= n:
+            chunk = min(8192, size)
+            size -= chunk
+            f.seek(size)
+            buf = f.read(chunk) + buf
+    return buf.splitlines()[-n:]
+
+
+def _walk_scandir(root):
+    """Рекурсивно выдает DirEntry всех файлов папки (os.scandir со стеком, без объектов Path)"""
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+
+
+def _steam_game_paths():
+    """Папки L4D2 во всех библиотеках Steam (путь Steam берется из реестра); [] если Steam не найден"""
+    if not WINREG_AVAILABLE:
+        return []
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Software\Valve\Steam') as key:
+            steam_path = Path(winreg.QueryValueEx(key, 'SteamPath')[0])
+    except OSError:
+        return []
+    
+    libraries = [steam_path]
+    try:
+        text = (steam_path / "steamapps" / "libraryfolders.vdf").read_text(encoding='utf-8', errors='ignore')
+        # В vdf обратные слеши экранированы
+        libraries += [Path(path.replace('\\\\', '\\')) for path in _VDF_PATH_RE.findall(text)]
+    except OSError:
+        pass
+    return [library / "steamapps" / "common" / "Left 4 Dead 2" for library in dict.fromkeys(libraries)]
+
+
+def _find_by_ext(root, ext, max_depth=1):
+    """Файлы с расширением ext в корне папки, а если там их нет - в подпапках до max_depth уровней"""
+    found = []
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    if entry.name.lower().endswith(ext):
+                        found.append(Path(entry.path))
+                elif max_depth > 0 and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        return found
+    
+    if not found:
+        for subdir in subdirs:
+            found.extend(_find_by_ext(subdir, ext, max_depth - 1))
+    return found
+
+
+class _SizeTracker:
+    """Размер папки, который пересчитывается инкрементально: учитываются только файлы с новым mtime"""
+    
+    def __init__(self, root):
+        self.root = str(root)
+        self._sizes = {}
+        self._mtimes = {}
+        self.total = 0
+    
+    def refresh(self):
+        """Обходит папку (os.scandir со стеком) и обновляет total на изменения с прошлого раза"""
+        seen = set()
+        stack = [self.root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    path = entry.path
+                    seen.add(path)
+                    if self._mtimes.get(path) == stat.st_mtime_ns:
+                        continue
+                    self._mtimes[path] = stat.st_mtime_ns
+                    self.total += stat.st_size - self._sizes.get(path, 0)
+                    self._sizes[path] = stat.st_size
+        
+        # Удаленные файлы (SteamCMD переносит их из downloads в content)
+        if len(seen) != len(self._sizes):
+            for path in self._sizes.keys() - seen:
+                self.total -= self._sizes.pop(path)
+                del self._mtimes[path]
+        return self.total
+
+
+def get_shared_blur_effect(widget):
+    """Возвращает общий blur эффект окна, создавая его только если эффекта ещё нет"""
+    effect = widget.graphicsEffect()
+    if not isinstance(effect, QGraphicsBlurEffect):
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(0)
+        widget.setGraphicsEffect(effect)
+    effect.setEnabled(True)
+    return effect
+
+
+def set_status_indicator(indicator, enabled):
+    """Переключает цвет индикатора статуса через свойство enabled_state (перестилизуется только он сам)"""
+    indicator.setProperty("enabled_state", bool(enabled))
+    style = indicator.style()
+    style.unpolish(indicator)
+    style.polish(indicator)
+
+
+def hide_shared_blur_effect(widget):
+    """Прячет общий blur эффект без его удаления (радиус 0 и отключение отрисовки); другие эффекты снимает"""
+    effect = widget.graphicsEffect()
+    if isinstance(effect, QGraphicsBlurEffect):
+        effect.setBlurRadius(0)
+        effect.setEnabled(False)
+    elif effect is not None:
+        widget.setGraphicsEffect(None)
+
+
 class IconLoadWorker(QThread):
     """Worker thread для асинхронной загрузки иконок"""
     icon_loaded = pyqtSignal(QPixmap)  # загруженная иконка
@@ -90,7 +630,6 @@ class IconLoadWorker(QThread):
     def run(self):
         """Загружает иконку в фоне"""
         try:
-            from urllib.request import urlopen
             # Уменьшенный таймаут для быстрой загрузки
             data = urlopen(self.url, timeout=1.5).read()
             
@@ -140,19 +679,25 @@ class AddonScanWorker(QThread):
             # Собираем информацию об аддонах
             addons_dict = {}  # {ID: {'vpk': путь, 'folder': есть_папка}}
             
-            # Ищем .vpk файлы напрямую в workshop
-            vpk_files = list(self.workshop_path.glob("*.vpk"))
+            # Ищем .vpk файлы и папки с ID за один проход scandir (он сразу дает тип и размер файла)
+            vpk_files = []
+            addon_folders = []
+            with os.scandir(self.workshop_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith('.vpk'):
+                        vpk_files.append(entry)
+                    elif entry.name.isdigit() and entry.is_dir(follow_symlinks=False):
+                        addon_folders.append(entry)
             print(f"🔍 Found VPK files: {len(vpk_files)}")
             for vpk_file in vpk_files:
-                addon_id = vpk_file.stem
+                addon_id = vpk_file.name[:-4]
                 print(f"   VPK: {vpk_file.name} -> ID: {addon_id}")
                 if addon_id.isdigit():
-                    addons_dict[addon_id] = {'vpk': vpk_file, 'folder': False}
+                    addons_dict[addon_id] = {'vpk': Path(vpk_file.path), 'folder': False, 'size': vpk_file.stat().st_size}
             
             self.progress_updated.emit(20, get_text("found_vpk_files", count=len(addons_dict)))
             
-            # Ищем папки с ID
-            addon_folders = [f for f in self.workshop_path.iterdir() if f.is_dir() and f.name.isdigit()]
+            # Папки с ID
             print(f"🔍 Found addon folders: {len(addon_folders)}")
             for folder in addon_folders:
                 addon_id = folder.name
@@ -178,7 +723,8 @@ class AddonScanWorker(QThread):
                     'name': get_text("addon_default_name", id=addon_id),
                     'description': get_text("loading_addon"),
                     'enabled': is_enabled,
-                    'path': data['vpk'] if data['vpk'] else self.workshop_path / addon_id
+                    'path': data['vpk'] if data['vpk'] else self.workshop_path / addon_id,
+                    'size': data.get('size')  # Размер .vpk (None если файла нет)
                 }
                 addons.append(addon_data)
             
@@ -212,16 +758,30 @@ class SteamInfoWorker(QThread):
             
             self.progress_updated.emit(50, get_text("loading_steam_info"))
             
+            # Свежие записи берем из кэша на диске, в Steam запрашиваем только остальные
+            steam_cache = load_steam_details_cache()
+            cache_changed = False
+            now = time.time()
+            all_processed_ids = set()
+            addons_by_id = {addon['id']: addon for addon in self.addons}
+            addon_ids = []
+            for addon in self.addons:
+                cached = steam_cache.get(addon['id'])
+                if cached and now - cached.get('fetched_at', 0) < STEAM_DETAILS_CACHE_TTL:
+                    addon['name'] = cached['title']
+                    addon['description'] = cached['description']
+                    addon['preview_url'] = cached['preview_url']
+                    all_processed_ids.add(addon['id'])
+                else:
+                    addon_ids.append(addon['id'])
+            
             # Обрабатываем аддоны по частям для избежания лимитов Steam API
-            addon_ids = [addon['id'] for addon in self.addons]
-            total = len(addon_ids)
+            total = len(self.addons)
             max_batch_size = 30  # Уменьшаем размер батча для надежности
             
-            print(f"📊 Всего аддонов для обработки: {total}")
+            print(f"📊 Всего аддонов для обработки: {total} (из кэша: {len(all_processed_ids)})")
             print(f"📦 Размер батча: {max_batch_size}")
             
-            all_processed_ids = set()
-            
             # Обрабатываем аддоны по частям
             for batch_start in range(0, len(addon_ids), max_batch_size):
                 batch_end = min(batch_start + max_batch_size, len(addon_ids))
@@ -231,7 +791,7 @@ class SteamInfoWorker(QThread):
                 
                 print(f"🔄 Обработка батча {batch_num}/{total_batches} ({len(batch_ids)} аддонов)")
                 self.progress_updated.emit(
-                    50 + int(batch_start / total * 40), 
+                    50 + int(batch_start / len(addon_ids) * 40), 
                     f"Обработка батча {batch_num}/{total_batches}..."
                 )
                 
@@ -240,14 +800,9 @@ class SteamInfoWorker(QThread):
                 for i, addon_id in enumerate(batch_ids):
                     post_data[f'publishedfileids[{i}]'] = addon_id
                 
-                # Кодируем данные
-                import urllib.parse
-                data = urllib.parse.urlencode(post_data).encode('utf-8')
-                
-                # Делаем запрос для текущего батча
+                # Делаем запрос для текущего батча (через общую сессию)
                 try:
-                    response = urlopen(STEAM_API_URL, data=data, timeout=10)
-                    result = json.loads(response.read().decode('utf-8'))
+                    result = steam_api_request(post_data, timeout=10)
                     
                     if result.get('response', {}).get('publishedfiledetails'):
                         details = result['response']['publishedfiledetails']
@@ -269,22 +824,31 @@ class SteamInfoWorker(QThread):
                                 # Очищаем BBCode из описания
                                 description = self.clean_bbcode(description)
                                 
+                                description = description[:150] + '...' if len(description) > 150 else description
+                                
                                 # Обновляем данные аддона
-                                for addon in self.addons:
-                                    if addon['id'] == addon_id:
-                                        addon['name'] = title
-                                        addon['description'] = description[:150] + '...' if len(description) > 150 else description
-                                        addon['preview_url'] = preview_url
-                                        break
+                                addon = addons_by_id.get(addon_id)
+                                if addon:
+                                    addon['name'] = title
+                                    addon['description'] = description
+                                    addon['preview_url'] = preview_url
+                                
+                                # Запоминаем ответ в кэше
+                                steam_cache[addon_id] = {
+                                    'title': title,
+                                    'description': description,
+                                    'preview_url': preview_url,
+                                    'fetched_at': now
+                                }
+                                cache_changed = True
                             else:
                                 # Аддон недоступен в Steam
                                 print(f"❌ Батч {batch_num}: Аддон {addon_id} недоступен (код: {result_code})")
-                                for addon in self.addons:
-                                    if addon['id'] == addon_id:
-                                        addon['name'] = f"Недоступный аддон {addon_id}"
-                                        addon['description'] = "Аддон удален или приватный"
-                                        addon['preview_url'] = ''
-                                        break
+                                addon = addons_by_id.get(addon_id)
+                                if addon:
+                                    addon['name'] = f"Недоступный аддон {addon_id}"
+                                    addon['description'] = "Аддон удален или приватный"
+                                    addon['preview_url'] = ''
                     else:
                         print(f"⚠️ Батч {batch_num}: Steam API не вернул данные")
                         
@@ -294,9 +858,11 @@ class SteamInfoWorker(QThread):
                     continue
                 
                 # Небольшая пауза между батчами
-                import time
                 time.sleep(0.2)  # Уменьшили паузу
             
+            if cache_changed:
+                save_steam_details_cache(steam_cache)
+            
             # Обрабатываем аддоны, которые не были возвращены Steam API во всех батчах
             print(f"🔍 Проверка необработанных аддонов...")
             print(f"📊 Всего обработано Steam API: {len(all_processed_ids)} из {total}")
@@ -395,74 +961,146 @@ class SteamInfoWorker(QThread):
                         addon['local_preview'] = str(preview_path)
                         break
 
+    def _fetch_infos_parallel(self, addon_ids):
+        """Запрашивает данные аддонов по одному, но параллельно (до 8 запросов сразу): id -> detail или None"""
+        def fetch_one(addon_id):
+            result = steam_api_request({'itemcount': 1, 'publishedfileids[0]': addon_id}, timeout=5)
+            details = result.get('response', {}).get('publishedfiledetails')
+            return details[0] if details else None
+        
+        infos = {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(fetch_one, addon_id): addon_id for addon_id in addon_ids}
+            for future in as_completed(futures):
+                try:
+                    infos[futures[future]] = future.result()
+                except Exception:
+                    continue  # Тихо пропускаем ошибки для ускорения
+        return infos
+    
     def fetch_individual_addon_names(self, processed_ids):
         """Загружает названия для необработанных аддонов индивидуально"""
-        unprocessed_addons = [addon for addon in self.addons if addon['id'] not in processed_ids]
+        unprocessed_addons = [
+            addon for addon in self.addons
+            if addon['id'] not in processed_ids
+            and not (addon.get('name') and 'Loading...' not in addon.get('name', ''))  # Уже есть название
+        ]
         
-        for i, addon in enumerate(unprocessed_addons):
-            if addon.get('name') and 'Loading...' not in addon.get('name', ''):
-                continue  # Уже есть название
-                
+        infos = self._fetch_infos_parallel([addon['id'] for addon in unprocessed_addons])
+        
+        for addon in unprocessed_addons:
             addon_id = addon['id']
+            detail = infos.get(addon_id)
+            if not detail:
+                continue
             
-            try:
-                # Формируем запрос для одного аддона
-                post_data = {
-                    'itemcount': 1,
-                    'publishedfileids[0]': addon_id
-                }
-                
-                import urllib.parse
-                data = urllib.parse.urlencode(post_data).encode('utf-8')
-                response = urlopen(STEAM_API_URL, data=data, timeout=5)
-                result = json.loads(response.read().decode('utf-8'))
+            result_code = detail.get('result', 0)
+            
+            if result_code == 1:  # Success
+                title = detail.get('title', f'Аддон {addon_id}')
+                description = detail.get('description', '')
+                preview_url = detail.get('preview_url', '')
                 
-                if result.get('response', {}).get('publishedfiledetails'):
-                    detail = result['response']['publishedfiledetails'][0]
-                    result_code = detail.get('result', 0)
-                    
-                    if result_code == 1:  # Success
-                        title = detail.get('title', f'Аддон {addon_id}')
-                        description = detail.get('description', '')
-                        preview_url = detail.get('preview_url', '')
-                        
-                        pass  # Убрали сообщение для ускорения
-                        
-                        # Очищаем BBCode из описания
-                        description = self.clean_bbcode(description)
-                        
-                        # Обновляем данные аддона
-                        addon['name'] = title
-                        addon['description'] = description[:150] + '...' if len(description) > 150 else description
-                        addon['preview_url'] = preview_url
-                    else:
-                        pass  # Убрали сообщение для ускорения
-                        if result_code == 9:
-                            addon['name'] = f"Удаленный аддон {addon_id}"
-                            addon['description'] = "Аддон удален из Steam Workshop"
-                        elif result_code == 17:
-                            addon['name'] = f"Приватный аддон {addon_id}"
-                            addon['description'] = "Аддон приватный или ограничен"
-                        else:
-                            addon['name'] = f"Недоступный аддон {addon_id}"
-                            addon['description'] = f"Ошибка Steam API (код: {result_code})"
-                        addon['preview_url'] = ''
+                # Очищаем BBCode из описания
+                description = self.clean_bbcode(description)
                 
-                # Небольшая пауза между запросами
-                if i < len(unprocessed_addons) - 1:
-                    import time
-                    time.sleep(0.1)  # Уменьшили паузу
-                    
-            except Exception as e:
-                continue  # Тихо пропускаем ошибки для ускорения
+                # Обновляем данные аддона
+                addon['name'] = title
+                addon['description'] = description[:150] + '...' if len(description) > 150 else description
+                addon['preview_url'] = preview_url
+            else:
+                if result_code == 9:
+                    addon['name'] = f"Удаленный аддон {addon_id}"
+                    addon['description'] = "Аддон удален из Steam Workshop"
+                elif result_code == 17:
+                    addon['name'] = f"Приватный аддон {addon_id}"
+                    addon['description'] = "Аддон приватный или ограничен"
+                else:
+                    addon['name'] = f"Недоступный аддон {addon_id}"
+                    addon['description'] = f"Ошибка Steam API (код: {result_code})"
+                addon['preview_url'] = ''
 
     def clean_bbcode(self, text):
         """Удаляет BBCode теги из текста"""
-        # Удаляем все BBCode теги
-        text = re.sub(r'\[.*?\]', '', text)
-        # Удаляем множественные пробелы и переносы строк
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Быстрый путь: без '[' тегов нет, regex для BBCode не нужен
+        if '[' not in text:
+            return _WS_RE.sub(' ', text).strip()
+        # Удаляем все BBCode теги, затем лишние пробелы и переносы строк
+        return _WS_RE.sub(' ', _BBCODE_RE.sub('', text)).strip()
+
+
+class BulkEnableWorker(QThread):
+    """Worker thread для массового включения аддонов (копирование .vpk в фоне)"""
+    progress = pyqtSignal(int, str)  # progress, status
+    finished_all = pyqtSignal(list, list)  # ID скопированных аддонов, тексты ошибок
+    
+    def __init__(self, addons, copy_func):
+        super().__init__()
+        self.addons = addons
+        self.copy_func = copy_func
+        self._canceled = False
+    
+    def cancel(self):
+        """Останавливает обработку после текущего аддона"""
+        self._canceled = True
+    
+    def run(self):
+        """Выполняется в отдельном потоке"""
+        enabled_ids = []
+        errors = []
+        total = len(self.addons)
+        for i, addon in enumerate(self.addons):
+            if self._canceled:
+                break
+            
+            # Конвертируем в проценты (0-100)
+            self.progress.emit(int((i / total) * 100), get_text("enabling_addon", name=addon['name'], current=i+1, total=total))
+            
+            if not addon.get('enabled'):
+                try:
+                    self.copy_func(addon)
+                    enabled_ids.append(addon['id'])
+                except Exception as e:
+                    # Ошибки копятся и показываются одним итоговым окном
+                    errors.append(f"{addon['name']}: {e}")
+        
+        self.finished_all.emit(enabled_ids, errors)
+
+
+class BulkDisableWorker(QThread):
+    """Worker thread для массового выключения аддонов (удаление папок в фоне)"""
+    progress = pyqtSignal(int, str)  # progress, status
+    finished_all = pyqtSignal(list, list)  # ID аддонов с удалёнными папками, тексты ошибок
+    
+    def __init__(self, addon_ids, workshop_dir):
+        super().__init__()
+        self.addon_ids = addon_ids
+        self.workshop_dir = workshop_dir
+        self._canceled = False
+    
+    def cancel(self):
+        """Останавливает обработку после текущего аддона"""
+        self._canceled = True
+    
+    def run(self):
+        """Выполняется в отдельном потоке"""
+        removed_ids = []
+        errors = []
+        total = len(self.addon_ids)
+        for i, addon_id in enumerate(self.addon_ids):
+            if self._canceled:
+                break
+            
+            # Конвертируем в проценты (10-100, первые 10% - восстановление gameinfo)
+            self.progress.emit(int(10 + (i / total) * 90), get_text("deleting_folder", addon_id=addon_id, current=i+1, total=total))
+            
+            try:
+                _fast_rm_addon(self.workshop_dir / addon_id)
+                removed_ids.append(addon_id)
+            except Exception as e:
+                errors.append(f"{addon_id}: {e}")
+        
+        self.finished_all.emit(removed_ids, errors)
 
 
 class LoadingDialog(QDialog):
@@ -479,16 +1117,15 @@ class LoadingDialog(QDialog):
         self.existing_blur = False
         if parent:
             existing_effect = parent.graphicsEffect()
-            if existing_effect and isinstance(existing_effect, QGraphicsBlurEffect):
+            if existing_effect and isinstance(existing_effect, QGraphicsBlurEffect) and existing_effect.isEnabled():
                 # Используем существующий blur
                 self.existing_blur = True
                 self.blur_effect = existing_effect
                 self.blur_anim = None
             else:
-                # Создаем новый blur с анимацией
-                self.blur_effect = QGraphicsBlurEffect()
+                # Включаем общий blur с анимацией
+                self.blur_effect = get_shared_blur_effect(parent)
                 self.blur_effect.setBlurRadius(0)
-                parent.setGraphicsEffect(self.blur_effect)
                 
                 # Анимация блюра
                 self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -594,7 +1231,7 @@ class LoadingDialog(QDialog):
                 QApplication.processEvents()
             
             if self.parent_widget and not self.keep_blur_on_close and not self.existing_blur:
-                self.parent_widget.setGraphicsEffect(None)
+                hide_shared_blur_effect(self.parent_widget)
                 print("🔄 Blur effect removed from parent widget in closeEvent")
         except Exception as e:
             print(f"❌ Ошибка при убирании blur эффекта: {e}")
@@ -625,11 +1262,10 @@ class BlurDialog(QDialog):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setModal(True)
         
-        # Размытие фона с анимацией
+        # Размытие фона с анимацией (общий эффект окна, без создания нового)
         if parent:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(parent)
             self.blur_effect.setBlurRadius(0)
-            parent.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -653,24 +1289,23 @@ class BlurDialog(QDialog):
     def closeEvent(self, event):
         """При закрытии убираем blur (если не указано keep_blur_on_close)"""
         if self.parent_widget and not self.keep_blur_on_close:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().closeEvent(event)
     
     def accept(self):
         """При accept убираем blur (если не указано keep_blur_on_close)"""
         if self.parent_widget and not self.keep_blur_on_close:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().accept()
     
     def reject(self):
         """При reject убираем blur (если не указано keep_blur_on_close)"""
         if self.parent_widget and not self.keep_blur_on_close:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().reject()
     
     def open_steam_profile(self):
         """Открывает Steam профиль автора"""
-        import webbrowser
         webbrowser.open("https://steamcommunity.com/id/kinimaro/")
     
 
@@ -793,29 +1428,28 @@ class SetupDialog(QDialog):
         
         # Размытие фона
         if parent:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(parent)
             self.blur_effect.setBlurRadius(30)
             self.blur_effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
-            parent.setGraphicsEffect(self.blur_effect)
         
         self.setup_ui()
     
     def closeEvent(self, event):
         """При закрытии убираем blur"""
         if self.parent_widget:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().closeEvent(event)
     
     def accept(self):
         """При accept убираем blur"""
         if self.parent_widget:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().accept()
     
     def reject(self):
         """При reject убираем blur"""
         if self.parent_widget:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().reject()
     
     def showEvent(self, event):
@@ -1277,11 +1911,11 @@ class AnimatedSortComboBox(QPushButton):
         main_window = self.window()
         if main_window:
             central_widget = main_window.centralWidget()
-            if central_widget and not central_widget.graphicsEffect():
-                self.blur_effect = QGraphicsBlurEffect()
+            existing_effect = central_widget.graphicsEffect() if central_widget else None
+            if central_widget and not (existing_effect and existing_effect.isEnabled()):
+                self.blur_effect = get_shared_blur_effect(central_widget)
                 self.blur_effect.setBlurRadius(0)  # Начинаем с 0
                 self.blur_effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
-                central_widget.setGraphicsEffect(self.blur_effect)
                 
                 # Анимация плавного увеличения blur
                 self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -1304,7 +1938,7 @@ class AnimatedSortComboBox(QPushButton):
                 blur_out_anim.setEndValue(0)
                 blur_out_anim.setEasingCurve(QEasingCurve.Type.InCubic)
                 # Убираем эффект после завершения анимации
-                blur_out_anim.finished.connect(lambda: central_widget.setGraphicsEffect(None))
+                blur_out_anim.finished.connect(lambda: hide_shared_blur_effect(central_widget))
                 blur_out_anim.start()
                 
                 # Сохраняем ссылку чтобы анимация не удалилась
@@ -2412,6 +3046,7 @@ class AnimatedCard(QFrame):
         self.addon = addon_data
         self.index = index
         self.parent_window = parent
+        self.update_search_keys()
         self.setup_ui()
         self.setup_hover_animation()
         self.setup_context_menu()
@@ -2444,9 +3079,11 @@ class AnimatedCard(QFrame):
         # Индикатор статуса (минималистичный)
         indicator = QLabel("●")
         indicator.setObjectName("statusIndicator")
+        self.status_indicator = indicator  # Прямая ссылка, чтобы не искать через findChildren
         # Убираем фон у индикатора
         indicator.setAutoFillBackground(False)
-        indicator.setStyleSheet(f"color: {'#3498db' if self.addon.get('enabled') else '#95a5a6'}; font-size: 16px; background: transparent; border: none;")
+        # Цвет задается правилами #statusIndicator[enabled_state=...] в cards.qss
+        indicator.setProperty("enabled_state", bool(self.addon.get('enabled')))
         
         # Текстовая часть
         text_layout = QVBoxLayout()
@@ -2542,11 +3179,7 @@ class AnimatedCard(QFrame):
         self.toggle_switch.blockSignals(False)
         
         # Обновляем индикатор статуса
-        for child in self.findChildren(QLabel):
-            if child.objectName() == "statusIndicator":
-                color = '#3498db' if self.addon.get('enabled') else '#95a5a6'
-                child.setStyleSheet(f"color: {color}; font-size: 16px; background: transparent; border: none;")
-                break
+        set_status_indicator(self.status_indicator, self.addon.get('enabled'))
     
     def load_icon(self, url):
         """Загружает иконку из URL с кэшированием"""
@@ -2812,8 +3445,17 @@ class AnimatedCard(QFrame):
             # Удаляем из кэша
             self.remove_custom_name_from_cache()
     
+    def update_search_keys(self):
+        """Кэширует название и описание в нижнем регистре для поиска"""
+        self._name_lc = self.addon['name'].lower()
+        self._desc_lc = self.addon.get('description', '').lower()
+    
     def update_addon_display(self):
         """Обновляет отображение названия в карточке"""
+        self.update_search_keys()
+        # Триграммы главного окна построены по старому названию
+        if self.parent_window is not None:
+            self.parent_window._trigrams = None
         # Находим label с названием и обновляем его
         title_labels = self.findChildren(QLabel)
         for label in title_labels:
@@ -2871,14 +3513,12 @@ class AnimatedCard(QFrame):
         if self.parent_window and hasattr(self.parent_window, 'workshop_path'):
             addon_folder = self.parent_window.workshop_path / self.addon['id']
             if addon_folder.exists():
-                import subprocess
                 subprocess.Popen(f'explorer "{addon_folder}"')
             else:
                 QMessageBox.information(self, "Информация", "Папка аддона не найдена")
     
     def open_in_steam(self):
         """Открывает аддон в Steam Workshop"""
-        import webbrowser
         url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={self.addon['id']}"
         webbrowser.open(url)
 
@@ -3039,11 +3679,11 @@ class ToastNotification(QWidget):
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
             
             # Применяем blur к родителю (если еще не применен)
-            if not self.parent_widget.graphicsEffect():
-                self.blur_effect = QGraphicsBlurEffect()
+            existing_effect = self.parent_widget.graphicsEffect()
+            if not existing_effect or not existing_effect.isEnabled():
+                self.blur_effect = get_shared_blur_effect(self.parent_widget)
                 self.blur_effect.setBlurRadius(30)
                 self.blur_effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
-                self.parent_widget.setGraphicsEffect(self.blur_effect)
             else:
                 # Используем существующий blur эффект
                 self.blur_effect = self.parent_widget.graphicsEffect()
@@ -3076,7 +3716,7 @@ class ToastNotification(QWidget):
             self.parent_widget.removeEventFilter(self)
             
             # Убираем blur эффект, разблокируем интерфейс и восстанавливаем курсор
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
             self.parent_widget.setEnabled(True)
             QApplication.restoreOverrideCursor()
         
@@ -3109,7 +3749,7 @@ class ToastNotification(QWidget):
             self.parent_widget.removeEventFilter(self)
             
             # Убираем blur эффект, разблокируем интерфейс и восстанавливаем курсор
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
             self.parent_widget.setEnabled(True)
             QApplication.restoreOverrideCursor()
         
@@ -3137,9 +3777,8 @@ class CustomConfirmDialog(QDialog):
         
         # Применяем блюр к родительскому окну (если не используем существующий)
         if not use_existing_blur:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(self.parent_widget)
             self.blur_effect.setBlurRadius(0)
-            self.parent_widget.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -3262,7 +3901,7 @@ class CustomConfirmDialog(QDialog):
     def finish_close(self):
         # Убираем блюр только если мы его создали
         if not self.use_existing_blur:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         self.accept() if self.result_value else self.reject()
     
     def close_keeping_blur(self):
@@ -3310,9 +3949,8 @@ class CustomDeleteDialog(QDialog):
         
         # Применяем блюр к родительскому окну (если не используем существующий)
         if not use_existing_blur:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(self.parent_widget)
             self.blur_effect.setBlurRadius(0)
-            self.parent_widget.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -3486,7 +4124,7 @@ class CustomDeleteDialog(QDialog):
     def finish_close(self):
         # Убираем блюр только если мы его создали
         if not self.use_existing_blur:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         self.accept() if self.result_value else self.reject()
     
     def showEvent(self, event):
@@ -3535,9 +4173,8 @@ class CustomProgressDialog(QDialog):
         
         # Применяем блюр к родительскому окну (если не используем существующий)
         if not use_existing_blur:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(self.parent_widget)
             self.blur_effect.setBlurRadius(0)
-            self.parent_widget.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -3576,6 +4213,7 @@ class CustomProgressDialog(QDialog):
         
         # Заголовок
         self.title_label = QLabel(title)
+        self._label_text = title
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setWordWrap(True)
         self.title_label.setFixedSize(650, 90)  # Фиксированная высота для 3 строк
@@ -3616,6 +4254,10 @@ class CustomProgressDialog(QDialog):
         self.progress_bar.setValue(value)
         
     def setLabelText(self, text):
+        # Не трогаем QLabel, если текст не изменился (частые вызовы из циклов прогресса)
+        if text == self._label_text:
+            return
+        self._label_text = text
         self.title_label.setText(text)
         
     def wasCanceled(self):
@@ -3644,13 +4286,13 @@ class CustomProgressDialog(QDialog):
     def finish_close(self):
         # Убираем блюр только если мы его создали
         if not self.use_existing_blur:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         self.close()
     
     def closeEvent(self, event):
         """При закрытии убираем blur только если не установлен флаг _keep_blur_on_close"""
         if not self._keep_blur_on_close and not self.use_existing_blur and self.parent_widget:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().closeEvent(event)
         
     def showEvent(self, event):
@@ -3687,21 +4329,19 @@ class CustomInfoDialog(QDialog):
         if use_existing_blur:
             # Проверяем есть ли уже blur эффект
             existing_blur = parent.graphicsEffect()
-            if existing_blur and isinstance(existing_blur, QGraphicsBlurEffect):
+            if existing_blur and isinstance(existing_blur, QGraphicsBlurEffect) and existing_blur.isEnabled():
                 # Используем существующий блюр
                 self.blur_effect = existing_blur
                 self.blur_anim = None
             else:
-                # Если blur нет, создаем новый
-                self.blur_effect = QGraphicsBlurEffect()
+                # Если blur нет (или он спрятан), включаем общий
+                self.blur_effect = get_shared_blur_effect(self.parent_widget)
                 self.blur_effect.setBlurRadius(15)  # Сразу устанавливаем нужное значение
-                self.parent_widget.setGraphicsEffect(self.blur_effect)
                 self.blur_anim = None
         else:
             # Создаем новый blur с анимацией
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(self.parent_widget)
             self.blur_effect.setBlurRadius(0)
-            self.parent_widget.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -3841,7 +4481,6 @@ class CustomInfoDialog(QDialog):
             tooltip.show_at_cursor()
         else:
             # Для обычных ссылок - открываем в браузере
-            import webbrowser
             webbrowser.open(url)
     
     def update_countdown(self):
@@ -3887,7 +4526,7 @@ class CustomInfoDialog(QDialog):
     def finish_close(self):
         # Всегда убираем блюр при закрытии диалога
         if self.parent_widget:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         self.accept()
         
     def showEvent(self, event):
@@ -3932,9 +4571,8 @@ class CustomInputDialog(QDialog):
         
         # Применяем блюр к родительскому окну (если не используем существующий)
         if not use_existing_blur:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(self.parent_widget)
             self.blur_effect.setBlurRadius(0)
-            self.parent_widget.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -4156,7 +4794,7 @@ class CustomInputDialog(QDialog):
             not getattr(self, '_keep_blur', False)
         )
         if should_remove_blur:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().closeEvent(event)
         
     def showEvent(self, event):
@@ -4200,9 +4838,8 @@ class CustomSteamCMDManageDialog(QDialog):
         
         # Применяем блюр к родительскому окну (если не используем существующий)
         if not use_existing_blur:
-            self.blur_effect = QGraphicsBlurEffect()
+            self.blur_effect = get_shared_blur_effect(self.parent_widget)
             self.blur_effect.setBlurRadius(0)
-            self.parent_widget.setGraphicsEffect(self.blur_effect)
             
             # Анимация блюра
             self.blur_anim = QPropertyAnimation(self.blur_effect, b"blurRadius")
@@ -4340,7 +4977,7 @@ class CustomSteamCMDManageDialog(QDialog):
     def closeEvent(self, event):
         """При закрытии убираем blur если мы его создавали"""
         if self.blur_effect is not None and self.parent_widget:
-            self.parent_widget.setGraphicsEffect(None)
+            hide_shared_blur_effect(self.parent_widget)
         super().closeEvent(event)
         
     def showEvent(self, event):
@@ -4353,15 +4990,37 @@ class CustomSteamCMDManageDialog(QDialog):
 class MainWindow(QMainWindow):
     """Главное окно"""
     
+    # Общий пул для запросов к Steam API, которые идут параллельно запуску SteamCMD
+    _addon_info_pool = ThreadPoolExecutor(max_workers=4)
+    
     def __init__(self):
         super().__init__()
         self.game_folder = None
         self.gameinfo_path = None  
         self.workshop_path = None
         self.addons = []
+        self._enabled_count = 0  # Число включенных аддонов (поддерживается инкрементально)
+        self._dirty_gameinfo = True  # Аддоны или gameinfo.txt менялись после последней успешной проверки синхронизации
+        self._addons_by_id = {}  # Индекс self.addons по id
+        self._cards_by_id = {}  # Созданные карточки аддонов по id
+        self._sorted_addons = []  # Аддоны в порядке отображения
+        self._rendered_count = 0  # Сколько из них уже имеют карточки в layout
+        self._card_cache = {}  # Созданные, но сейчас не размещенные карточки (id -> карточка)
+        self._idx_to_card = None  # Карточки в порядке self._sorted_addons (строится при первом поиске)
+        self._trigrams = None  # Триграмма -> множество индексов карточек
+        self._filter_matched = None  # Индексы видимых при поиске карточек (None - видны все)
+        self._pirate_cards = []  # Карточки пиратской вкладки в порядке отображения
         self.cards = []
         self.first_launch = False  # Флаг первого запуска для показа уведомления (определяется позже)
         self.steamcmd_custom_path = None  # Путь к SteamCMD
+        self._steamcmd_exe_cached = None  # Найденный steamcmd.exe (быстрый путь ensure_steamcmd_installed)
+        
+        # Один таймер для показа критической ошибки SteamCMD (вместо singleShot с замыканием на каждую)
+        self._pending_fatal = None
+        self._fatal_dialog_timer = QTimer(self)
+        self._fatal_dialog_timer.setSingleShot(True)
+        self._fatal_dialog_timer.setInterval(0)
+        self._fatal_dialog_timer.timeout.connect(self._show_pending_fatal)
         self.last_donate_reminder = 0  # Время последнего напоминания о донатов
         self.current_language = "ru"  # Текущий язык интерфейса
         self.animations_disabled = False  # Флаг для временного отключения анимаций
@@ -4436,6 +5095,8 @@ class MainWindow(QMainWindow):
         # Header
         header = QFrame()
         header.setObjectName("header")
+        # Стили шапки действуют только внутри неё (меньше селекторов при полировке остальных виджетов)
+        header.setStyleSheet(load_stylesheet("header.qss"))
         header.setFixedHeight(80)
         h_layout = QHBoxLayout(header)
         h_layout.setContentsMargins(20, 0, 20, 0)  # Уменьшили отступы для экономии места
@@ -4705,7 +5366,12 @@ class MainWindow(QMainWindow):
         self.search.setPlaceholderText(get_text("search_placeholder"))
         self.search.setObjectName("searchBox")
         self.search.setGeometry(0, 0, 380, 45)  # Уменьшили на 20px
-        self.search.textChanged.connect(self.filter_addons)
+        # Фильтр запускается один раз после паузы в наборе, а не на каждую букву
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(80)
+        self._search_timer.timeout.connect(lambda: self.filter_addons(self.search.text()))
+        self.search.textChanged.connect(lambda _: self._search_timer.start())
         
         clear_btn = QPushButton(search_container)
         clear_btn.setFixedSize(32, 32)
@@ -4830,8 +5496,12 @@ class MainWindow(QMainWindow):
         scroll.setWidgetResizable(True)
         scroll.setObjectName("addonScroll")
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        # Карточки досоздаются порциями при приближении к концу списка
+        scroll.verticalScrollBar().valueChanged.connect(self.on_addons_scrolled)
+        self.addons_scroll = scroll
         
         self.addons_container = QWidget()
+        self.addons_container.setStyleSheet(load_stylesheet("cards.qss"))
         self.addons_layout = QVBoxLayout(self.addons_container)
         self.addons_layout.setSpacing(10)
         self.addons_layout.addStretch()
@@ -4915,7 +5585,11 @@ class MainWindow(QMainWindow):
         self.pirate_search.setPlaceholderText(get_text("search_placeholder"))
         self.pirate_search.setObjectName("searchBox")
         self.pirate_search.setGeometry(0, 0, 330, 45)
-        self.pirate_search.textChanged.connect(self.filter_pirate_addons)
+        self._pirate_search_timer = QTimer(self)
+        self._pirate_search_timer.setSingleShot(True)
+        self._pirate_search_timer.setInterval(80)
+        self._pirate_search_timer.timeout.connect(lambda: self.filter_pirate_addons(self.pirate_search.text()))
+        self.pirate_search.textChanged.connect(lambda _: self._pirate_search_timer.start())
         
         clear_pirate_btn = QPushButton(pirate_search_container)
         clear_pirate_btn.setFixedSize(32, 32)
@@ -5047,6 +5721,7 @@ class MainWindow(QMainWindow):
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
         self.pirate_addons_container = QWidget()
+        self.pirate_addons_container.setStyleSheet(load_stylesheet("cards.qss"))
         self.pirate_addons_layout = QVBoxLayout(self.pirate_addons_container)
         self.pirate_addons_layout.setSpacing(10)
         self.pirate_addons_layout.addStretch()
@@ -5088,20 +5763,29 @@ class MainWindow(QMainWindow):
             item = self.pirate_addons_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._pirate_cards = []
         
-        # Ищем .vpk и .vpk.disabled файлы
-        all_files = list(addons_path.glob("*.vpk*"))
-        
-        # Создаем список модов с информацией о статусе
+        # Ищем .vpk и .vpk.disabled файлы (один проход os.scandir, расширение - по имени DirEntry)
         self.pirate_addons_data = []
-        for file_path in all_files:
-            if file_path.suffix == '.vpk':
-                # Включенный мод
-                self.pirate_addons_data.append({'path': file_path, 'enabled': True, 'name': file_path.stem})
-            elif file_path.name.endswith('.vpk.disabled'):
-                # Выключенный мод
-                name = file_path.name.replace('.vpk.disabled', '')
-                self.pirate_addons_data.append({'path': file_path, 'enabled': False, 'name': name})
+        with os.scandir(addons_path) as entries:
+            for entry in entries:
+                name_lower = entry.name.lower()
+                if name_lower.endswith('.vpk'):
+                    enabled = True
+                    name = entry.name[:-4]
+                elif name_lower.endswith('.vpk.disabled'):
+                    enabled = False
+                    name = entry.name[:-13]
+                else:
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    # Размер берем из DirEntry (на Windows он приходит вместе с листингом папки)
+                    self.pirate_addons_data.append({
+                        'path': Path(entry.path),
+                        'enabled': enabled,
+                        'name': name,
+                        'size_bytes': entry.stat(follow_symlinks=False).st_size
+                    })
         
         if not self.pirate_addons_data:
             # Показываем красивое сообщение с кнопками
@@ -5143,6 +5827,7 @@ class MainWindow(QMainWindow):
                         widget.deleteLater()
         
         # Добавляем карточки в новом порядке (создаем только новые)
+        self._pirate_cards = []
         for i, addon_data in enumerate(sorted_addons):
             path_key = str(addon_data['path'])
             if path_key in existing_cards:
@@ -5151,6 +5836,7 @@ class MainWindow(QMainWindow):
             else:
                 # Создаем новую карточку с текущим режимом
                 card = self.create_pirate_addon_card(addon_data, i)
+            self._pirate_cards.append(card)
             
             # Добавляем в layout в зависимости от режима
             if self.is_pirate_two_column_mode:
@@ -5193,15 +5879,10 @@ class MainWindow(QMainWindow):
                     addon_data['path'] = new_path
             
             # Находим карточку и обновляем только индикатор
-            for i in range(self.pirate_addons_layout.count()):
-                widget = self.pirate_addons_layout.itemAt(i).widget()
-                if isinstance(widget, PirateAddonCard) and widget.addon_data == addon_data:
+            for widget in self._pirate_cards:
+                if widget.addon_data == addon_data:
                     # Обновляем индикатор статуса
-                    for child in widget.findChildren(QLabel):
-                        if child.objectName() == "statusIndicator":
-                            color = '#3498db' if addon_data['enabled'] else '#95a5a6'
-                            child.setStyleSheet(f"color: {color}; font-size: 16px; background: transparent; border: none;")
-                            break
+                    set_status_indicator(widget.status_indicator, addon_data['enabled'])
                     break
             
             # Обновляем счетчик
@@ -5260,7 +5941,6 @@ class MainWindow(QMainWindow):
                     )
         except Exception as e:
             # Ловим любые неожиданные ошибки
-            import traceback
             error_details = traceback.format_exc()
             print(f"[ERROR] Unexpected error in delete_pirate_addon: {error_details}")
             CustomInfoDialog.information(
@@ -5279,7 +5959,6 @@ class MainWindow(QMainWindow):
         addons_path = self.game_folder / "left4dead2" / "addons"
         addons_path.mkdir(parents=True, exist_ok=True)
         
-        import subprocess
         subprocess.Popen(f'explorer "{addons_path}"')
     
     def create_pirate_addon_card(self, addon_data, index):
@@ -5379,6 +6058,7 @@ class MainWindow(QMainWindow):
         
         layout.addStretch()
         
+        tab.setStyleSheet(load_stylesheet("settings.qss"))
         self.stack.addWidget(tab)
     
     def create_settings_card(self, title, subtitle):
@@ -5427,7 +6107,6 @@ class MainWindow(QMainWindow):
             tooltip.show_at_cursor()
         else:
             # Для обычных ссылок - открываем в браузере
-            import webbrowser
             webbrowser.open(url)
     
     def show_donate_dialog(self):
@@ -5441,7 +6120,6 @@ class MainWindow(QMainWindow):
     
     def open_telegram(self):
         """Открывает Telegram профиль автора"""
-        import webbrowser
         webbrowser.open("https://t.me/angel_its_me")
         # Если нажал "Позже" - ничего не делаем
     
@@ -5675,6 +6353,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(languages_container)
         layout.addStretch()
         
+        tab.setStyleSheet(load_stylesheet("language.qss"))
         self.stack.addWidget(tab)
     
     def create_language_card(self, flag, primary_name, secondary_name, language_code):
@@ -5919,9 +6598,8 @@ class MainWindow(QMainWindow):
             btn.setChecked(i == index)
         
         # Создаем blur эффект для анимации
-        blur_effect = QGraphicsBlurEffect()
+        blur_effect = get_shared_blur_effect(self.stack)
         blur_effect.setBlurRadius(0)
-        self.stack.setGraphicsEffect(blur_effect)
         
         # Создаем opacity эффект для fade
         opacity_effect = QGraphicsOpacityEffect()
@@ -5985,7 +6663,7 @@ class MainWindow(QMainWindow):
     def cleanup_tab_effects(self):
         """Очищает графические эффекты после переключения вкладки"""
         # Убираем blur эффект
-        self.stack.setGraphicsEffect(None)
+        hide_shared_blur_effect(self.stack)
         
         # Убираем графические эффекты с текущей вкладки и всех её дочерних элементов
         current_widget = self.stack.currentWidget()
@@ -6000,19 +6678,13 @@ class MainWindow(QMainWindow):
                         container.setGraphicsEffect(None)
                 
                 # Убираем эффекты с карточек (только если они есть)
-                try:
-                    for card in current_widget.findChildren(AnimatedCard):
-                        if card.graphicsEffect():
-                            card.setGraphicsEffect(None)
-                except:
-                    pass
+                for card in current_widget.findChildren(AnimatedCard):
+                    if card.graphicsEffect() is not None:
+                        card.setGraphicsEffect(None)
                 
-                try:
-                    for card in current_widget.findChildren(PirateAddonCard):
-                        if card.graphicsEffect():
-                            card.setGraphicsEffect(None)
-                except:
-                    pass
+                for card in current_widget.findChildren(PirateAddonCard):
+                    if card.graphicsEffect() is not None:
+                        card.setGraphicsEffect(None)
                 
                 # Принудительно устанавливаем полную прозрачность для всех SettingsCard
                 for card in current_widget.findChildren(SettingsCard):
@@ -6065,7 +6737,7 @@ class MainWindow(QMainWindow):
             # Напоминание о донатах теперь показывается после загрузки аддонов
         else:
             # Если пользователь отменил, убираем blur
-            self.setGraphicsEffect(None)
+            hide_shared_blur_effect(self)
     
     def recreate_ui_with_language(self):
         """Пересоздаёт весь UI с новым языком"""
@@ -6089,7 +6761,6 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             print(f"❌ Error recreating UI: {e}")
-            import traceback
             traceback.print_exc()
     
     def update_ui_language(self):
@@ -6166,8 +6837,7 @@ class MainWindow(QMainWindow):
             
             # Обновляем счетчики аддонов
             if hasattr(self, 'addons') and self.addons:
-                enabled_count = sum(1 for a in self.addons if a.get('enabled'))
-                counter_text = get_text("addons_counter", total=len(self.addons), enabled=enabled_count)
+                counter_text = get_text("addons_counter", total=len(self.addons), enabled=self._enabled_count)
                 print(f"🌍 Setting main counter to: '{counter_text}'")
                 self.set_counter_text(self.counter, counter_text)
             
@@ -6194,7 +6864,6 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             print(f"❌ Error updating UI language: {e}")
-            import traceback
             traceback.print_exc()
     
     def update_ui_language_delayed(self):
@@ -6318,7 +6987,6 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             print(f"❌ Error updating tabs content: {e}")
-            import traceback
             traceback.print_exc()
     
 
@@ -6441,12 +7109,10 @@ class MainWindow(QMainWindow):
             QApplication.instance().quit()
             
             # Если это не помогло, используем sys.exit
-            import sys
             sys.exit(0)
             
         except Exception as e:
             print(f"❌ Error force quitting: {e}")
-            import sys
             sys.exit(1)
     
     def update_language_indicators(self):
@@ -6476,7 +7142,6 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(300, self.show_animation_warning)
             return
         
-        import time
         current_time = time.time()
         # 1 час = 3600 секунд
         time_since_last_warning = current_time - getattr(self, 'last_animation_warning', 0)
@@ -6511,13 +7176,10 @@ class MainWindow(QMainWindow):
         if not self.game_folder:
             return False
         
-        # Проверяем что папка существует
-        if not self.game_folder.exists():
-            return False
-        
-        # Проверяем что это действительно папка L4D2 (есть gameinfo.txt)
-        gameinfo = self.game_folder / "left4dead2" / "gameinfo.txt"
-        if not gameinfo.exists():
+        # Один stat gameinfo.txt: если его нет - это не папка L4D2 (или папки нет вовсе)
+        try:
+            (self.game_folder / "left4dead2" / "gameinfo.txt").stat()
+        except OSError:
             return False
         
         return True
@@ -6547,6 +7209,9 @@ class MainWindow(QMainWindow):
             if addon['enabled'] and addon['id'] not in addons_in_gameinfo:
                 missing_in_gameinfo.append(addon['id'])
         
+        # Все совпадает - при закрытии повторно читать gameinfo.txt не нужно
+        self._dirty_gameinfo = bool(missing_in_gameinfo)
+        
         # Показываем уведомление если есть проблемы
         if missing_in_gameinfo:
             msg = QMessageBox(self)
@@ -6607,7 +7272,7 @@ class MainWindow(QMainWindow):
     def show_no_addons_message(self):
         """Показывает сообщение когда нет аддонов"""
         # Убираем блюр если есть
-        self.setGraphicsEffect(None)
+        hide_shared_blur_effect(self)
         
         # Полностью очищаем контейнер аддонов (включая stretch)
         while self.addons_layout.count() > 0:
@@ -6617,6 +7282,7 @@ class MainWindow(QMainWindow):
             elif item.spacerItem():
                 # Удаляем spacer
                 pass
+        self._clear_card_cache()
         
         # Создаем виджет с сообщением
         no_addons_widget = QWidget()
@@ -6634,12 +7300,9 @@ class MainWindow(QMainWindow):
                 # Масштабируем до 100x100
                 scaled_pixmap = pixmap.scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                 
-                # Перекрашиваем в синий цвет #3498db
-                blue_pixmap = QPixmap(scaled_pixmap.size())
-                blue_pixmap.fill(Qt.GlobalColor.transparent)
+                # Перекрашиваем в синий цвет #3498db (один QPainter прямо по копии)
+                blue_pixmap = scaled_pixmap.copy()
                 painter = QPainter(blue_pixmap)
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-                painter.drawPixmap(0, 0, scaled_pixmap)
                 painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
                 painter.fillRect(blue_pixmap.rect(), QColor(52, 152, 219))  # #3498db
                 painter.end()
@@ -6695,7 +7358,7 @@ class MainWindow(QMainWindow):
     def show_no_pirate_addons_message(self):
         """Показывает сообщение когда нет пиратских аддонов"""
         # Убираем блюр если есть
-        self.setGraphicsEffect(None)
+        hide_shared_blur_effect(self)
         
         # Полностью очищаем контейнер аддонов (включая stretch)
         while self.pirate_addons_layout.count() > 0:
@@ -6705,6 +7368,7 @@ class MainWindow(QMainWindow):
             elif item.spacerItem():
                 # Удаляем spacer
                 pass
+        self._pirate_cards = []
         
         # Создаем виджет с сообщением
         no_addons_widget = QWidget()
@@ -6726,19 +7390,12 @@ class MainWindow(QMainWindow):
                 padded_size = 110
                 padding = (padded_size - scaled_pixmap.width()) // 2
                 
-                padded_pixmap = QPixmap(padded_size, padded_size)
-                padded_pixmap.fill(Qt.GlobalColor.transparent)
-                
-                painter = QPainter(padded_pixmap)
-                painter.drawPixmap(padding, padding, scaled_pixmap)
-                painter.end()
-                
-                # Перекрашиваем в синий цвет #3498db
-                blue_pixmap = QPixmap(padded_pixmap.size())
+                blue_pixmap = QPixmap(padded_size, padded_size)
                 blue_pixmap.fill(Qt.GlobalColor.transparent)
+                
+                # Рисуем иконку с padding и сразу перекрашиваем в синий #3498db одним QPainter
                 painter = QPainter(blue_pixmap)
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-                painter.drawPixmap(0, 0, padded_pixmap)
+                painter.drawPixmap(padding, padding, scaled_pixmap)
                 painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
                 painter.fillRect(blue_pixmap.rect(), QColor(52, 152, 219))  # #3498db
                 painter.end()
@@ -6862,8 +7519,10 @@ class MainWindow(QMainWindow):
             item = self.addons_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._clear_card_cache()
         
         self.addons = []
+        self.index_addons()
         self.set_counter_text(self.counter, get_text("scanning_status"))
         
         # Отключаем анимации на время загрузки
@@ -6897,6 +7556,7 @@ class MainWindow(QMainWindow):
             return
         
         self.addons = addons
+        self.index_addons()
         
         # Отображаем карточки
         self.display_addons()
@@ -6909,6 +7569,12 @@ class MainWindow(QMainWindow):
         self.steam_worker.info_loaded.connect(self.on_steam_info_loaded)
         self.steam_worker.start()
     
+    def index_addons(self):
+        """Перестраивает индекс аддонов по id и счетчик включенных после замены self.addons"""
+        self._addons_by_id = {a['id']: a for a in self.addons}
+        self._enabled_count = sum(1 for a in self.addons if a.get('enabled'))
+        self._dirty_gameinfo = True
+    
     def on_scan_error(self, error_msg):
         """Вызывается при ошибке сканирования"""
         print(f"❌ Scan error: {error_msg}")
@@ -6923,6 +7589,7 @@ class MainWindow(QMainWindow):
         """Вызывается когда информация из Steam загружена"""
         print(f"🔄 Steam info loaded for {len(updated_addons)} addons")
         self.addons = updated_addons
+        self.index_addons()
         
         # Загружаем кэш пользовательских названий
         self.load_custom_names_cache()
@@ -6950,7 +7617,7 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'loading_dialog') and self.loading_dialog:
                 # Принудительно убираем blur эффект ПЕРЕД закрытием
                 if hasattr(self.loading_dialog, 'parent_widget') and self.loading_dialog.parent_widget:
-                    self.loading_dialog.parent_widget.setGraphicsEffect(None)
+                    hide_shared_blur_effect(self.loading_dialog.parent_widget)
                 
                 # Закрываем диалог
                 self.loading_dialog.close()
@@ -6960,7 +7627,7 @@ class MainWindow(QMainWindow):
                 print("✅ Loading dialog closed successfully")
                 
                 # Принудительно убираем любые оставшиеся blur эффекты
-                self.setGraphicsEffect(None)
+                hide_shared_blur_effect(self)
                 
         except Exception as e:
             print(f"❌ Ошибка закрытия диалога загрузки: {e}")
@@ -6977,8 +7644,7 @@ class MainWindow(QMainWindow):
         
         # Обновляем счетчик аддонов
         if hasattr(self, 'addons') and self.addons:
-            enabled_count = sum(1 for a in self.addons if a.get('enabled'))
-            self.set_counter_text(self.counter, get_text("addons_counter", total=len(self.addons), enabled=enabled_count))
+            self.update_addons_counter()
         
         # Проверяем синхронизацию с gameinfo.txt
         self.check_gameinfo_sync()
@@ -7045,12 +7711,8 @@ class MainWindow(QMainWindow):
             return enabled
         
         try:
-            # Аддон включен если есть И vpk файл И папка с одним ID
-            vpk_files = {f.stem for f in self.workshop_path.glob("*.vpk") if f.stem.isdigit()}
-            addon_folders = {f.name for f in self.workshop_path.iterdir() if f.is_dir() and f.name.isdigit()}
-            
-            # Пересечение - аддоны у которых есть и файл и папка
-            enabled = vpk_files & addon_folders
+            # Аддон включен если есть И vpk файл И папка с одним ID (пересечение)
+            enabled = scan_workshop_enabled(self.workshop_path)
             
         except Exception as e:
             print(f"Ошибка проверки папок: {e}")
@@ -7088,8 +7750,9 @@ class MainWindow(QMainWindow):
         else:  # Сначала выключенные (sort_type == 2)
             sorted_addons = sorted(self.addons, key=lambda a: (a.get('enabled', False), a.get('name', '').lower()))
         
-        # Собираем существующие карточки в словарь
-        existing_cards = {}
+        # Собираем существующие карточки в словарь (включая ещё не размещенные)
+        existing_cards = self._card_cache
+        self._card_cache = {}
         # Извлекаем все элементы из layout
         while self.addons_layout.count():
             item = self.addons_layout.takeAt(0)
@@ -7100,37 +7763,89 @@ class MainWindow(QMainWindow):
         
         # Удаляем карточки которые больше не нужны
         addon_ids = {addon['id'] for addon in sorted_addons}
-        for card_id, card in list(existing_cards.items()):
-            if card_id not in addon_ids:
-                card.deleteLater()
-                del existing_cards[card_id]
+        for stale_id in existing_cards.keys() - addon_ids:
+            existing_cards.pop(stale_id).deleteLater()
+            self._cards_by_id.pop(stale_id, None)
         
-        # Добавляем карточки в новом порядке (создаем только новые)
-        for i, addon in enumerate(sorted_addons):
-            if addon['id'] in existing_cards:
+        # Растяжка всегда последняя, карточки вставляются перед ней
+        self.addons_layout.addStretch()
+        
+        # Уже созданные карточки переиспользуем, новые создаем только для видимой части списка
+        for card in existing_cards.values():
+            card.hide()
+        self._card_cache = existing_cards
+        self._sorted_addons = sorted_addons
+        self._rendered_count = 0
+        self._reset_search_index()
+        # Размещаем только первую порцию, остальные карточки ждут в кэше прокрутки или поиска
+        self._append_card_batch()
+        
+        # Если активен поиск - заново применяем фильтр (он же обновит счетчик)
+        if hasattr(self, 'search') and self.search.text():
+            self.filter_addons(self.search.text())
+        else:
+            self.update_addons_counter()
+        
+        # Принудительно сбрасываем hover состояния всех карточек после создания
+        QTimer.singleShot(100, self.force_reset_card_states)
+    
+    def _append_card_batch(self, count=CARD_BATCH_SIZE):
+        """Размещает следующую порцию карточек (из кэша или создает новые)"""
+        end = min(len(self._sorted_addons), self._rendered_count + count)
+        for i in range(self._rendered_count, end):
+            addon = self._sorted_addons[i]
+            card = self._card_cache.pop(addon['id'], None)
+            if card is not None:
                 # Используем существующую карточку
-                card = existing_cards[addon['id']]
                 card.addon = addon  # Обновляем данные аддона
+                card.update_search_keys()
                 card.index = i
                 # Обновляем состояние toggle switch из данных аддона
                 card.update_state()
+                card.show()
             else:
                 # Создаем новую карточку
                 card = AnimatedCard(addon, i, self)
                 card.toggled.connect(self.toggle_addon)
+                self._cards_by_id[addon['id']] = card
             
-            # Добавляем в layout (всегда 1 столбец)
-            self.addons_layout.insertWidget(i, card)
-            
-            # Обрабатываем события каждые 20 карточек для плавности
-            if i % 20 == 0:
-                QApplication.processEvents()
-        
-        enabled_count = sum(1 for a in self.addons if a.get('enabled'))
-        self.set_counter_text(self.counter, get_text("addons_counter", total=len(self.addons), enabled=enabled_count))
-        
-        # Принудительно сбрасываем hover состояния всех карточек после создания
-        QTimer.singleShot(100, self.force_reset_card_states)
+            # Вставляем перед растяжкой (порядок уже отсортирован, всегда 1 столбец)
+            self.addons_layout.insertWidget(self.addons_layout.count() - 1, card)
+            self._rendered_count = i + 1
+    
+    def on_addons_scrolled(self, value):
+        """Досоздает карточки, когда прокрутка приближается к концу списка"""
+        if self._rendered_count >= len(self._sorted_addons):
+            return
+        if value >= self.addons_scroll.verticalScrollBar().maximum() - 300:
+            self._append_card_batch()
+    
+    def _clear_card_cache(self):
+        """Удаляет неразмещенные карточки и сбрасывает индекс (когда карточки удаляются из layout)"""
+        for card in self._card_cache.values():
+            card.deleteLater()
+        self._card_cache = {}
+        self._cards_by_id = {}
+        self._sorted_addons = []
+        self._rendered_count = 0
+        self._reset_search_index()
+    
+    def _reset_search_index(self):
+        """Сбрасывает поисковый индекс (после перестроения списка карточек все они снова видимы)"""
+        self._idx_to_card = None
+        self._trigrams = None
+        self._filter_matched = None
+    
+    def _build_search_index(self):
+        """Строит триграммный индекс по названиям и описаниям всех карточек"""
+        if self._idx_to_card is None:
+            self._idx_to_card = [self._cards_by_id[addon['id']] for addon in self._sorted_addons]
+        trigrams = collections.defaultdict(set)
+        for i, card in enumerate(self._idx_to_card):
+            for text in (card._name_lc, card._desc_lc):
+                for j in range(len(text) - 2):
+                    trigrams[text[j:j + 3]].add(i)
+        self._trigrams = trigrams
     
     def force_reset_card_states(self):
         """Принудительно сбрасывает hover состояния всех карточек аддонов"""
@@ -7179,13 +7894,8 @@ class MainWindow(QMainWindow):
             for i, addon_id in enumerate(addon_ids):
                 post_data[f'publishedfileids[{i}]'] = addon_id
             
-            # Кодируем данные
-            import urllib.parse
-            data = urllib.parse.urlencode(post_data).encode('utf-8')
-            
-            # Делаем запрос
-            response = urlopen(STEAM_API_URL, data=data, timeout=5)
-            result = json.loads(response.read().decode('utf-8'))
+            # Делаем запрос (через общую сессию)
+            result = steam_api_request(post_data, timeout=5)
             
             if result.get('response', {}).get('publishedfiledetails'):
                 details = result['response']['publishedfiledetails']
@@ -7203,19 +7913,17 @@ class MainWindow(QMainWindow):
                         description = self.clean_bbcode(description)
                         
                         # Обновляем данные аддона
-                        for addon in self.addons:
-                            if addon['id'] == addon_id:
-                                addon['name'] = title
-                                addon['description'] = description[:150] + '...' if len(description) > 150 else description
-                                addon['preview_url'] = preview_url
-                                break
+                        addon = self._addons_by_id.get(addon_id)
+                        if addon:
+                            addon['name'] = title
+                            addon['description'] = description[:150] + '...' if len(description) > 150 else description
+                            addon['preview_url'] = preview_url
                     else:
                         # Аддон недоступен (удален, приватный и т.д.)
-                        for addon in self.addons:
-                            if addon['id'] == addon_id:
-                                addon['name'] = f'Аддон {addon_id} (недоступен)'
-                                addon['description'] = get_text("addon_removed_description")
-                                break
+                        addon = self._addons_by_id.get(addon_id)
+                        if addon:
+                            addon['name'] = f'Аддон {addon_id} (недоступен)'
+                            addon['description'] = get_text("addon_removed_description")
                     
                     # Обновляем прогресс
                     progress = 50 + int((idx + 1) / total * 40)
@@ -7254,13 +7962,8 @@ class MainWindow(QMainWindow):
             for i, addon_id in enumerate(addon_ids):
                 post_data[f'publishedfileids[{i}]'] = addon_id
             
-            # Кодируем данные
-            import urllib.parse
-            data = urllib.parse.urlencode(post_data).encode('utf-8')
-            
-            # Делаем запрос
-            response = urlopen(STEAM_API_URL, data=data, timeout=5)
-            result = json.loads(response.read().decode('utf-8'))
+            # Делаем запрос (через общую сессию)
+            result = steam_api_request(post_data, timeout=5)
             
             if result.get('response', {}).get('publishedfiledetails'):
                 details = result['response']['publishedfiledetails']
@@ -7291,24 +7994,20 @@ class MainWindow(QMainWindow):
     
     def clean_bbcode(self, text):
         """Удаляет BBCode теги из текста"""
-        # Удаляем все BBCode теги
-        text = re.sub(r'\[.*?\]', '', text)
-        # Удаляем лишние пробелы
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Быстрый путь: без '[' тегов нет, regex для BBCode не нужен
+        if '[' not in text:
+            return _WS_RE.sub(' ', text).strip()
+        # Удаляем все BBCode теги, затем лишние пробелы и переносы строк
+        return _WS_RE.sub(' ', _BBCODE_RE.sub('', text)).strip()
     
     def refresh_cards(self):
         """Обновляет карточки с новой информацией"""
-        # Удаляем старые карточки
-        count = 0
+        # Удаляем старые карточки (deleteLater и так отложен до возврата в цикл событий)
         while self.addons_layout.count() > 1:
             item = self.addons_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-            count += 1
-            # Обрабатываем события каждые 10 карточек
-            if count % 10 == 0:
-                QApplication.processEvents()
+        self._clear_card_cache()
         
         # Создаем новые с обновленной информацией
         self.display_addons()
@@ -7322,40 +8021,30 @@ class MainWindow(QMainWindow):
         QApplication.processEvents()
         
         try:
-            # Находим аддон в списке и карточку
+            # Находим аддон и карточку по индексу
+            addon = self._addons_by_id.get(addon_id)
             addon_card = None
-            for addon in self.addons:
-                if addon['id'] == addon_id:
-                    # Используем текущее состояние из addon_data (уже обновлено в on_toggle_changed)
-                    new_status = addon_data.get('enabled', False)
-                    addon['enabled'] = new_status
-                    
-                    # Выполняем операцию
-                    if new_status:
-                        self.enable_addon(addon)
-                    else:
-                        self.disable_addon(addon)
-                    
-                    # Находим карточку в интерфейсе
-                    for i in range(self.addons_layout.count()):
-                        widget = self.addons_layout.itemAt(i).widget()
-                        if isinstance(widget, AnimatedCard) and widget.addon['id'] == addon_id:
-                            addon_card = widget
-                            break
-                    
-                    break
+            if addon is not None:
+                # Используем текущее состояние из addon_data (уже обновлено в on_toggle_changed)
+                new_status = addon_data.get('enabled', False)
+                addon['enabled'] = new_status
+                self._enabled_count += 1 if new_status else -1
+                
+                # Выполняем операцию
+                if new_status:
+                    self.enable_addon(addon)
+                else:
+                    self.disable_addon(addon)
+                
+                # Находим карточку в интерфейсе
+                addon_card = self._cards_by_id.get(addon_id)
             
             # Обновляем только индикатор (тумблер уже в правильном состоянии)
             if addon_card:
-                for child in addon_card.findChildren(QLabel):
-                    if child.objectName() == "statusIndicator":
-                        color = '#3498db' if addon['enabled'] else '#95a5a6'
-                        child.setStyleSheet(f"color: {color}; font-size: 16px; background: transparent; border: none;")
-                        break
+                set_status_indicator(addon_card.status_indicator, addon['enabled'])
             
             # Обновляем счетчик
-            enabled_count = sum(1 for a in self.addons if a.get('enabled'))
-            self.set_counter_text(self.counter, get_text("addons_counter", total=len(self.addons), enabled=enabled_count))
+            self.update_addons_counter()
             
             # Проверяем синхронизацию с gameinfo.txt
             self.check_gameinfo_sync()
@@ -7364,6 +8053,10 @@ class MainWindow(QMainWindow):
             # Восстанавливаем курсор
             QApplication.restoreOverrideCursor()
     
+    def update_addons_counter(self):
+        """Обновляет счетчик аддонов без пересчета списка (по _enabled_count)"""
+        self.set_counter_text(self.counter, get_text("addons_counter", total=len(self.addons), enabled=self._enabled_count))
+    
     def update_card_status(self, card, is_enabled):
         """Обновляет визуальный статус карточки без перерисовки"""
         # Обновляем переключатель (блокируем сигналы чтобы не вызвать повторное переключение)
@@ -7372,11 +8065,7 @@ class MainWindow(QMainWindow):
         card.toggle_switch.blockSignals(False)
         
         # Обновляем индикатор статуса
-        for child in card.findChildren(QLabel):
-            if child.objectName() == "statusIndicator":
-                color = '#3498db' if is_enabled else '#95a5a6'
-                child.setStyleSheet(f"color: {color}; font-size: 16px; background: transparent; border: none;")
-                break
+        set_status_indicator(card.status_indicator, is_enabled)
     
     def enable_addon(self, addon):
         """Включает аддон (правильная логика из оригинала)"""
@@ -7385,30 +8074,42 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            # Определяем папку addons/workshop
-            gameinfo_dir = Path(self.gameinfo_path).parent
-            workshop_dir = gameinfo_dir / "addons" / "workshop"
-            workshop_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Создаём папку для мода: addons/workshop/ID/
-            mod_id = addon['id']
-            mod_dir = workshop_dir / mod_id
-            mod_dir.mkdir(exist_ok=True)
-            
-            # Копируем .vpk файл и называем pak01_dir.vpk
-            vpk_source = Path(addon['path'])
-            vpk_dest = mod_dir / "pak01_dir.vpk"
-            
-            # Копируем только если файла нет или размер отличается
-            if not vpk_dest.exists() or vpk_dest.stat().st_size != vpk_source.stat().st_size:
-                shutil.copy2(vpk_source, vpk_dest)
+            self.copy_addon_files(addon)
             
             # Добавляем в gameinfo.txt (путь к папке, а не к файлу!)
-            self.add_to_gameinfo(mod_id)
+            self.add_to_gameinfo(addon['id'])
             
         except Exception as e:
             QMessageBox.critical(self, get_text("error_title"), get_text("addon_enable_error", error=str(e)))
     
+    def copy_addon_files(self, addon):
+        """Копирует .vpk аддона в addons/workshop/ID/pak01_dir.vpk (без изменения gameinfo.txt)"""
+        # Определяем папку addons/workshop
+        gameinfo_dir = Path(self.gameinfo_path).parent
+        workshop_dir = gameinfo_dir / "addons" / "workshop"
+        workshop_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Создаём папку для мода: addons/workshop/ID/
+        mod_dir = workshop_dir / addon['id']
+        mod_dir.mkdir(exist_ok=True)
+        
+        # Копируем .vpk файл и называем pak01_dir.vpk
+        vpk_source = Path(addon['path'])
+        vpk_dest = mod_dir / "pak01_dir.vpk"
+        
+        # Размер источника известен со сканирования, для копии нужен один stat
+        source_size = addon.get('size')
+        if source_size is None:
+            source_size = vpk_source.stat().st_size
+        try:
+            dest_size = vpk_dest.stat().st_size
+        except FileNotFoundError:
+            dest_size = None
+        
+        # Копируем только если файла нет или размер отличается (copyfile: без copystat)
+        if dest_size != source_size:
+            shutil.copyfile(vpk_source, vpk_dest)
+    
     def disable_addon(self, addon):
         """Выключает аддон (правильная логика из оригинала)"""
         try:
@@ -7419,16 +8120,20 @@ class MainWindow(QMainWindow):
             gameinfo_dir = Path(self.gameinfo_path).parent
             addon_dir = gameinfo_dir / "addons" / "workshop" / addon['id']
             
-            if addon_dir.exists():
-                shutil.rmtree(addon_dir)
+            _fast_rm_addon(addon_dir)
             
         except Exception as e:
             QMessageBox.critical(self, get_text("error_title"), get_text("addon_disable_error", error=str(e)))
     
     def add_to_gameinfo(self, addon_id):
         """Добавляет аддон в gameinfo.txt"""
+        self.add_many_to_gameinfo([addon_id])
+    
+    def add_many_to_gameinfo(self, addon_ids):
+        """Добавляет несколько аддонов в gameinfo.txt за одно чтение и одну запись"""
         if not self.gameinfo_path.exists():
             return
+        self._dirty_gameinfo = True
         
         try:
             # Создаем бэкап только один раз (проверка быстрая)
@@ -7452,9 +8157,16 @@ class MainWindow(QMainWindow):
             if search_paths_index == -1:
                 return
             
-            # Проверяем, не добавлен ли уже (путь к ПАПКЕ, а не к .vpk!)
-            addon_line = f'\t\t\tGame\tleft4dead2\\addons\\workshop\\{addon_id}\n'
-            if addon_line in lines:
+            # Отбираем ещё не добавленные (путь к ПАПКЕ, а не к .vpk!)
+            existing = set(lines)
+            new_lines = []
+            for addon_id in addon_ids:
+                addon_line = f'\t\t\tGame\tleft4dead2\\addons\\workshop\\{addon_id}\n'
+                if addon_line not in existing:
+                    existing.add(addon_line)
+                    new_lines.append(addon_line)
+            
+            if not new_lines:
                 return
             
             # Находим место для вставки (после первой Game строки)
@@ -7464,8 +8176,8 @@ class MainWindow(QMainWindow):
                     insert_index = i + 1
                     break
             
-            # Вставляем строку
-            lines.insert(insert_index, addon_line)
+            # Вставляем все строки разом
+            lines[insert_index:insert_index] = new_lines
             
             # Записываем обратно
             with open(self.gameinfo_path, 'w', encoding='utf-8') as f:
@@ -7476,20 +8188,33 @@ class MainWindow(QMainWindow):
     
     def remove_from_gameinfo(self, addon_id):
         """Удаляет аддон из gameinfo.txt"""
-        if not self.gameinfo_path.exists():
+        self.remove_many_from_gameinfo([addon_id])
+    
+    def remove_many_from_gameinfo(self, addon_ids):
+        """Удаляет несколько аддонов из gameinfo.txt за одно чтение и одну запись"""
+        if not self.gameinfo_path.exists() or not addon_ids:
             return
+        self._dirty_gameinfo = True
         
         try:
             with open(self.gameinfo_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                lines = f.readlines()
             
-            # Удаляем строку с этим аддоном (используем regex для гибкости)
-            pattern = rf'\s*Game\s+left4dead2\\addons\\workshop\\{re.escape(addon_id)}\s*\n'
-            content = re.sub(pattern, '', content)
+            # Убираем строки аддонов: один заранее скомпилированный regex + поиск ID в множестве
+            ids = set(addon_ids)
+            kept_lines = []
+            for line in lines:
+                match = _GAMEINFO_WORKSHOP_LINE_RE.match(line) if 'workshop' in line else None
+                if match and match.group(1) in ids:
+                    continue
+                kept_lines.append(line)
+            
+            if len(kept_lines) == len(lines):
+                return
             
             # Записываем обратно
             with open(self.gameinfo_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                f.writelines(kept_lines)
         
         except Exception as e:
             print(f"Ошибка удаления из gameinfo.txt: {e}")
@@ -7523,6 +8248,7 @@ class MainWindow(QMainWindow):
                 item = old_layout.takeAt(0)
                 if item.widget():
                     item.widget().deleteLater()
+            self._pirate_cards = []
             
             # Удаляем старый layout
             QWidget().setLayout(old_layout)
@@ -7589,25 +8315,38 @@ class MainWindow(QMainWindow):
         ):
             return
         
+        if not self.gameinfo_path or not self.workshop_path:
+            QMessageBox.warning(self, get_text("error_title"), get_text("configure_game_path_short"))
+            return
+        
         # Показываем кастомный прогресс (0-100%)
-        progress = CustomProgressDialog(self, get_text("enabling_addons"), get_text("btn_cancel"), 0, 100)
-        progress.show()
+        self.bulk_progress = CustomProgressDialog(self, get_text("enabling_addons"), get_text("btn_cancel"), 0, 100)
+        self.bulk_progress.show()
+        
+        # Файлы копируются в отдельном потоке, а gameinfo.txt обновляется один раз в конце
+        self.bulk_enable_worker = BulkEnableWorker(list(self.addons), self.copy_addon_files)
+        self.bulk_enable_worker.progress.connect(self.on_bulk_enable_progress)
+        self.bulk_enable_worker.finished_all.connect(self.on_bulk_enable_finished)
+        self.bulk_enable_worker.start()
+    
+    def on_bulk_enable_progress(self, percent, status):
+        """Обновляет прогресс массового включения (сигнал из BulkEnableWorker)"""
+        if self.bulk_progress.wasCanceled():
+            self.bulk_enable_worker.cancel()
+            return
+        self.bulk_progress.setValue(percent)
+        self.bulk_progress.setLabelText(status)
+    
+    def on_bulk_enable_finished(self, enabled_ids, errors):
+        """Завершает массовое включение: gameinfo.txt, состояние аддонов и интерфейс"""
+        progress = self.bulk_progress
         
-        total = len(self.addons)
-        for i, addon in enumerate(self.addons):
-            if progress.wasCanceled():
-                break
-            
-            # Конвертируем в проценты (0-100)
-            percent = int((i / total) * 100)
-            progress.setValue(percent)
-            progress.setLabelText(get_text("enabling_addon", name=addon['name'], current=i+1, total=total))
-            QApplication.processEvents()
-            
-            if not addon.get('enabled'):
+        self.add_many_to_gameinfo(enabled_ids)
+        for addon_id in enabled_ids:
+            addon = self._addons_by_id.get(addon_id)
+            if addon and not addon.get('enabled'):
                 addon['enabled'] = True
-                self.enable_addon(addon)
-        
+                self._enabled_count += 1
         progress.setValue(100)
         
         # Полностью перерисовываем карточки с новым состоянием
@@ -7617,13 +8356,27 @@ class MainWindow(QMainWindow):
         # Закрываем прогресс без убирания блюра
         progress.close_keeping_blur()
         
-        # Небольшая задержка для плавности
-        QApplication.processEvents()
-        import time
-        time.sleep(0.35)
-        
-        # Показываем кастомное информационное окно (используем существующий блюр)
-        CustomInfoDialog.information(self, get_text("ready_title"), get_text("enabled_addons_count", count=len(self.addons)), use_existing_blur=True, icon_type="success")
+        # Показываем итог, когда вернемся в цикл событий (диалог сам плавно появляется)
+        message = get_text("enabled_addons_count", count=len(enabled_ids))
+        if errors:
+            self._show_bulk_done_later(get_text("bulk_completed_errors"), message + self._format_bulk_errors(errors), "error")
+        else:
+            self._show_bulk_done_later(get_text("ready_title"), message, "success")
+    
+    def _format_bulk_errors(self, errors, limit=5):
+        """Список ошибок массовой операции для итогового окна (первые limit строк)"""
+        text = "\n\n" + get_text("bulk_failed_header", count=len(errors)) + "\n" + "\n".join(errors[:limit])
+        if len(errors) > limit:
+            text += "\n" + get_text("bulk_failed_more", count=len(errors) - limit)
+        return text
+    
+    def _show_bulk_done(self, title, message, icon_type):
+        """Показывает итог массовой операции поверх уже существующего блюра"""
+        CustomInfoDialog.information(self, title, message, use_existing_blur=True, icon_type=icon_type)
+    
+    def _show_bulk_done_later(self, title, message, icon_type):
+        """Показывает итог на следующей итерации цикла событий, не задерживая обработчик"""
+        QTimer.singleShot(0, lambda: self._show_bulk_done(title, message, icon_type))
     
     def disable_all_addons(self):
         """Выключает все аддоны и удаляет их папки"""
@@ -7642,8 +8395,6 @@ class MainWindow(QMainWindow):
         progress = CustomProgressDialog(self, get_text("disabling_addons"), get_text("btn_cancel"), 0, 100)
         progress.show()
         
-        total = len(self.addons)
-        
         # Восстанавливаем gameinfo из бэкапа (0-10%)
         progress.setValue(0)
         progress.setLabelText(get_text("restoring_gameinfo"))
@@ -7654,54 +8405,40 @@ class MainWindow(QMainWindow):
             if backup_path.exists():
                 shutil.copy2(backup_path, self.gameinfo_path)
             else:
-                # Если нет бэкапа, удаляем все записи вручную
-                for addon in self.addons:
-                    self.remove_from_gameinfo(addon['id'])
+                # Если нет бэкапа, удаляем все записи вручную (одной перезаписью файла)
+                self.remove_many_from_gameinfo([addon['id'] for addon in self.addons])
         except Exception as e:
             progress.close_keeping_blur()
-            
-            # Небольшая задержка для плавности
-            QApplication.processEvents()
-            import time
-            time.sleep(0.35)
-            
-            CustomInfoDialog.information(
-                self, 
-                get_text("error_title"), 
-                get_text("gameinfo_restore_error", error=str(e)),
-                use_existing_blur=True,
-                icon_type="error"
-            )
+            self._show_bulk_done_later(get_text("error_title"), get_text("gameinfo_restore_error", error=str(e)), "error")
             return
         
         progress.setValue(10)
         
-        # Удаляем папки аддонов (10-100%)
-        gameinfo_dir = Path(self.gameinfo_path).parent
-        workshop_dir = gameinfo_dir / "addons" / "workshop"
-        
-        for i, addon in enumerate(self.addons):
-            if progress.wasCanceled():
-                break
-            
-            # Конвертируем в проценты (10-100)
-            percent = int(10 + (i / total) * 90)
-            progress.setValue(percent)
-            progress.setLabelText(get_text("deleting_folder", addon_id=addon['id'], current=i+1, total=total))
-            QApplication.processEvents()
-            
-            try:
-                addon_dir = workshop_dir / addon['id']
-                if addon_dir.exists():
-                    shutil.rmtree(addon_dir)
-            except Exception as e:
-                print(f"Ошибка удаления папки {addon['id']}: {e}")
-        
+        # Папки аддонов удаляются в отдельном потоке (10-100%)
+        self.bulk_progress = progress
+        workshop_dir = Path(self.gameinfo_path).parent / "addons" / "workshop"
+        self.bulk_disable_worker = BulkDisableWorker([addon['id'] for addon in self.addons], workshop_dir)
+        self.bulk_disable_worker.progress.connect(self.on_bulk_disable_progress)
+        self.bulk_disable_worker.finished_all.connect(self.on_bulk_disable_finished)
+        self.bulk_disable_worker.start()
+    
+    def on_bulk_disable_progress(self, percent, status):
+        """Обновляет прогресс массового выключения (сигнал из BulkDisableWorker)"""
+        if self.bulk_progress.wasCanceled():
+            self.bulk_disable_worker.cancel()
+            return
+        self.bulk_progress.setValue(percent)
+        self.bulk_progress.setLabelText(status)
+    
+    def on_bulk_disable_finished(self, removed_ids, errors):
+        """Завершает массовое выключение: состояние аддонов и интерфейс"""
+        progress = self.bulk_progress
         progress.setValue(100)
         
-        # Обновляем статус всех аддонов
+        # gameinfo.txt уже восстановлен - все аддоны выключены, даже если часть папок осталась
         for addon in self.addons:
             addon['enabled'] = False
+        self._enabled_count = 0
         
         # Полностью перерисовываем карточки с новым состоянием
         self.display_addons()
@@ -7709,13 +8446,15 @@ class MainWindow(QMainWindow):
         # Закрываем прогресс без убирания блюра
         progress.close_keeping_blur()
         
-        # Небольшая задержка для плавности
-        QApplication.processEvents()
-        import time
-        time.sleep(0.35)
-        
         # Показываем кастомное информационное окно (используем существующий блюр)
-        CustomInfoDialog.information(self, get_text("ready_title"), get_text("all_addons_disabled"), use_existing_blur=True, icon_type="success")
+        total = len(self.addons)
+        if errors:
+            message = get_text("deleted_folders_count", count=len(removed_ids), total=total) + self._format_bulk_errors(errors)
+            self._show_bulk_done_later(get_text("bulk_completed_errors"), message, "error")
+        elif len(removed_ids) < total:
+            self._show_bulk_done_later(get_text("ready_title"), get_text("deleted_folders_count", count=len(removed_ids), total=total), "success")
+        else:
+            self._show_bulk_done_later(get_text("ready_title"), get_text("all_addons_disabled"), "success")
     
     def add_vpk_to_addons(self):
         """Добавляет .vpk файл в папку addons/ (для пиратки)"""
@@ -7759,46 +8498,70 @@ class MainWindow(QMainWindow):
         total = len(vpk_files)
         user_canceled = False
         
-        for i, vpk_file in enumerate(vpk_files):
+        # Сначала проверяем конфликты имён (диалоги только в GUI-потоке)
+        # Содержимое addons читаем один раз вместо exists() на каждый файл
+        existing_names = {entry.name for entry in os.scandir(addons_dir)}
+        jobs = {}  # Имя файла -> (источник, назначение); повторно выбранное имя заменяет прежнее
+        for vpk_file in vpk_files:
             if progress.wasCanceled():
                 user_canceled = True
                 break
             
             vpk_path = Path(vpk_file)
-            percent = int((i / total) * 100)
-            progress.setValue(percent)
-            progress.setLabelText(get_text("copying_file", filename=vpk_path.name, current=i+1, total=total))
-            QApplication.processEvents()
+            dest_path = addons_dir / vpk_path.name
             
-            try:
-                dest_path = addons_dir / vpk_path.name
+            # Проверяем не существует ли уже (в том числе среди уже выбранных файлов)
+            if vpk_path.name in existing_names:
+                # Скрываем прогресс-диалог временно
+                progress.hide()
                 
-                # Проверяем не существует ли уже
-                if dest_path.exists():
-                    # Скрываем прогресс-диалог временно
-                    progress.hide()
-                    
-                    # Используем кастомный диалог подтверждения БЕЗ создания нового blur
-                    reply = CustomConfirmDialog.question(
-                        self,
-                        get_text("file_exists_title"),
-                        get_text("file_exists_message", filename=vpk_path.name),
-                        use_existing_blur=False  # Создаем свой blur т.к. прогресс скрыт
-                    )
-                    
-                    # Показываем прогресс-диалог обратно
-                    progress.show()
-                    
-                    if not reply:
-                        skipped_count += 1
-                        continue
+                # Используем кастомный диалог подтверждения БЕЗ создания нового blur
+                reply = CustomConfirmDialog.question(
+                    self,
+                    get_text("file_exists_title"),
+                    get_text("file_exists_message", filename=vpk_path.name),
+                    use_existing_blur=False  # Создаем свой blur т.к. прогресс скрыт
+                )
                 
-                # Копируем
-                shutil.copy2(vpk_path, dest_path)
-                success_count += 1
+                # Показываем прогресс-диалог обратно
+                progress.show()
                 
-            except Exception as e:
-                failed_files.append(f"{vpk_path.name}: {str(e)}")
+                if not reply:
+                    skipped_count += 1
+                    continue
+            
+            existing_names.add(vpk_path.name)
+            jobs[vpk_path.name] = (vpk_path, dest_path)
+        
+        # Копируем параллельно в пуле потоков, GUI-поток только обновляет прогресс
+        if jobs and not user_canceled:
+            done_count = 0
+            job_total = len(jobs)  # Пропущенные и повторно выбранные файлы в прогресс не входят
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                pending = {executor.submit(shutil.copyfile, src, dst): src for src, dst in jobs.values()}
+                while pending:
+                    if progress.wasCanceled():
+                        user_canceled = True
+                        for future in pending:
+                            future.cancel()
+                    
+                    finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        vpk_path = pending.pop(future)
+                        if future.cancelled():
+                            continue
+                        
+                        done_count += 1
+                        try:
+                            future.result()
+                            success_count += 1
+                        except Exception as e:
+                            failed_files.append(f"{vpk_path.name}: {str(e)}")
+                        
+                        progress.setValue(int((done_count / job_total) * 100))
+                        progress.setLabelText(get_text("copying_file", filename=vpk_path.name, current=done_count, total=job_total))
+                    
+                    QApplication.processEvents()
         
         progress.setValue(100)
         
@@ -7806,22 +8569,16 @@ class MainWindow(QMainWindow):
         if user_canceled or (success_count == 0 and len(failed_files) == 0):
             progress.close()
             # Убираем blur
-            if self.graphicsEffect():
-                self.setGraphicsEffect(None)
+            hide_shared_blur_effect(self)
             central_widget = self.centralWidget()
-            if central_widget and central_widget.graphicsEffect():
-                central_widget.setGraphicsEffect(None)
+            if central_widget:
+                hide_shared_blur_effect(central_widget)
             # Обновляем список модов
             self.scan_pirate_addons()
             return
         
         progress.close_keeping_blur()
         
-        # Небольшая задержка для плавности
-        QApplication.processEvents()
-        import time
-        time.sleep(0.35)
-        
         # Результат
         result_msg = get_text("install_result", 
             success=success_count, 
@@ -7837,28 +8594,21 @@ class MainWindow(QMainWindow):
                 result_msg += f"\n... и еще {len(failed_files) - 3}"
             
             # Если есть ошибки - показываем с иконкой ошибки
-            CustomInfoDialog.information(
-                self, 
-                get_text("installation_completed_errors"), 
-                result_msg,
-                use_existing_blur=True,
-                icon_type="error"
-            )
+            self._show_bulk_done_later(get_text("installation_completed_errors"), result_msg, "error")
         else:
             # Если все успешно - показываем с зеленой галочкой
-            CustomInfoDialog.information(
-                self, 
-                get_text("installation_completed"), 
-                result_msg,
-                use_existing_blur=True,
-                icon_type="success"
-            )
+            self._show_bulk_done_later(get_text("installation_completed"), result_msg, "success")
         
         # Обновляем список модов
         self.scan_pirate_addons()
     
     def ensure_steamcmd_installed(self, use_existing_blur=False):
         """Проверяет наличие SteamCMD и предлагает установить если нет"""
+        # Быстрый путь: SteamCMD уже найден ранее - достаточно одной проверки файла
+        steamcmd_exe_cached = self._steamcmd_exe_cached
+        if steamcmd_exe_cached is not None and os.path.isfile(steamcmd_exe_cached):
+            return Path(steamcmd_exe_cached).parent
+        
         # Определяем папку программы (работает и для .py и для .exe)
         if getattr(sys, 'frozen', False):
             # Если запущен как .exe (PyInstaller)
@@ -7871,6 +8621,7 @@ class MainWindow(QMainWindow):
         steamcmd_exe = steamcmd_path / "steamcmd.exe"
         
         if steamcmd_exe.exists():
+            self._steamcmd_exe_cached = str(steamcmd_exe)
             return steamcmd_path
         
         # SteamCMD не найден - предлагаем установить
@@ -7932,9 +8683,7 @@ class MainWindow(QMainWindow):
         QApplication.processEvents()
         
         try:
-            import urllib.request
             import zipfile
-            import tempfile
             
             # URL для скачивания SteamCMD
             steamcmd_url = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
@@ -7943,59 +8692,56 @@ class MainWindow(QMainWindow):
             progress.setValue(20)
             QApplication.processEvents()
             
-            # Скачиваем во временную папку
-            temp_dir = Path(tempfile.mkdtemp())
-            zip_path = temp_dir / "steamcmd.zip"
+            # Архив небольшой (~3 MB) - держим его в памяти, без временного файла
+            zip_buffer = io.BytesIO()
             
             # Переменные для отслеживания скорости
-            import time
-            last_update_time = [time.time()]
-            last_downloaded = [0]
-            
-            # Функция форматирования размера
-            def format_bytes(bytes_val):
-                if bytes_val < 1024:
-                    return f"{bytes_val} B"
-                elif bytes_val < 1024 * 1024:
-                    return f"{bytes_val / 1024:.2f} KB"
-                else:
-                    return f"{bytes_val / (1024 * 1024):.2f} MB"
+            last_update_time = time.monotonic()
+            last_downloaded = 0
+            downloaded = 0
             
-            # Скачиваем с прогрессом
-            def download_progress(block_num, block_size, total_size):
-                if progress.wasCanceled():
-                    raise Exception("Отменено пользователем")
-                
-                downloaded = block_num * block_size
-                if total_size > 0:
-                    percent = min(int((downloaded / total_size) * 40) + 20, 60)
-                    progress.setValue(percent)
+            # Скачиваем потоком блоками по 256 KB (через общую сессию, если есть requests)
+            if REQUESTS_AVAILABLE:
+                response = get_steam_session().get(steamcmd_url, stream=True, timeout=30)
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=262144)
+            else:
+                response = urlopen(steamcmd_url, timeout=30)
+                chunks = iter(lambda: response.read(262144), b'')
+            total_size = int(response.headers.get('Content-Length', 0))
+            
+            try:
+                for chunk in chunks:
+                    if progress.wasCanceled():
+                        raise Exception("Отменено пользователем")
+                    
+                    zip_buffer.write(chunk)
+                    downloaded += len(chunk)
+                    
+                    # Интерфейс обновляем не чаще чем раз в 0.3 сек
+                    current_time = time.monotonic()
+                    time_diff = current_time - last_update_time
+                    if time_diff < 0.3:
+                        continue
                     
                     # Вычисляем скорость
-                    current_time = time.time()
-                    time_diff = current_time - last_update_time[0]
+                    download_speed = (downloaded - last_downloaded) / time_diff
+                    last_downloaded = downloaded
+                    last_update_time = current_time
                     
-                    if time_diff >= 0.3:  # Обновляем каждые 0.3 сек
-                        bytes_diff = downloaded - last_downloaded[0]
-                        download_speed = bytes_diff / time_diff if time_diff > 0 else 0
-                        last_downloaded[0] = downloaded
-                        last_update_time[0] = current_time
-                        
-                        speed_str = format_bytes(download_speed) + "/s"
-                        downloaded_str = format_bytes(downloaded)
-                        total_str = format_bytes(total_size)
-                        
+                    if total_size > 0:
+                        progress.setValue(min(int((downloaded / total_size) * 40) + 20, 60))
                         progress.setLabelText(
                             get_text("downloading_steamcmd", 
-                                downloaded=downloaded_str, 
-                                total=total_str, 
-                                speed=speed_str
+                                downloaded=_format_bytes(downloaded), 
+                                total=_format_bytes(total_size), 
+                                speed=_format_bytes(download_speed) + "/s"
                             )
                         )
                     
                     QApplication.processEvents()
-            
-            urllib.request.urlretrieve(steamcmd_url, zip_path, download_progress)
+            finally:
+                response.close()
             
             progress.setLabelText(get_text("extracting_steamcmd"))
             progress.setValue(65)
@@ -8004,91 +8750,85 @@ class MainWindow(QMainWindow):
             # Создаём папку steamcmd
             steamcmd_path.mkdir(parents=True, exist_ok=True)
             
-            # Распаковываем
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(steamcmd_path)
+            # Распаковываем потоком: только файлы, буфер по размеру файла (до 1 MB)
+            steamcmd_root = steamcmd_path.resolve()
+            with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.is_dir():
+                        continue
+                    
+                    # Защита от путей вида ../ (extractall делал это сам)
+                    dest = (steamcmd_root / info.filename).resolve()
+                    if steamcmd_root not in dest.parents:
+                        continue
+                    
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    if info.file_size == 0:
+                        dest.touch()
+                        continue
+                    with zip_ref.open(info) as src, open(dest, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, min(info.file_size, 1 << 20))
             
             progress.setValue(80)
             progress.setLabelText(get_text("steamcmd_first_run"))
             QApplication.processEvents()
             
-            # Первый запуск SteamCMD для инициализации
-            import subprocess
-            init_process = subprocess.Popen(
-                [str(steamcmd_exe), "+quit"],
-                cwd=str(steamcmd_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                universal_newlines=True,
-                bufsize=1
+            # Первый запуск SteamCMD для инициализации (QProcess - без потока чтения и опроса)
+            init_process = QProcess(self)
+            init_process.setProgram(str(steamcmd_exe))
+            init_process.setArguments(["+quit"])
+            init_process.setWorkingDirectory(str(steamcmd_path))
+            init_process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+            
+            # Храним только хвост вывода (кольцевой буфер), байты без декодирования
+            output_lines = collections.deque(maxlen=256)
+            init_process.readyReadStandardOutput.connect(
+                lambda: output_lines.append(bytes(init_process.readAllStandardOutput()))
             )
             
-            # Ждём завершения с анимацией прогресса и таймаутом
-            init_progress = 80
-            loop_counter = 0
-            start_time = time.time()
-            timeout = 30  # Таймаут 30 секунд (инициализация не обязательна)
-            
-            # Читаем вывод в отдельном потоке
-            import threading
-            output_lines = []
+            # Ждём завершения в локальном цикле событий с анимацией прогресса и таймаутом
+            wait_loop = QEventLoop()
+            init_process.finished.connect(wait_loop.quit)
+            init_process.errorOccurred.connect(wait_loop.quit)
             
-            def read_output():
-                try:
-                    for line in iter(init_process.stdout.readline, ''):
-                        output_lines.append(line.strip())
-                except:
-                    pass
-            
-            output_thread = threading.Thread(target=read_output, daemon=True)
-            output_thread.start()
+            start_time = time.monotonic()
+            timeout = 30  # Таймаут 30 секунд (инициализация не обязательна)
+            init_progress = [80]
             
-            while init_process.poll() is None:
-                # Процесс ещё работает
-                elapsed = time.time() - start_time
+            def on_init_tick():
+                elapsed = time.monotonic() - start_time
                 
-                if progress.wasCanceled():
-                    # Пользователь отменил - убиваем процесс и продолжаем
+                # Отмена, 100% или таймаут - убиваем процесс и продолжаем
+                if progress.wasCanceled() or init_progress[0] >= 100 or elapsed > timeout:
                     init_process.kill()
-                    break
+                    wait_loop.quit()
+                    return
                 
                 # Показываем простое сообщение без технических деталей
-                progress.setLabelText(
-                    get_text("steamcmd_wait", seconds=int(elapsed))
-                )
-                
-                # Обрабатываем события интерфейса чаще
-                QApplication.processEvents()
+                progress.setLabelText(get_text("steamcmd_wait", seconds=int(elapsed)))
                 
                 # Плавно увеличиваем прогресс от 80 до 100
-                loop_counter += 1
-                if loop_counter % 5 == 0 and init_progress < 100:
-                    init_progress += 1
-                    progress.setValue(init_progress)
-                
-                # Автоматически завершаем при достижении 100%
-                if init_progress >= 100:
-                    init_process.kill()
-                    break
-                
-                # Проверяем таймаут
-                if elapsed > timeout:
-                    # Таймаут - убиваем процесс и продолжаем
-                    init_process.kill()
-                    break
-                
-                time.sleep(0.01)  # Очень короткая задержка
+                init_progress[0] += 1
+                progress.setValue(init_progress[0])
+            
+            init_timer = QTimer(self)
+            init_timer.timeout.connect(on_init_tick)
+            init_timer.start(100)
+            
+            init_process.start()
+            wait_loop.exec()
+            
+            init_timer.stop()
+            init_timer.deleteLater()
+            if init_process.state() != QProcess.ProcessState.NotRunning:
+                init_process.kill()
+                init_process.waitForFinished(1000)
+            init_process.deleteLater()
             
             progress.setValue(100)
             progress.close_keeping_blur()
             
-            # Небольшая задержка для плавности
-            QApplication.processEvents()
-            import time
-            time.sleep(0.35)
-            
-            # Показываем успешное сообщение и ждём его закрытия
+            # Показываем успешное сообщение (появляется своей анимацией) и ждём его закрытия
             CustomInfoDialog.information(
                 self,
                 get_text("success_title"),
@@ -8097,10 +8837,7 @@ class MainWindow(QMainWindow):
                 icon_type="success"
             )
             
-            # Очищаем временные файлы
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            
+            self._steamcmd_exe_cached = str(steamcmd_exe)
             return steamcmd_path
             
         except Exception as e:
@@ -8108,33 +8845,314 @@ class MainWindow(QMainWindow):
             
             if has_progress:
                 progress.close_keeping_blur()
-                
-                # Небольшая задержка для плавности
-                QApplication.processEvents()
-                import time
-                time.sleep(0.35)
             
             if get_text("cancelled_text") not in str(e):
                 CustomInfoDialog.information(
                     self,
                     get_text("installation_error_title"),
                     get_text("steamcmd_error_message", error=str(e)),
-                    f"https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip\n\n"
-                    f"И распаковать в папку программы.",
                     use_existing_blur=has_progress and use_existing_blur
                 )
             
             return None
     
-    def auto_download_workshop_addon(self, addon_id, use_existing_blur=False, show_success_message=True, batch_info=None, existing_progress=None):
+    def show_fatal_later(self, title, message):
+        """Запоминает критическую ошибку и показывает ее после выхода из цикла опроса (повторные не копятся)"""
+        if self._fatal_dialog_timer.isActive():
+            return
+        self._pending_fatal = (title, message)
+        self._fatal_dialog_timer.start()
+    
+    def _show_pending_fatal(self):
+        """Показывает отложенную критическую ошибку SteamCMD"""
+        if self._pending_fatal is None:
+            return
+        title, message = self._pending_fatal
+        self._pending_fatal = None
+        CustomInfoDialog.information(self, title, message, use_existing_blur=True, icon_type="error")
+    
+    def _update_download_progress(self, progress, download_folder, content_folder, state, batch_prefix, wait_info=""):
+        """Замеряет папку скачивания SteamCMD, обновляет текст прогресса (размер и скорость) и возвращает размер"""
+        current_time = time.time()
+        
+        # Проверяем папку downloads (трекер между замерами заново учитывает только измененные файлы)
+        if 'download_tracker' not in state:
+            state['download_tracker'] = _SizeTracker(download_folder)
+        folder_size = state['download_tracker'].refresh()
+        
+        # Если в downloads пусто, проверяем content (файлы уже скачаны)
+        if folder_size == 0 and content_folder is not None:
+            if 'content_tracker' not in state:
+                state['content_tracker'] = _SizeTracker(content_folder)
+            folder_size = state['content_tracker'].refresh()
+            if folder_size > 0 and not state['download_started']:
+                state['download_started'] = True
+                progress.setLabelText(f"{batch_prefix}{get_text('extracting_files')}")
+        
+        if folder_size > 0:
+            # Вычисляем скорость по изменению размера с прошлого замера
+            details = _format_bytes(folder_size)
+            time_diff = current_time - state['last_folder_check']
+            if state['last_folder_size'] > 0 and time_diff > 0:
+                folder_speed = (folder_size - state['last_folder_size']) / time_diff
+                if folder_speed > 0:
+                    details += f" ({_format_bytes(folder_speed)}/s)"
+            if wait_info:
+                details += f"\n{wait_info}"
+            
+            state['download_started'] = True
+            progress.setLabelText(f"{batch_prefix}Скачивание файлов...\n{details}")
+            state['last_folder_size'] = folder_size
+        
+        state['last_folder_check'] = current_time
+        return folder_size
+    
+    def _await_download_folder(self, progress, download_folder, content_folder, workshop_root, batch_prefix):
+        """Ждет появления папки мода в content: проверка по QTimer раз в 0.5 сек и по уведомлениям ФС"""
+        # Умное ожидание: если есть активность скачивания - ждем 30 сек, иначе 3 минуты
+        max_wait_with_activity = 60  # 60 попыток × 0.5 сек = 30 секунд (если идет скачивание)
+        max_wait_no_activity = 360  # 360 попыток × 0.5 сек = 3 минуты (если нет активности)
+        
+        state = {
+            'done': False,
+            'canceled': False,
+            'attempts': 0,
+            'activity_detected': False,
+            'last_size': 0,
+            'no_activity_start': None,
+            'timeout_seconds': max_wait_no_activity // 2,
+            'label_seconds': None,
+        }
+        progress_state = {'last_folder_check': time.time(), 'last_folder_size': 0, 'download_started': False}
+        wait_start = time.time()
+        
+        wait_loop = QEventLoop()
+        wait_timer = QTimer(self)
+        wait_timer.setInterval(500)
+        # Появление папки мода замечаем сразу по уведомлению ФС, а не на следующем тике
+        content_watcher = QFileSystemWatcher(self)
+        
+        def watch_nearest_content_dir():
+            # Следим за ближайшей существующей папкой на пути к content/550/<id>
+            for watch_dir in (content_folder.parent, content_folder.parent.parent, workshop_root):
+                if watch_dir.exists():
+                    watch_path = str(watch_dir)
+                    watched = content_watcher.directories()
+                    if watch_path not in watched:
+                        if watched:
+                            content_watcher.removePaths(watched)
+                        content_watcher.addPath(watch_path)
+                    return
+        
+        def finish():
+            state['done'] = True
+            wait_loop.quit()
+        
+        def poll_once():
+            if state['done']:
+                return
+
+            if progress.wasCanceled():
+                state['canceled'] = True
+                finish()
+                return
+            if content_folder.exists():
+                finish()
+                return
+            
+            # Время ожидания в полусекундных попытках (проверка по событию ФС не сбивает счет)
+            state['attempts'] = int((time.time() - wait_start) * 2)
+            elapsed_seconds = int(state['attempts'] * 0.5)
+            
+            # Счетчик ожидания формируем один раз на тик и для обеих веток
+            max_seconds = (max_wait_with_activity if state['activity_detected'] else max_wait_no_activity) // 2
+            wait_counter = f"{elapsed_seconds}s / {max_seconds}s"
+            
+            # Проверяем, идет ли еще скачивание (тот же замер папки, что и в основном цикле)
+            current_download_size = self._update_download_progress(
+                progress, download_folder, None, progress_state, batch_prefix,
+                wait_info=f"(ожидание {wait_counter})"
+            )
+            download_activity = current_download_size > 0
+            
+            if download_activity:
+                state['activity_detected'] = True
+                
+                # Проверяем, растет ли размер (идет ли активное скачивание)
+                if current_download_size > state['last_size']:
+                    state['no_activity_start'] = None  # Сбрасываем таймер неактивности
+                elif state['no_activity_start'] is None:
+                    state['no_activity_start'] = time.time()  # Начинаем отсчет неактивности
+                
+                state['last_size'] = current_download_size
+            elif state['label_seconds'] != elapsed_seconds:
+                # Папка downloads пустая или не существует (текст меняется раз в секунду)
+                state['label_seconds'] = elapsed_seconds
+                progress.setLabelText(f"{batch_prefix}Ожидание завершения скачивания...\n({wait_counter})")
+            
+            # Определяем лимит ожидания в зависимости от активности
+            if state['activity_detected']:
+                # Если была обнаружена активность скачивания - ждем только 30 секунд
+                current_max_wait = max_wait_with_activity
+                state['timeout_seconds'] = current_max_wait // 2
+                
+                # Дополнительная проверка: если размер не меняется более 10 секунд - прерываем
+                if state['no_activity_start'] and (time.time() - state['no_activity_start']) > 10:
+                    print(f"[DEBUG] Размер не меняется более 10 секунд, прерываем ожидание")
+                    finish()
+                    return
+            else:
+                # Если активности не было - ждем 3 минуты (мод может быть недоступен)
+                current_max_wait = max_wait_no_activity
+                state['timeout_seconds'] = current_max_wait // 2
+            
+            # Проверяем превышение лимита
+            if state['attempts'] >= current_max_wait:
+                print(f"[DEBUG] Достигнут лимит ожидания: {state['attempts']} попыток ({elapsed_seconds}s)")
+                finish()
+                return
+            
+            print(f"[DEBUG] Папка не найдена, ожидание... ({state['attempts'] + 1}/{current_max_wait}, {elapsed_seconds}s, активность: {download_activity})")
+            watch_nearest_content_dir()
+        
+        wait_timer.timeout.connect(poll_once)
+        content_watcher.directoryChanged.connect(poll_once)
+        
+        # Первая проверка сразу; цикл событий нужен, только если она не завершила ожидание
+        poll_once()
+        if not state['done']:
+            wait_timer.start()
+            wait_loop.exec()
+        wait_timer.stop()
+        wait_timer.deleteLater()
+        content_watcher.deleteLater()
+        return state
+    
+    def auto_download_workshop_batch(self, addon_ids, progress):
+        """Скачивает серию модов одним процессом SteamCMD, возвращает множество скачанных ID (None - отмена)"""
+        
+        steamcmd_path = self.ensure_steamcmd_installed(use_existing_blur=True)
+        if not steamcmd_path:
+            return None
+        
+        # Логин в Steam выполняется один раз на всю серию, а не для каждого мода.
+        # ShutdownOnFailedCommand выключен, чтобы недоступный мод не прерывал скачивание остальных
+        cmd = [
+            str(steamcmd_path / "steamcmd.exe"),
+            "+@NoPromptForPassword", "1",
+            "+@ShutdownOnFailedCommand", "0",
+            "+login", "anonymous"
+        ]
+        for addon_id in addon_ids:
+            cmd += ["+workshop_download_item", "550", addon_id]
+        cmd.append("+quit")
+        
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                cwd=str(steamcmd_path),
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                bufsize=65536
+            )
+        except Exception as e:
+            print(f"[DEBUG] Не удалось запустить SteamCMD для серии модов: {e}")
+            return set()
+        
+        total = len(addon_ids)
+        downloaded = set()
+        stdout_fd = process.stdout.fileno()
+        pending_output = b''
+        poll_loop = QEventLoop()
+        poll_result = {'abort': False}
+        
+        progress.setLabelText(f"[0/{total}] {get_text('steamcmd_initializing')}")
+        
+        def poll_batch_tick():
+            nonlocal pending_output
+            
+            try:
+                if progress.wasCanceled():
+                    process.kill()
+                    poll_result['abort'] = True
+                    poll_loop.quit()
+                    return
+                
+                # После выхода процесса дочитываем вывод до конца, чтобы не потерять последние строки
+                finished = process.poll() is not None
+                if finished:
+                    pending_output += process.stdout.read() + b'\n'
+                else:
+                    available = _pipe_bytes_available(process.stdout)
+                    if available:
+                        pending_output += os.read(stdout_fd, available)
+                *output_lines, pending_output = pending_output.replace(b'\r', b'\n').split(b'\n')
+                
+                for line in output_lines:
+                    if not line.strip():
+                        continue
+                    line_lower = line.lower()
+                    line_kind = _classify_steamcmd_line(line_lower)
+                    print(f"[SteamCMD] {line.decode(STEAMCMD_OUTPUT_ENCODING, 'replace').strip()}")
+                    
+                    # Критическую ошибку покажет обычное скачивание оставшихся модов
+                    if line_kind == 'fatal':
+                        process.kill()
+                        poll_loop.quit()
+                        return
+                    
+                    item_match = _DOWNLOADED_ITEM_RE.search(line)
+                    if item_match:
+                        downloaded.add(item_match.group(1).decode('ascii'))
+                        progress.setValue(len(downloaded) * 100 // total)
+                        progress.setLabelText(f"[{len(downloaded)}/{total}] {get_text('downloading_mods')}")
+                        continue
+                    
+                    bytes_match = _BYTES_RE.search(line)
+                    if bytes_match:
+                        progress.setLabelText(
+                            f"[{len(downloaded)}/{total}] {get_text('downloading_mods')}\n"
+                            f"{_format_bytes(int(bytes_match.group(1)))} / {_format_bytes(int(bytes_match.group(2)))}"
+                        )
+                    elif line_kind == 'connect':
+                        progress.setLabelText(f"[0/{total}] Подключение к Steam...")
+                    elif line_kind == 'login':
+                        progress.setLabelText(f"[0/{total}] Авторизация...")
+                
+                if finished:
+                    poll_loop.quit()
+            except Exception as e:
+                print(f"[DEBUG] Ошибка чтения вывода SteamCMD: {e}")
+                process.kill()
+                poll_loop.quit()
+        
+        poll_timer = QTimer(self)
+        poll_timer.timeout.connect(poll_batch_tick)
+        poll_timer.start(30)
+        poll_loop.exec()
+        poll_timer.stop()
+        poll_timer.deleteLater()
+        
+        if poll_result['abort']:
+            return None
+        
+        print(f"[DEBUG] Общий процесс SteamCMD скачал {len(downloaded)} из {total} модов")
+        return downloaded
+    
+    def auto_download_workshop_addon(self, addon_id, use_existing_blur=False, show_success_message=True, batch_info=None, existing_progress=None, predownloaded=False, addon_info=None):
         """Автоматически скачивает мод через SteamCMD"""
         try:
-            import subprocess
             import tempfile
             import zipfile
             
             print(f"[DEBUG] auto_download_workshop_addon вызван с addon_id={addon_id}, use_existing_blur={use_existing_blur}")
             
+            # Информацию о моде запрашиваем сразу в фоне: запрос идет параллельно запуску SteamCMD
+            # (при скачивании серии она уже получена одним пакетным запросом)
+            if addon_info is None:
+                addon_info_future = self._addon_info_pool.submit(self.get_workshop_addon_info, addon_id)
+            
             # Проверяем и устанавливаем SteamCMD если нужно
             steamcmd_path = self.ensure_steamcmd_installed(use_existing_blur=use_existing_blur)
             
@@ -8148,7 +9166,6 @@ class MainWindow(QMainWindow):
             steamcmd_exe = steamcmd_path / "steamcmd.exe"
             print(f"[DEBUG] steamcmd_exe = {steamcmd_exe}")
         except Exception as e:
-            import traceback
             error_msg = get_text("download_error_start", error=str(e), traceback=traceback.format_exc())
             print(error_msg)
             CustomInfoDialog.information(self, get_text("error_title"), get_text("unexpected_error", error=str(e)), icon_type="error")
@@ -8197,12 +9214,50 @@ class MainWindow(QMainWindow):
             progress.setValue(base_progress + int(20 * progress_multiplier))
             QApplication.processEvents()
             
-            addon_info = self.get_workshop_addon_info(addon_id)
+            # Создаём временную папку для скачивания
+            temp_dir = Path(tempfile.mkdtemp())
+            download_path = temp_dir / addon_id
+            
+            
+            # Пути SteamCMD для этого мода (считаем один раз на всю функцию)
+            workshop_root = steamcmd_path / "steamapps" / "workshop"
+            download_folder = workshop_root / "downloads" / "550" / addon_id
+            content_folder = workshop_root / "content" / "550" / addon_id
+            
+            # Моды из серии уже скачаны общим процессом SteamCMD - сразу переходим к копированию
+            if not predownloaded:
+                # Команда SteamCMD для скачивания Workshop мода
+                # Используем @NoPromptForPassword для ускорения
+                cmd = [
+                    str(steamcmd_exe),
+                    "+@NoPromptForPassword", "1",  # Не запрашивать пароль
+                    "+@ShutdownOnFailedCommand", "1",  # Выходить при ошибке
+                    "+login", "anonymous",
+                    "+workshop_download_item", "550", addon_id,  # 550 = L4D2 App ID
+                    "+quit"
+                ]
+                
+                # Запускаем SteamCMD
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    cwd=str(steamcmd_path),
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                    bufsize=65536
+                )
+            
+            # Пока SteamCMD логинится, забираем название мода из фонового запроса
+            if addon_info is None:
+                try:
+                    addon_info = addon_info_future.result(timeout=10)
+                except Exception as e:
+                    print(f"[DEBUG] Не удалось получить информацию о моде {addon_id}: {e}")
+                    addon_info = {}
             addon_name = addon_info.get('title', f'addon_{addon_id}')
             
             # Сразу очищаем имя от недопустимых символов
-            import re
-            addon_name = re.sub(r'[<>:"/\\|?*]', '_', addon_name)
+            addon_name = _INVALID_NAME_RE.sub('_', addon_name)
             addon_name = addon_name.strip()
             if not addon_name:
                 addon_name = f'addon_{addon_id}'
@@ -8214,467 +9269,233 @@ class MainWindow(QMainWindow):
             else:
                 batch_prefix = f"{addon_name}\n"
             
-            # Создаём временную папку для скачивания
-            temp_dir = Path(tempfile.mkdtemp())
-            download_path = temp_dir / addon_id
-            
             progress.setLabelText(f"{batch_prefix}{get_text('starting_steamcmd')}")
             progress.setValue(base_progress + int(30 * progress_multiplier))
             QApplication.processEvents()
             
-            # Команда SteamCMD для скачивания Workshop мода
-            # Используем @NoPromptForPassword для ускорения
-            cmd = [
-                str(steamcmd_exe),
-                "+@NoPromptForPassword", "1",  # Не запрашивать пароль
-                "+@ShutdownOnFailedCommand", "1",  # Выходить при ошибке
-                "+login", "anonymous",
-                "+workshop_download_item", "550", addon_id,  # 550 = L4D2 App ID
-                "+quit"
-            ]
-            
-            # Запускаем SteamCMD
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                cwd=str(steamcmd_path),
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # Переменные для отслеживания прогресса
-            import re
-            import time
-            import threading
-            import queue
-            
-            current_progress = base_progress + int(30 * progress_multiplier)
-            last_update_time = time.time()
-            downloaded_bytes = 0
-            total_bytes = 0
-            last_downloaded = 0
-            download_speed = 0
-            last_ui_update = time.time()
-            last_file_check = time.time()
-            download_started = False
-            
-            # Путь где SteamCMD скачивает файлы
-            workshop_download_path = steamcmd_path / "steamapps" / "workshop" / "downloads" / "550" / addon_id
-            
-            # Функция для чтения вывода в отдельном потоке
-            output_queue = queue.Queue()
-            
-            def read_output():
-                try:
-                    for line in iter(process.stdout.readline, ''):
-                        if line:
-                            output_queue.put(line)
-                except:
-                    pass
-            
-            # Запускаем чтение в отдельном потоке
-            reader_thread = threading.Thread(target=read_output, daemon=True)
-            reader_thread.start()
-            
-            # Ждём завершения с обновлением прогресса
-            status_text = get_text("steamcmd_initializing")
-            is_downloading = False
-            download_folder = steamcmd_path / "steamapps" / "workshop" / "downloads" / "550" / addon_id
-            content_folder = steamcmd_path / "steamapps" / "workshop" / "content" / "550" / addon_id
-            last_folder_check = time.time()
-            last_folder_size = 0
-            download_started = False
-            
-            while process.poll() is None:
-                # Проверяем отмену
-                if progress.wasCanceled():
-                    process.kill()
-                    progress.close()
-                    import shutil
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    return
+            if not predownloaded:
+                current_progress = base_progress + int(30 * progress_multiplier)
+                last_update_time = time.time()
+                downloaded_bytes = 0
+                total_bytes = 0
+                last_downloaded = 0
+                download_speed = 0
+                last_ui_update = time.time()
+                last_file_check = time.time()
+                
+                # Вывод читаем в этом же потоке: PeekNamedPipe + os.read только доступных байт
+                stdout_fd = process.stdout.fileno()
+                pending_output = b''
+                
+                # Ждём завершения с обновлением прогресса
+                status_text = get_text("steamcmd_initializing")
+                is_downloading = False
+                folder_state = {'last_folder_check': time.time(), 'last_folder_size': 0, 'download_started': False}
+                
+                # Опрашиваем процесс по QTimer в локальном цикле событий (вместо sleep + processEvents)
+                poll_loop = QEventLoop()
+                poll_result = {'abort': False, 'error': None}
+                
+                def abort_download():
+                    poll_result['abort'] = True
+                    poll_loop.quit()
+                
+                def poll_download_tick():
+                    nonlocal current_progress, last_update_time, downloaded_bytes, total_bytes, last_downloaded, download_speed
+                    nonlocal status_text, is_downloading, pending_output
+                
+                    if process.poll() is not None:
+                        poll_loop.quit()
+                        return
+                
+                    # После критической ошибки вывод больше не разбираем
+                    if poll_result['abort']:
+                        return
                 
-                # Обрабатываем все доступные строки из очереди
-                try:
-                    while True:
-                        line = output_queue.get_nowait()
-                        line_lower = line.lower()
-                        
-                        # Выводим все строки для отладки
-                        print(f"[SteamCMD] {line.strip()}")
-                        
-                        # Проверяем критические ошибки
-                        if "fatal error" in line_lower:
-                            # Проверяем ошибку нехватки места на диске
-                            if "250мб" in line_lower or "250mb" in line_lower or "disk space" in line_lower or "свободного места" in line_lower:
-                                process.kill()
-                                progress.close_keeping_blur()
-                                import shutil
-                                shutil.rmtree(temp_dir, ignore_errors=True)
-                                
-                                QTimer.singleShot(350, lambda: CustomInfoDialog.information(
-                                    self,
-                                    get_text("insufficient_disk_space"),
-                                    get_text("steamcmd_disk_space_message"),
-                                    "3. Переустановите SteamCMD заново\n\n"
-                                    "После этого попробуйте скачать моды снова.",
-                                    use_existing_blur=True
-                                ))
-                                return
-                            else:
-                                # Другая критическая ошибка
-                                error_msg = line.strip()
-                                process.kill()
-                                progress.close_keeping_blur()
-                                import shutil
-                                shutil.rmtree(temp_dir, ignore_errors=True)
-                                
-                                if batch_info:
-                                    raise Exception(f"SteamCMD ошибка: {error_msg}")
-                                else:
-                                    QTimer.singleShot(350, lambda msg=error_msg: CustomInfoDialog.information(
-                                        self,
-                                        get_text("steamcmd_error_title"),
-                                        get_text("steamcmd_critical_error", error=msg),
-                                        use_existing_blur=True
-                                    ))
-                                    return
-                        
-                        # Отслеживаем различные этапы
-                        if "loading steam api" in line_lower or "connecting" in line_lower:
-                            status_text = "Подключение к Steam..."
-                            progress.setLabelText(f"{batch_prefix}{status_text}")
-                        elif "logging in" in line_lower or "anonymous" in line_lower:
-                            status_text = "Авторизация..."
-                            progress.setLabelText(f"{batch_prefix}{status_text}")
-                        elif "waiting for" in line_lower or "checking" in line_lower:
-                            status_text = "Проверка мода..."
-                            progress.setLabelText(f"{batch_prefix}{status_text}")
-                        elif "downloading" in line_lower and "workshop" in line_lower:
-                            is_downloading = True
-                            status_text = "Скачивание файлов..."
-                            progress.setLabelText(f"{batch_prefix}{status_text}")
-                        
-                        # Парсим вывод SteamCMD для получения реального прогресса
-                        # Формат: "Downloading item 123456 ... (X / Y bytes)"
-                        download_match = re.search(r'(\d+)\s*/\s*(\d+)\s*bytes', line, re.IGNORECASE)
-                        if download_match:
-                            downloaded_bytes = int(download_match.group(1))
-                            total_bytes = int(download_match.group(2))
-                            
-                            if total_bytes > 0:
-                                # Вычисляем процент (30-70% диапазон для скачивания)
-                                download_percent = (downloaded_bytes / total_bytes) * 40 + 30
-                                # Учитываем batch прогресс
-                                current_progress = base_progress + int(download_percent * progress_multiplier)
-                                progress.setValue(current_progress)
-                                
-                                # Вычисляем скорость
-                                current_time = time.time()
-                                time_diff = current_time - last_update_time
-                                if time_diff >= 0.5:  # Обновляем скорость каждые 0.5 сек
-                                    bytes_diff = downloaded_bytes - last_downloaded
-                                    download_speed = bytes_diff / time_diff if time_diff > 0 else 0
-                                    last_downloaded = downloaded_bytes
-                                    last_update_time = current_time
-                                    
-                                    # Форматируем размеры
-                                    def format_bytes(bytes_val):
-                                        if bytes_val < 1024:
-                                            return f"{bytes_val} B"
-                                        elif bytes_val < 1024 * 1024:
-                                            return f"{bytes_val / 1024:.2f} KB"
-                                        else:
-                                            return f"{bytes_val / (1024 * 1024):.2f} MB"
-                                    
-                                    speed_str = format_bytes(download_speed) + "/s"
-                                    downloaded_str = format_bytes(downloaded_bytes)
-                                    total_str = format_bytes(total_bytes)
-                                    
-                                    status_text = "Скачивание файлов..."
-                                    progress.setLabelText(
-                                        f"{batch_prefix}{status_text}\n"
-                                        f"{downloaded_str} / {total_str} ({speed_str})"
-                                    )
-                        
-                        # Обновляем прогресс на основе текстовых сообщений
-                        elif "downloading" in line_lower:
-                            local_progress = base_progress + int(35 * progress_multiplier)
-                            if current_progress < local_progress:
-                                current_progress = local_progress
-                                progress.setValue(current_progress)
-                            if downloaded_bytes == 0:  # Если еще нет данных о размере
-                                status_text = "Скачивание файлов..."
-                                progress.setLabelText(f"{batch_prefix}{status_text}")
-                        elif "success" in line_lower:
-                            current_progress = base_progress + int(70 * progress_multiplier)
-                            progress.setValue(current_progress)
-                            status_text = "Проверка целостности..."
-                            progress.setLabelText(f"{batch_prefix}{status_text}")
-                
-                except queue.Empty:
-                    pass
-                
-                # Мониторим папки скачивания (проверяем каждые 0.5 сек для снижения нагрузки)
-                current_time = time.time()
-                if downloaded_bytes == 0 and current_time - last_folder_check >= 0.5:
                     try:
-                        folder_size = 0
-                        
-                        # Проверяем папку downloads (ограничиваем глубину поиска для скорости)
-                        if download_folder.exists():
-                            try:
-                                # Быстрый подсчет - только прямые файлы, без глубокой рекурсии
-                                folder_size = sum(f.stat().st_size for f in download_folder.iterdir() if f.is_file())
-                                # Если есть подпапки, проверяем их тоже (но не глубже)
-                                for subdir in download_folder.iterdir():
-                                    if subdir.is_dir():
-                                        folder_size += sum(f.stat().st_size for f in subdir.iterdir() if f.is_file())
-                            except:
-                                pass
-                        
-                        # Если в downloads пусто, проверяем content (файлы уже скачаны)
-                        if folder_size == 0 and content_folder.exists():
-                            try:
-                                folder_size = sum(f.stat().st_size for f in content_folder.iterdir() if f.is_file())
-                                for subdir in content_folder.iterdir():
-                                    if subdir.is_dir():
-                                        folder_size += sum(f.stat().st_size for f in subdir.iterdir() if f.is_file())
-                            except:
-                                pass
-                            
-                            if folder_size > 0 and not download_started:
-                                download_started = True
-                                progress.setLabelText(f"{batch_prefix}{get_text('extracting_files')}")
-                        
-                        # Обновляем статус в зависимости от размера
-                        if folder_size > 0:
-                            # Вычисляем скорость
-                            time_diff = current_time - last_folder_check
-                            if last_folder_size > 0 and time_diff > 0:
-                                size_diff = folder_size - last_folder_size
-                                folder_speed = size_diff / time_diff
-                                
-                                # Форматируем размеры
-                                def format_bytes(bytes_val):
-                                    if bytes_val < 1024:
-                                        return f"{bytes_val} B"
-                                    elif bytes_val < 1024 * 1024:
-                                        return f"{bytes_val / 1024:.2f} KB"
-                                    else:
-                                        return f"{bytes_val / (1024 * 1024):.2f} MB"
-                                
-                                size_str = format_bytes(folder_size)
-                                speed_str = format_bytes(folder_speed) + "/s" if folder_speed > 0 else ""
-                                
-                                if not download_started:
-                                    download_started = True
-                                    is_downloading = True
-                                
-                                if speed_str:
-                                    progress.setLabelText(
-                                        f"{batch_prefix}Скачивание файлов...\n"
-                                        f"{size_str} ({speed_str})"
-                                    )
+                        # Проверяем отмену
+                        if progress.wasCanceled():
+                            process.kill()
+                            progress.close()
+                            remove_tree_async(temp_dir)
+                            abort_download()
+                            return
+                
+                        # Забираем из pipe всё, что уже доступно, и делим на строки (\r тоже конец строки)
+                        available = _pipe_bytes_available(process.stdout)
+                        if available:
+                            pending_output += os.read(stdout_fd, available)
+                        *output_lines, pending_output = pending_output.replace(b'\r', b'\n').split(b'\n')
+                
+                        for line in output_lines:
+                            if not line.strip():
+                                continue
+                            line_lower = line.lower()  # bytes.lower - только ASCII, без декодирования
+                            line_kind = _classify_steamcmd_line(line_lower)
+                            line_text = line.decode(STEAMCMD_OUTPUT_ENCODING, 'replace').strip()
+                
+                            # Выводим все строки для отладки
+                            print(f"[SteamCMD] {line_text}")
+                
+                            # Проверяем критические ошибки
+                            if line_kind == 'fatal':
+                                # Проверяем ошибку нехватки места на диске (русские фразы - по декодированной строке)
+                                text_lower = line_text.lower()
+                                if b"250mb" in line_lower or b"disk space" in line_lower or "250мб" in text_lower or "свободного места" in text_lower:
+                                    process.kill()
+                                    progress.close_keeping_blur()
+                                    remove_tree_async(temp_dir)
+                
+                                    self.show_fatal_later(get_text("insufficient_disk_space"), get_text("steamcmd_disk_space_message"))
+                                    abort_download()
+                                    return
                                 else:
-                                    progress.setLabelText(
-                                        f"{batch_prefix}Скачивание файлов...\n"
-                                        f"{size_str}"
-                                    )
-                            elif folder_size > 0:
-                                # Первый раз видим файлы
-                                def format_bytes(bytes_val):
-                                    if bytes_val < 1024:
-                                        return f"{bytes_val} B"
-                                    elif bytes_val < 1024 * 1024:
-                                        return f"{bytes_val / 1024:.2f} KB"
+                                    # Другая критическая ошибка
+                                    error_msg = line_text
+                                    process.kill()
+                                    progress.close_keeping_blur()
+                                    remove_tree_async(temp_dir)
+                
+                                    if batch_info:
+                                        raise Exception(f"SteamCMD ошибка: {error_msg}")
                                     else:
-                                        return f"{bytes_val / (1024 * 1024):.2f} MB"
-                                
-                                size_str = format_bytes(folder_size)
-                                progress.setLabelText(
-                                    f"{batch_prefix}Скачивание файлов...\n"
-                                    f"{size_str}"
-                                )
-                            
-                            last_folder_size = folder_size
-                        else:
-                            # Folder is empty or doesn't exist - show waiting status
-                            if not download_started:
-                                # Считаем сколько времени прошло с начала
-                                elapsed = current_time - last_update_time
-                                if elapsed > 3:  # Если прошло больше 3 секунд
-                                    progress.setLabelText(f"{batch_prefix}{get_text('waiting_steamcmd_data')}")
-                        
-                        last_folder_check = current_time
-                    except Exception as e:
-                        print(f"[DEBUG] Ошибка мониторинга папки: {e}")
+                                        self.show_fatal_later(get_text("steamcmd_error_title"), get_text("steamcmd_critical_error", error=error_msg))
+                                        abort_download()
+                                        return
                 
-                # Принудительно обновляем UI чаще для плавности (каждые 50мс)
-                if current_time - last_ui_update >= 0.05:
-                    QApplication.processEvents()
-                    last_ui_update = current_time
+                            # Отслеживаем различные этапы
+                            if line_kind == 'connect':
+                                status_text = "Подключение к Steam..."
+                                progress.setLabelText(f"{batch_prefix}{status_text}")
+                            elif line_kind == 'login':
+                                status_text = "Авторизация..."
+                                progress.setLabelText(f"{batch_prefix}{status_text}")
+                            elif line_kind == 'wait':
+                                status_text = "Проверка мода..."
+                                progress.setLabelText(f"{batch_prefix}{status_text}")
+                            elif line_kind == 'download' and b"workshop" in line_lower:
+                                is_downloading = True
+                                status_text = "Скачивание файлов..."
+                                progress.setLabelText(f"{batch_prefix}{status_text}")
                 
-                # Небольшая задержка чтобы не нагружать CPU (уменьшена для плавности)
-                time.sleep(0.03)
-            
-            process.wait()
-            
-            progress.setValue(base_progress + int(72 * progress_multiplier))
-            progress.setLabelText(f"{batch_prefix}{get_text('finishing_download')}")
-            QApplication.processEvents()
-            
-            # Даем SteamCMD время переместить файлы
-            time.sleep(1)
-            
-            # Путь к скачанному моду
-            workshop_content = steamcmd_path / "steamapps" / "workshop" / "content" / "550" / addon_id
-            
-            print(f"[DEBUG] Проверка папки: {workshop_content}")
-            
-            # Умное ожидание: если есть активность скачивания - ждем 30 сек, иначе 3 минуты
-            wait_attempts = 0
-            max_wait_with_activity = 60  # 60 попыток × 0.5 сек = 30 секунд (если идет скачивание)
-            max_wait_no_activity = 360  # 360 попыток × 0.5 сек = 3 минуты (если нет активности)
-            last_check_time = time.time()
-            
-            # Проверяем альтернативные пути во время ожидания
-            workshop_downloads = steamcmd_path / "steamapps" / "workshop" / "downloads" / "550" / addon_id
-            
-            # Переменные для отслеживания активности
-            download_activity_detected = False
-            last_download_size = 0
-            no_activity_start = None
-            
-            while not workshop_content.exists():
-                elapsed_seconds = int(wait_attempts * 0.5)
+                            # Парсим вывод SteamCMD для получения реального прогресса
+                            # Формат: "Downloading item 123456 ... (X / Y bytes)"
+                            download_match = _BYTES_RE.search(line)
+                            if download_match:
+                                downloaded_bytes = int(download_match.group(1))
+                                total_bytes = int(download_match.group(2))
+                
+                                if total_bytes > 0:
+                                    # Вычисляем процент (30-70% диапазон для скачивания)
+                                    download_percent = (downloaded_bytes / total_bytes) * 40 + 30
+                                    # Учитываем batch прогресс
+                                    current_progress = base_progress + int(download_percent * progress_multiplier)
+                
+                                    # Вычисляем скорость
+                                    current_time = time.time()
+                                    time_diff = current_time - last_update_time
+                                    if time_diff >= 0.5:  # Обновляем скорость каждые 0.5 сек
+                                        bytes_diff = downloaded_bytes - last_downloaded
+                                        download_speed = bytes_diff / time_diff if time_diff > 0 else 0
+                                        last_downloaded = downloaded_bytes
+                                        last_update_time = current_time
+                
+                                        # Форматируем размеры
+                                        speed_str = _format_bytes(download_speed) + "/s"
+                                        downloaded_str = _format_bytes(downloaded_bytes)
+                                        total_str = _format_bytes(total_bytes)
+                
+                                        status_text = "Скачивание файлов..."
+                                        progress.setLabelText(
+                                            f"{batch_prefix}{status_text}\n"
+                                            f"{downloaded_str} / {total_str} ({speed_str})"
+                                        )
+                
+                            # Обновляем прогресс на основе текстовых сообщений
+                            elif line_kind == 'download':
+                                local_progress = base_progress + int(35 * progress_multiplier)
+                                if current_progress < local_progress:
+                                    current_progress = local_progress
+                                if downloaded_bytes == 0:  # Если еще нет данных о размере
+                                    status_text = "Скачивание файлов..."
+                                    progress.setLabelText(f"{batch_prefix}{status_text}")
+                            elif line_kind == 'success':
+                                current_progress = base_progress + int(70 * progress_multiplier)
+                                status_text = "Проверка целостности..."
+                                progress.setLabelText(f"{batch_prefix}{status_text}")
                 
-                # Проверяем, идет ли еще скачивание (есть ли активность в downloads)
-                download_activity = False
-                current_download_size = 0
+                        # Мониторим папки скачивания (проверяем каждые 0.5 сек для снижения нагрузки)
+                        current_time = time.time()
+                        if downloaded_bytes == 0 and current_time - folder_state['last_folder_check'] >= 0.5:
+                            folder_size = self._update_download_progress(progress, download_folder, content_folder, folder_state, batch_prefix)
                 
-                if workshop_downloads.exists():
-                    try:
-                        # Проверяем размер папки downloads
-                        current_download_size = sum(f.stat().st_size for f in workshop_downloads.rglob('*') if f.is_file())
-                        
-                        if current_download_size > 0:
-                            download_activity = True
-                            download_activity_detected = True
-                            
-                            # Проверяем, растет ли размер (идет ли активное скачивание)
-                            if current_download_size > last_download_size:
-                                no_activity_start = None  # Сбрасываем таймер неактивности
-                            elif no_activity_start is None:
-                                no_activity_start = time.time()  # Начинаем отсчет неактивности
-                            
-                            last_download_size = current_download_size
-                            
-                            # Форматируем размер
-                            def format_bytes(bytes_val):
-                                if bytes_val < 1024:
-                                    return f"{bytes_val} B"
-                                elif bytes_val < 1024 * 1024:
-                                    return f"{bytes_val / 1024:.2f} KB"
-                                else:
-                                    return f"{bytes_val / (1024 * 1024):.2f} MB"
-                            
-                            size_str = format_bytes(current_download_size)
-                            
-                            # Определяем максимальное время ожидания
-                            max_wait = max_wait_with_activity if download_activity_detected else max_wait_no_activity
-                            max_seconds = max_wait // 2
-                            
-                            progress.setLabelText(
-                                f"{batch_prefix}Скачивание в процессе...\n"
-                                f"Загружено: {size_str} (ожидание {elapsed_seconds}s / {max_seconds}s)"
-                            )
-                        else:
-                            # Папка downloads пустая
-                            max_wait = max_wait_with_activity if download_activity_detected else max_wait_no_activity
-                            max_seconds = max_wait // 2
-                            
-                            progress.setLabelText(
-                                f"{batch_prefix}Ожидание завершения скачивания...\n"
-                                f"({elapsed_seconds}s / {max_seconds}s)"
-                            )
+                            # Папка пустая или не существует - через 3 секунды показываем статус ожидания
+                            if folder_size == 0 and not folder_state['download_started'] and current_time - last_update_time > 3:
+                                progress.setLabelText(f"{batch_prefix}{get_text('waiting_steamcmd_data')}")
                     except Exception as e:
-                        print(f"[DEBUG] Ошибка проверки downloads: {e}")
-                        max_wait = max_wait_with_activity if download_activity_detected else max_wait_no_activity
-                        max_seconds = max_wait // 2
-                        
-                        progress.setLabelText(
-                            f"{batch_prefix}Ожидание завершения скачивания...\n"
-                            f"({elapsed_seconds}s / {max_seconds}s)"
-                        )
-                else:
-                    # Папка downloads не существует
-                    max_wait = max_wait_with_activity if download_activity_detected else max_wait_no_activity
-                    max_seconds = max_wait // 2
-                    
-                    progress.setLabelText(
-                        f"{batch_prefix}Ожидание завершения скачивания...\n"
-                        f"({elapsed_seconds}s / {max_seconds}s)"
-                    )
-                
-                # Определяем лимит ожидания в зависимости от активности
-                if download_activity_detected:
-                    # Если была обнаружена активность скачивания - ждем только 30 секунд
-                    current_max_wait = max_wait_with_activity
-                    
-                    # Дополнительная проверка: если размер не меняется более 10 секунд - прерываем
-                    if no_activity_start and (time.time() - no_activity_start) > 10:
-                        print(f"[DEBUG] Размер не меняется более 10 секунд, прерываем ожидание")
-                        break
-                else:
-                    # Если активности не было - ждем 3 минуты (мод может быть недоступен)
-                    current_max_wait = max_wait_no_activity
-                
-                # Проверяем превышение лимита
-                if wait_attempts >= current_max_wait:
-                    print(f"[DEBUG] Достигнут лимит ожидания: {wait_attempts} попыток ({elapsed_seconds}s)")
-                    break
+                        poll_result['error'] = e
+                        poll_loop.quit()
+                
+                # Полоса прогресса обновляется не чаще раза в 100 мс (значение копится в current_progress)
+                shown_progress = [None]
+                
+                def flush_download_progress():
+                    if current_progress != shown_progress[0]:
+                        shown_progress[0] = current_progress
+                        progress.setValue(current_progress)
+                
+                poll_timer = QTimer(self)
+                poll_timer.timeout.connect(poll_download_tick)
+                poll_timer.start(30)
+                progress_flush_timer = QTimer(self)
+                progress_flush_timer.timeout.connect(flush_download_progress)
+                progress_flush_timer.start(100)
+                poll_loop.exec()
+                poll_timer.stop()
+                poll_timer.deleteLater()
+                progress_flush_timer.stop()
+                progress_flush_timer.deleteLater()
+                flush_download_progress()
+                
+                if poll_result['error'] is not None:
+                    raise poll_result['error']
+                if poll_result['abort']:
+                    return
                 
-                print(f"[DEBUG] Папка не найдена, ожидание... ({wait_attempts + 1}/{current_max_wait}, {elapsed_seconds}s, активность: {download_activity})")
+                process.wait()
                 
-                time.sleep(0.5)
-                wait_attempts += 1
+                progress.setValue(base_progress + int(72 * progress_multiplier))
+                progress.setLabelText(f"{batch_prefix}{get_text('finishing_download')}")
                 QApplication.processEvents()
-                
-                # Проверяем отмену
-                if progress.wasCanceled():
-                    import shutil
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    return
+                # Перенос файлов SteamCMD дожидается _await_download_folder (без sleep в GUI-потоке)
+            
+            print(f"[DEBUG] Проверка папки: {content_folder}")
+            
+            # Ждем, пока SteamCMD перенесет мод в content (таймер и уведомления ФС, без sleep)
+            wait_result = self._await_download_folder(progress, download_folder, content_folder, workshop_root, batch_prefix)
+            if wait_result['canceled']:
+                remove_tree_async(temp_dir)
+                return
+            wait_attempts = wait_result['attempts']
             
-            if not workshop_content.exists():
+            if not content_folder.exists():
                 print(f"[DEBUG] Мод {addon_id} не найден после скачивания (ожидание {wait_attempts * 0.5}s)")
                 
                 # Детальная диагностика
                 diagnostic_info = []
                 
                 # Проверяем альтернативные пути (иногда SteamCMD сохраняет в downloads)
-                workshop_downloads = steamcmd_path / "steamapps" / "workshop" / "downloads" / "550" / addon_id
-                if workshop_downloads.exists():
+                if download_folder.exists():
                     print(f"[DEBUG] Мод найден в downloads, но не перемещен в content")
                     try:
-                        downloads_content = list(workshop_downloads.iterdir())
+                        downloads_content = list(download_folder.iterdir())
                         print(f"[DEBUG] Содержимое downloads: {downloads_content}")
                         
                         # Проверяем размер
-                        download_size = sum(f.stat().st_size for f in workshop_downloads.rglob('*') if f.is_file())
-                        def format_bytes(bytes_val):
-                            if bytes_val < 1024:
-                                return f"{bytes_val} B"
-                            elif bytes_val < 1024 * 1024:
-                                return f"{bytes_val / 1024:.2f} KB"
-                            else:
-                                return f"{bytes_val / (1024 * 1024):.2f} MB"
+                        download_size = _fast_tree_size(download_folder)
                         
                         if download_size > 0:
-                            diagnostic_info.append(f"• Найдены файлы в downloads ({format_bytes(download_size)})")
+                            diagnostic_info.append(f"• Найдены файлы в downloads ({_format_bytes(download_size)})")
                             diagnostic_info.append("• Возможно, скачивание не завершилось")
                         else:
                             diagnostic_info.append("• Папка downloads пустая")
@@ -8687,16 +9508,15 @@ class MainWindow(QMainWindow):
                 steamcmd_log = steamcmd_path / "logs" / "workshop_log.txt"
                 if steamcmd_log.exists():
                     try:
-                        with open(steamcmd_log, 'r', encoding='utf-8', errors='ignore') as f:
-                            log_lines = f.readlines()[-10:]  # Последние 10 строк
-                            for line in log_lines:
-                                if "error" in line.lower() or "failed" in line.lower():
-                                    diagnostic_info.append(f"• Лог: {line.strip()}")
+                        # Последние 10 строк; декодируем только строки с ошибками
+                        for line in _tail(steamcmd_log, 10):
+                            line_lower = line.lower()
+                            if b"error" in line_lower or b"failed" in line_lower:
+                                diagnostic_info.append(f"• Лог: {line.decode('utf-8', 'ignore').strip()}")
                     except:
                         pass
                 
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                remove_tree_async(temp_dir)
                 
                 # Формируем сообщение об ошибке
                 diagnostic_text = "\n".join(diagnostic_info) if diagnostic_info else "Нет дополнительной информации"
@@ -8715,9 +9535,8 @@ class MainWindow(QMainWindow):
                     # Определяем тип ошибки для более точного сообщения
                     if "downloads" in diagnostic_text and "MB" in diagnostic_text:
                         error_title = "Таймаут скачивания"
-                        # Определяем какой таймаут использовался
-                        timeout_used = max_wait_with_activity if download_activity_detected else max_wait_no_activity
-                        timeout_seconds = timeout_used // 2
+                        # Какой таймаут использовался
+                        timeout_seconds = wait_result['timeout_seconds']
                         
                         error_message = (
                             f"{get_text('download_timeout_seconds', addon_id=addon_id, timeout_seconds=timeout_seconds)}\n\n"
@@ -8744,12 +9563,12 @@ class MainWindow(QMainWindow):
                             f"{get_text('workshop_find_alternative')}"
                         )
                     
-                    QTimer.singleShot(350, lambda: CustomInfoDialog.information(
+                    CustomInfoDialog.information(
                         self,
                         error_title,
                         error_message,
                         use_existing_blur=True
-                    ))
+                    )
                     return
             
             progress.setValue(base_progress + int(75 * progress_multiplier))
@@ -8761,30 +9580,14 @@ class MainWindow(QMainWindow):
             addons_dir.mkdir(parents=True, exist_ok=True)
             
             # Ищем .vpk файлы (оптимизированный поиск - только 2 уровня)
-            vpk_files = []
-            try:
-                # Сначала проверяем корневую папку
-                vpk_files = [f for f in workshop_content.iterdir() if f.is_file() and f.suffix == '.vpk']
-                # Если не найдено, проверяем подпапки (1 уровень)
-                if not vpk_files:
-                    for subdir in workshop_content.iterdir():
-                        if subdir.is_dir():
-                            vpk_files.extend([f for f in subdir.iterdir() if f.is_file() and f.suffix == '.vpk'])
-            except:
-                pass
+            # Сначала корневая папка, если там нет - подпапки (1 уровень)
+            vpk_files = _find_by_ext(content_folder, '.vpk')
             
             print(f"[DEBUG] {get_text('found_vpk_files_debug', count=len(vpk_files))}")
             
             # Если .vpk не найдены, ищем .bin файлы (формат SteamCMD)
             if not vpk_files:
-                try:
-                    bin_files = [f for f in workshop_content.iterdir() if f.is_file() and f.suffix == '.bin']
-                    if not bin_files:
-                        for subdir in workshop_content.iterdir():
-                            if subdir.is_dir():
-                                bin_files.extend([f for f in subdir.iterdir() if f.is_file() and f.suffix == '.bin'])
-                except:
-                    bin_files = []
+                bin_files = _find_by_ext(content_folder, '.bin')
                 
                 if bin_files:
                     # .bin файлы - это на самом деле .vpk файлы, просто переименованные
@@ -8795,45 +9598,27 @@ class MainWindow(QMainWindow):
                     try:
                         all_files = []
                         total_size = 0
-                        file_types = {}
+                        file_types = collections.Counter()
                         
-                        # Собираем все файлы (до 30 штук для отображения)
-                        for item in workshop_content.rglob('*'):
-                            if item.is_file():
-                                file_size = item.stat().st_size
+                        # Типы считаем по всем файлам (только по имени, без stat),
+                        # размер запрашиваем лишь для первых 30 файлов, которые показываем
+                        for entry in _walk_scandir(content_folder):
+                            file_types[os.path.splitext(entry.name)[1].lower()] += 1
+                            
+                            if len(all_files) < 30:
+                                file_size = entry.stat(follow_symlinks=False).st_size
                                 total_size += file_size
                                 
-                                # Считаем типы файлов
-                                ext = item.suffix.lower()
-                                file_types[ext] = file_types.get(ext, 0) + 1
-                                
-                                # Форматируем размер
-                                def format_bytes(bytes_val):
-                                    if bytes_val < 1024:
-                                        return f"{bytes_val} B"
-                                    elif bytes_val < 1024 * 1024:
-                                        return f"{bytes_val / 1024:.1f} KB"
-                                    else:
-                                        return f"{bytes_val / (1024 * 1024):.1f} MB"
-                                
-                                # Относительный путь от workshop_content
-                                rel_path = item.relative_to(workshop_content)
-                                all_files.append(f"- {rel_path} ({format_bytes(file_size)})")
-                                
-                                if len(all_files) >= 30:
-                                    all_files.append("- ... (и другие)")
-                                    break
+                                # Относительный путь от content_folder
+                                rel_path = os.path.relpath(entry.path, content_folder)
+                                all_files.append(f"- {rel_path} ({_format_bytes(file_size, 1)})")
                         
-                        # Форматируем общий размер
-                        def format_bytes(bytes_val):
-                            if bytes_val < 1024:
-                                return f"{bytes_val} B"
-                            elif bytes_val < 1024 * 1024:
-                                return f"{bytes_val / 1024:.1f} KB"
-                            else:
-                                return f"{bytes_val / (1024 * 1024):.1f} MB"
+                        total_files = sum(file_types.values())
+                        if total_files > len(all_files):
+                            all_files.append("- ... (и другие)")
                         
-                        total_size_str = format_bytes(total_size)
+                        # Форматируем общий размер
+                        total_size_str = _format_bytes(total_size, 1)
                         
                         # Формируем статистику по типам файлов
                         file_types_str = ", ".join([f"{ext or '[без расширения]'}: {count}" for ext, count in sorted(file_types.items())])
@@ -8843,15 +9628,14 @@ class MainWindow(QMainWindow):
                             file_stats = ""
                         else:
                             file_list = "\n".join(all_files)
-                            file_stats = f"\n\nСтатистика:\n• Всего файлов: {len(all_files)}\n• Общий размер: {total_size_str}\n• Типы файлов: {file_types_str}"
+                            file_stats = f"\n\nСтатистика:\n• Всего файлов: {total_files}\n• Общий размер: {total_size_str}\n• Типы файлов: {file_types_str}"
                     except Exception as e:
                         file_list = f"Не удалось прочитать содержимое папки: {e}"
                         file_stats = ""
                     
                     print(f"[DEBUG] В моде {addon_id} не найдено VPK файлов. Файлы:\n{file_list}{file_stats}")
                     
-                    import shutil
-                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    remove_tree_async(temp_dir)
                     
                     # Если это batch скачивание - просто выбрасываем исключение
                     if batch_info:
@@ -8860,11 +9644,6 @@ class MainWindow(QMainWindow):
                         # Если одиночное скачивание - показываем ошибку
                         progress.close_keeping_blur()
                         
-                        # Небольшая задержка для плавности
-                        QApplication.processEvents()
-                        import time
-                        time.sleep(0.35)
-                        
                         # Определяем тип контента для более точного сообщения
                         if '.txt' in file_types or '.md' in file_types:
                             content_type = get_text("possibly_description")
@@ -8895,9 +9674,8 @@ class MainWindow(QMainWindow):
                         return
             
             # Копируем .vpk файлы
-            import re
             # Очищаем имя от всех недопустимых символов Windows
-            safe_name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', addon_name)
+            safe_name = _UNSAFE_WIN_CHARS.sub('_', addon_name)
             # Убираем точки в конце (Windows не разрешает)
             safe_name = safe_name.rstrip('. ')
             # Ограничиваем длину
@@ -8911,50 +9689,47 @@ class MainWindow(QMainWindow):
             QApplication.processEvents()
             
             copied_files = []
-            for i, vpk_file in enumerate(vpk_files):
-                # Показываем какой файл копируем
-                progress.setLabelText(f"{batch_prefix}{get_text('copying_files_progress', current=i+1, total=len(vpk_files))}")
-                QApplication.processEvents()
-                
-                if len(vpk_files) == 1:
-                    new_name = f"{safe_name}.vpk"
-                else:
-                    new_name = f"{safe_name}_{i+1}.vpk"
-                
-                dest_file = addons_dir / new_name
-                
-                # Если файл существует, добавляем суффикс
-                counter = 1
-                while dest_file.exists():
+            # Копии идут в пуле из 2 потоков: следующий файл копируется, пока GUI-поток обновляет прогресс
+            # Занятые имена читаем одним проходом os.scandir, конфликты разрешаем в памяти
+            with os.scandir(addons_dir) as entries:
+                existing_names = {entry.name for entry in entries}
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pending = {}
+                for i, vpk_file in enumerate(vpk_files):
                     if len(vpk_files) == 1:
-                        new_name = f"{safe_name}_{counter}.vpk"
+                        new_name = f"{safe_name}.vpk"
                     else:
-                        new_name = f"{safe_name}_{i+1}_{counter}.vpk"
+                        new_name = f"{safe_name}_{i+1}.vpk"
+                    
+                    # Если файл существует, добавляем суффикс
+                    counter = 1
+                    while new_name in existing_names:
+                        if len(vpk_files) == 1:
+                            new_name = f"{safe_name}_{counter}.vpk"
+                        else:
+                            new_name = f"{safe_name}_{i+1}_{counter}.vpk"
+                        counter += 1
+                    existing_names.add(new_name)
                     dest_file = addons_dir / new_name
-                    counter += 1
-                
-                import shutil
-                
-                # Получаем размер файла
-                file_size = vpk_file.stat().st_size
-                def format_bytes(bytes_val):
-                    if bytes_val < 1024:
-                        return f"{bytes_val} B"
-                    elif bytes_val < 1024 * 1024:
-                        return f"{bytes_val / 1024:.2f} KB"
-                    else:
-                        return f"{bytes_val / (1024 * 1024):.2f} MB"
-                
-                size_str = format_bytes(file_size)
-                progress.setLabelText(f"{batch_prefix}{get_text('copying_files_with_size', current=i+1, total=len(vpk_files), size=size_str)}")
-                
-                shutil.copy2(vpk_file, dest_file)
-                copied_files.append(new_name)
-                
-                # Обновляем прогресс для каждого файла с учетом batch
-                file_progress = 80 + (i + 1) / len(vpk_files) * 15
-                progress.setValue(base_progress + int(file_progress * progress_multiplier))
-                QApplication.processEvents()
+                    
+                    pending[executor.submit(_fast_copy, vpk_file, dest_file)] = (new_name, vpk_file.stat().st_size)
+                
+                while pending:
+                    finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        new_name, file_size = pending.pop(future)
+                        future.result()
+                        copied_files.append(new_name)
+                        
+                        size_str = _format_bytes(file_size)
+                        progress.setLabelText(f"{batch_prefix}{get_text('copying_files_with_size', current=len(copied_files), total=len(vpk_files), size=size_str)}")
+                        
+                        # Обновляем прогресс для каждого файла с учетом batch
+                        file_progress = 80 + len(copied_files) / len(vpk_files) * 15
+                        progress.setValue(base_progress + int(file_progress * progress_multiplier))
+                    
+                    QApplication.processEvents()
             
             progress.setValue(base_progress + int(95 * progress_multiplier))
             progress.setLabelText(f"{batch_prefix}{get_text('updating_list')}")
@@ -8977,31 +9752,24 @@ class MainWindow(QMainWindow):
                 # Если используем existing_progress, просто обновляем UI
                 QApplication.processEvents()
             
+            # Очищаем временные файлы
+            remove_tree_async(temp_dir)
+            
             # Показываем успешное сообщение только если это не массовое скачивание
             if show_success_message:
-                files_list = "\n".join(copied_files)
-                QTimer.singleShot(350, lambda: CustomInfoDialog.information(
+                CustomInfoDialog.information(
                     self,
                     get_text("success_title"),
-                    get_text("mod_download_success", name=addon_name, count=len(copied_files), path=str(dest_file.parent)),
-                    get_text("go_to_pirate_tab"),
+                    f"{get_text('mod_download_success', name=addon_name, count=len(copied_files), path=str(dest_file.parent))}\n\n"
+                    f"{get_text('go_to_pirate_tab')}",
                     use_existing_blur=True
-                ))
-            
-            # Очищаем временные файлы
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+                )
             
         except Exception as e:
             if 'progress' in locals():
                 # Закрываем прогресс только если это не batch или последний в batch
                 if not batch_info or batch_info[0] == batch_info[1]:
                     progress.close_keeping_blur()
-                    
-                    # Небольшая задержка для плавности
-                    QApplication.processEvents()
-                    import time
-                    time.sleep(0.35)
             
             # Формируем понятное сообщение об ошибке
             error_msg = str(e)
@@ -9023,15 +9791,31 @@ class MainWindow(QMainWindow):
                 # При batch просто выбрасываем исключение дальше
                 raise
     
+    def _batch_get_details(self, addon_ids):
+        """Данные модов из Steam API пакетами по STEAM_API_MAX_IDS ID за запрос: id -> details"""
+        details_by_id = {}
+        for batch_start in range(0, len(addon_ids), STEAM_API_MAX_IDS):
+            batch_ids = addon_ids[batch_start:batch_start + STEAM_API_MAX_IDS]
+            post_data = {'itemcount': len(batch_ids)}
+            for i, addon_id in enumerate(batch_ids):
+                post_data[f'publishedfileids[{i}]'] = addon_id
+            
+            try:
+                result = steam_api_request(post_data, timeout=10)
+            except Exception as e:
+                print(f"[DEBUG] Ошибка пакетного запроса к Steam API: {e}")
+                continue
+            
+            for details in result.get('response', {}).get('publishedfiledetails', []):
+                if details.get('result') == 1:
+                    details_by_id[details.get('publishedfileid')] = details
+        return details_by_id
+    
     def get_workshop_addon_info(self, addon_id):
         """Получает информацию об аддоне из Steam API"""
         try:
-            from urllib.request import urlopen
-            import json
-            
-            data = f"itemcount=1&publishedfileids[0]={addon_id}".encode('utf-8')
-            response = urlopen(STEAM_API_URL, data=data, timeout=5)
-            result = json.loads(response.read().decode('utf-8'))
+            # Общая keep-alive сессия: повторные запросы не открывают новое TLS соединение
+            result = steam_api_request({'itemcount': 1, 'publishedfileids[0]': addon_id}, timeout=5)
             
             if result.get('response', {}).get('publishedfiledetails'):
                 details = result['response']['publishedfiledetails'][0]
@@ -9054,64 +9838,57 @@ class MainWindow(QMainWindow):
     
     def get_collection_items(self, collection_id):
         """Получает список модов из коллекции Steam"""
+        cached = _collection_cache.get(collection_id)
+        if cached and time.time() - cached[0] < STEAM_COLLECTION_CACHE_TTL:
+            return cached[1]
+        
         try:
-            from urllib.request import urlopen
-            import json
-            
             print(f"[DEBUG] Запрос коллекции ID: {collection_id}")
             
-            # Сначала получаем информацию о коллекции
-            data = f"itemcount=1&publishedfileids[0]={collection_id}".encode('utf-8')
-            response = urlopen(STEAM_API_URL, data=data, timeout=10)
-            result = json.loads(response.read().decode('utf-8'))
+            # Состав коллекции - одним запросом GetCollectionDetails
+            result = steam_api_request(
+                {'collectioncount': 1, 'publishedfileids[0]': collection_id},
+                timeout=10,
+                url=STEAM_COLLECTION_API_URL
+            )
             
-            print(f"[DEBUG] Ответ API: {json.dumps(result, indent=2, ensure_ascii=False)[:1000]}")
+            if DEBUG:
+                print(f"[DEBUG] Ответ API: {_dumps(result, indent=True)[:1000].decode('utf-8', 'ignore')}")
             
-            if result.get('response', {}).get('publishedfiledetails'):
-                details = result['response']['publishedfiledetails'][0]
+            collection_details = result.get('response', {}).get('collectiondetails') or [{}]
+            children = collection_details[0].get('children', [])
+            print(f"[DEBUG] Количество children: {len(children)}")
+            
+            if not children:
+                # Обычный мод, а не коллекция
+                collection_info = None
+            else:
+                # Извлекаем ID модов
+                addon_ids = [child.get('publishedfileid') for child in children if child.get('publishedfileid')]
                 
-                print(f"[DEBUG] Тип файла: {details.get('file_type', 'unknown')}")
-                print(f"[DEBUG] Consumer app id: {details.get('consumer_app_id', 'unknown')}")
-                print(f"[DEBUG] Количество children: {len(details.get('children', []))}")
+                # Название коллекции (названия самих модов download_multiple_addons получит пакетно)
+                details = self.get_workshop_addon_info(collection_id)
+                collection_title = details.get('title', f'Коллекция {collection_id}')
                 
-                # Проверяем что это коллекция
-                # file_type может быть 0 (коллекция) или другое значение
-                if details.get('result') == 1:
-                    # Получаем список дочерних элементов
-                    children = details.get('children', [])
-                    
-                    print(f"[DEBUG] Children: {children[:5]}")  # Первые 5 для отладки
-                    
-                    if children and len(children) > 0:
-                        # Извлекаем ID модов
-                        addon_ids = [child.get('publishedfileid') for child in children if child.get('publishedfileid')]
-                        collection_title = details.get('title', f'Коллекция {collection_id}')
-                        
-                        print(f"[DEBUG] Найдено модов в коллекции: {len(addon_ids)}")
-                        
-                        return {
-                            'title': collection_title,
-                            'addon_ids': addon_ids,
-                            'count': len(addon_ids)
-                        }
-                    else:
-                        print(f"[DEBUG] Нет children, возможно это не коллекция")
-                        # Пробуем альтернативный метод - парсинг HTML
-                        return self.get_collection_items_from_html(collection_id)
+                print(f"[DEBUG] Найдено модов в коллекции: {len(addon_ids)}")
+                
+                collection_info = {
+                    'title': collection_title,
+                    'addon_ids': addon_ids,
+                    'count': len(addon_ids)
+                }
         except Exception as e:
-            import traceback
             print(f"[DEBUG] Ошибка при получении коллекции через API: {e}")
             print(f"[DEBUG] Traceback: {traceback.format_exc()}")
             # Пробуем альтернативный метод
             return self.get_collection_items_from_html(collection_id)
         
-        return None
+        _collection_cache[collection_id] = (time.time(), collection_info)
+        return collection_info
     
     def get_collection_items_from_html(self, collection_id):
         """Получает список модов из коллекции парсингом HTML страницы"""
         try:
-            from urllib.request import urlopen, Request
-            import re
             
             print(f"[DEBUG] Пробуем получить коллекцию через HTML парсинг")
             
@@ -9119,25 +9896,40 @@ class MainWindow(QMainWindow):
             url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={collection_id}"
             headers = {'User-Agent': 'Mozilla/5.0'}
             request = Request(url, headers=headers)
-            response = urlopen(request, timeout=10)
-            html = response.read().decode('utf-8')
             
-            # Ищем все ID модов в коллекции
+            # Читаем страницу блоками по 16 КБ и сразу собираем ID в множество (без копии всей страницы)
             # Формат: sharedfiles/filedetails/?id=XXXXXXXXX
-            pattern = r'sharedfiles/filedetails/\?id=(\d+)'
-            matches = re.findall(pattern, html)
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+            seen_ids = set()
+            collection_title = None
+            tail = ''
+            with urlopen(request, timeout=10) as response:
+                while True:
+                    chunk = response.read(16384)
+                    text = tail + decoder.decode(chunk, final=not chunk)
+                    for match in _WORKSHOP_ID_RE.finditer(text):
+                        # Совпадение на самом краю блока может быть обрезано - его найдем в следующем
+                        if chunk and match.end() == len(text):
+                            continue
+                        seen_ids.add(match.group(1))
+                    if collection_title is None:
+                        title_match = _WORKSHOP_TITLE_RE.search(text)
+                        if title_match:
+                            collection_title = title_match.group(1)
+                    if not chunk:
+                        break
+                    # Хвост блока переносим в следующий, чтобы не терять совпадения на границе
+                    tail = text[-512:]
             
-            # Убираем дубликаты и сам ID коллекции
-            addon_ids = list(set(matches))
-            if collection_id in addon_ids:
-                addon_ids.remove(collection_id)
+            # Убираем сам ID коллекции
+            seen_ids.discard(collection_id)
+            addon_ids = list(seen_ids)
             
             print(f"[DEBUG] Найдено модов через HTML: {len(addon_ids)}")
             
             if addon_ids:
-                # Пытаемся получить название коллекции
-                title_match = re.search(r'<div class="workshopItemTitle">([^<]+)</div>', html)
-                collection_title = title_match.group(1) if title_match else f'Коллекция {collection_id}'
+                if collection_title is None:
+                    collection_title = f'Коллекция {collection_id}'
                 
                 return {
                     'title': collection_title,
@@ -9145,7 +9937,6 @@ class MainWindow(QMainWindow):
                     'count': len(addon_ids)
                 }
         except Exception as e:
-            import traceback
             print(f"[DEBUG] Ошибка при HTML парсинге: {e}")
             print(f"[DEBUG] Traceback: {traceback.format_exc()}")
         
@@ -9197,11 +9988,12 @@ class MainWindow(QMainWindow):
         if not reply:
             return
         
-        # Удаляем старую установку
+        # Удаляем старую установку (в фоне средствами ОС)
         try:
-            import shutil
+            self._steamcmd_exe_cached = None
             if steamcmd_path.exists():
-                shutil.rmtree(steamcmd_path)
+                # Ждем завершения удаления, не блокируя GUI
+                _wait_future(_fast_rmtree(steamcmd_path))
         except Exception as e:
             CustomInfoDialog.information(
                 self,
@@ -9230,11 +10022,11 @@ class MainWindow(QMainWindow):
         if not reply:
             return
         
-        # Удаляем
+        # Удаляем в фоне, но успех показываем только после завершения удаления
         try:
-            import shutil
+            self._steamcmd_exe_cached = None
             if steamcmd_path.exists():
-                shutil.rmtree(steamcmd_path)
+                _wait_future(_fast_rmtree(steamcmd_path))
             
             CustomInfoDialog.information(
                 self,
@@ -9284,11 +10076,10 @@ class MainWindow(QMainWindow):
             
             # После закрытия настроек SteamCMD убираем blur перед возвратом
             # Проверяем есть ли blur на главном окне или центральном виджете
-            if self.graphicsEffect():
-                self.setGraphicsEffect(None)
+            hide_shared_blur_effect(self)
             central_widget = self.centralWidget()
-            if central_widget and central_widget.graphicsEffect():
-                central_widget.setGraphicsEffect(None)
+            if central_widget:
+                hide_shared_blur_effect(central_widget)
             
             # Если пользователь нажал "Отмена" в настройках SteamCMD, просто возвращаемся
             # Не показываем диалог снова
@@ -9302,8 +10093,7 @@ class MainWindow(QMainWindow):
                 return
             
             # Извлекаем ID из ссылки или используем как есть
-            import re
-            match = re.search(r'id=(\d+)', url)
+            match = _URL_ID_RE.search(url)
             if match:
                 addon_id = match.group(1)
             elif url.strip().isdigit():
@@ -9316,7 +10106,6 @@ class MainWindow(QMainWindow):
             try:
                 self.auto_download_workshop_addon(addon_id, use_existing_blur=True)
             except Exception as e:
-                import traceback
                 error_msg = f"Ошибка при скачивании:\n{str(e)}\n\n{traceback.format_exc()}"
                 print(error_msg)
                 CustomInfoDialog.information(self, get_text("error_title"), get_text("unexpected_error", error=str(e)), use_existing_blur=True, icon_type="error")
@@ -9335,8 +10124,7 @@ class MainWindow(QMainWindow):
             self.download_multiple_addons(urls)
         else:
             # Одна ссылка
-            import re
-            match = re.search(r'id=(\d+)', urls)
+            match = _URL_ID_RE.search(urls)
             if match:
                 addon_id = match.group(1)
             elif urls.strip().isdigit():
@@ -9366,11 +10154,6 @@ class MainWindow(QMainWindow):
                 
                 check_progress.close_keeping_blur()
                 
-                # Небольшая задержка для плавности
-                QApplication.processEvents()
-                import time
-                time.sleep(0.1)
-                
                 if collection_info and collection_info.get('count', 0) > 0:
                     # Это коллекция - показываем подтверждение с блюром
                     dialog = CustomConfirmDialog(
@@ -9402,15 +10185,12 @@ class MainWindow(QMainWindow):
                     # Если отказались, просто закрываем блюр
                     else:
                         # Закрываем блюр
-                        if hasattr(self, 'blur_effect') and self.blur_effect:
-                            self.blur_effect.deleteLater()
-                            self.blur_effect = None
+                        hide_shared_blur_effect(self)
                 else:
                     # Это обычный мод - скачиваем
                     self.auto_download_workshop_addon(addon_id, use_existing_blur=True)
                     
             except Exception as e:
-                import traceback
                 error_msg = f"Ошибка при проверке контента:\n{str(e)}\n\n{traceback.format_exc()}"
                 print(error_msg)
                 
@@ -9430,12 +10210,11 @@ class MainWindow(QMainWindow):
     
     def download_multiple_addons(self, urls):
         """Скачивает несколько аддонов из списка ссылок"""
-        import re
         
         # Извлекаем ID из всех ссылок
         addon_ids = []
         for url in urls:
-            match = re.search(r'id=(\d+)', url)
+            match = _URL_ID_RE.search(url)
             if match:
                 addon_ids.append(match.group(1))
             elif url.strip().isdigit():
@@ -9445,11 +10224,37 @@ class MainWindow(QMainWindow):
             CustomInfoDialog.information(self, get_text("error_title"), get_text("no_valid_links_error"), icon_type="error")
             return
         
+        # Убираем повторы (пересекающиеся коллекции, одна ссылка дважды), сохраняя порядок
+        total_ids = len(addon_ids)
+        addon_ids = list(dict.fromkeys(addon_ids))
+        duplicates = total_ids - len(addon_ids)
+        
+        # Моды, уже установленные через Steam Workshop (workshop/ID.vpk), можно не скачивать
+        installed_ids = []
+        if self.workshop_path and self.workshop_path.is_dir():
+            with os.scandir(self.workshop_path) as entries:
+                workshop_names = {entry.name for entry in entries}
+            installed_ids = [aid for aid in addon_ids if f"{aid}.vpk" in workshop_names]
+        if installed_ids:
+            skip_installed = CustomConfirmDialog.question(
+                self,
+                get_text("skip_installed_title"),
+                get_text("skip_installed_message", count=len(installed_ids))
+            )
+            if skip_installed:
+                installed = set(installed_ids)
+                addon_ids = [aid for aid in addon_ids if aid not in installed]
+                if not addon_ids:
+                    return
+        
         # Показываем подтверждение
+        message = get_text("download_multiple_message", count=len(addon_ids))
+        if duplicates:
+            message = f"{get_text('duplicates_removed', count=duplicates)}\n\n{message}"
         reply = CustomConfirmDialog.question(
             self,
             get_text("download_multiple_title"),
-            get_text("download_multiple_message", count=len(addon_ids))
+            message
         )
         
         if not reply:
@@ -9467,7 +10272,17 @@ class MainWindow(QMainWindow):
         progress.show()
         QApplication.processEvents()
         
-        # Скачиваем все моды по очереди
+        # Названия всех модов - одним запросом на каждые 100 ID, а не запросом на каждый мод
+        progress.setLabelText(get_text("getting_mod_info"))
+        details_by_id = self._batch_get_details(addon_ids)
+        
+        # Сначала скачиваем всю серию одним процессом SteamCMD (один логин вместо N)
+        downloaded_ids = self.auto_download_workshop_batch(addon_ids, progress)
+        if downloaded_ids is None:
+            progress.close()
+            return
+        
+        # Копируем скачанные моды по очереди; не скачанные общим процессом - качаем по одному
         success_count = 0
         failed_count = 0
         failed_mods = []  # Список неудачных модов с причинами
@@ -9487,7 +10302,9 @@ class MainWindow(QMainWindow):
                     use_existing_blur=True,  # Всегда True т.к. прогресс уже создан
                     show_success_message=False,
                     batch_info=(i + 1, len(addon_ids)),  # (текущий, всего)
-                    existing_progress=progress  # Передаем существующий прогресс
+                    existing_progress=progress,  # Передаем существующий прогресс
+                    predownloaded=addon_id in downloaded_ids,
+                    addon_info=details_by_id.get(addon_id)  # None - запросит сам
                 )
                 success_count += 1
             except Exception as e:
@@ -9499,11 +10316,6 @@ class MainWindow(QMainWindow):
         # Закрываем прогресс-диалог
         progress.close_keeping_blur()
         
-        # Небольшая задержка для плавности
-        QApplication.processEvents()
-        import time
-        time.sleep(0.35)
-        
         # Показываем итоговое сообщение
         result_msg = get_text("download_completed", success=success_count, failed=failed_count if failed_count > 0 else 0)
         
@@ -9513,31 +10325,64 @@ class MainWindow(QMainWindow):
         """Фильтрует аддоны по поисковому запросу (быстрая версия)"""
         search_text = search_text.lower()
         
+        # Поиск идет по всему списку - размещаем карточки, которые ещё не были созданы
+        if search_text and self._rendered_count < len(self._sorted_addons):
+            self._append_card_batch(len(self._sorted_addons))
+        
         visible_count = 0
         enabled_count = 0
         
-        # Просто скрываем/показываем существующие карточки
-        for i in range(self.addons_layout.count() - 1):  # -1 чтобы не трогать spacer
-            widget = self.addons_layout.itemAt(i).widget()
-            if isinstance(widget, AnimatedCard):
-                addon = widget.addon
-                # Проверяем совпадение
-                matches = (search_text in addon['name'].lower() or 
-                          search_text in addon.get('description', '').lower())
-                
-                widget.setVisible(matches)
-                
-                if matches:
-                    visible_count += 1
-                    if addon.get('enabled'):
-                        enabled_count += 1
+        container = self.addons_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            if not search_text:
+                # Показываем только те карточки, которые скрыл предыдущий поиск
+                if self._filter_matched is not None:
+                    for i, card in enumerate(self._idx_to_card):
+                        if i not in self._filter_matched:
+                            card.setVisible(True)
+                    self._filter_matched = None
+            else:
+                if self._trigrams is None:
+                    self._build_search_index()
+                cards = self._idx_to_card
+                
+                # Кандидаты - пересечение списков триграмм запроса (для коротких запросов - все)
+                if len(search_text) >= 3:
+                    postings = sorted(
+                        (self._trigrams.get(search_text[j:j + 3], set()) for j in range(len(search_text) - 2)),
+                        key=len
+                    )
+                    candidates = set.intersection(*postings)
+                else:
+                    candidates = range(len(cards))
+                
+                # Проверяем совпадение (по заранее приведенным к нижнему регистру строкам)
+                matched = {i for i in candidates
+                           if search_text in cards[i]._name_lc or search_text in cards[i]._desc_lc}
+                
+                # setVisible вызываем только для карточек, чья видимость изменилась
+                previous = self._filter_matched
+                if previous is None:
+                    previous = range(len(cards))
+                for i in previous:
+                    if i not in matched:
+                        cards[i].setVisible(False)
+                for i in matched:
+                    if self._filter_matched is not None and i not in self._filter_matched:
+                        cards[i].setVisible(True)
+                self._filter_matched = matched
+                
+                visible_count = len(matched)
+                enabled_count = sum(1 for i in matched if cards[i].addon.get('enabled'))
+        finally:
+            container.setUpdatesEnabled(True)
         
         # Обновляем счетчик
         if search_text:
             counter_text = get_text("counter_found", visible=visible_count, enabled=enabled_count)
         else:
-            total = sum(1 for a in self.addons if a.get('enabled'))
-            counter_text = get_text("addons_counter", total=len(self.addons), enabled=total)
+            counter_text = get_text("addons_counter", total=len(self.addons), enabled=self._enabled_count)
         
         # Используем вспомогательную функцию для установки текста
         self.set_counter_text(self.counter, counter_text)
@@ -9549,20 +10394,22 @@ class MainWindow(QMainWindow):
         visible_count = 0
         enabled_count = 0
         
-        # Просто скрываем/показываем существующие карточки
-        for i in range(self.pirate_addons_layout.count() - 1):  # -1 чтобы не трогать spacer
-            widget = self.pirate_addons_layout.itemAt(i).widget()
-            if isinstance(widget, PirateAddonCard):
-                addon = widget.addon_data
+        # Просто скрываем/показываем существующие карточки (перерисовка - один раз после цикла)
+        container = self.pirate_addons_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            for widget in self._pirate_cards:
                 # Проверяем совпадение по имени
-                matches = search_text in addon['name'].lower()
+                matches = search_text in widget._name_lc
                 
                 widget.setVisible(matches)
                 
                 if matches:
                     visible_count += 1
-                    if addon.get('enabled'):
+                    if widget.addon_data.get('enabled'):
                         enabled_count += 1
+        finally:
+            container.setUpdatesEnabled(True)
         
         # Обновляем счетчик
         if search_text:
@@ -9602,8 +10449,8 @@ class MainWindow(QMainWindow):
         """Загрузка конфигурации"""
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    config = _loads(f.read())
                     if 'game_folder' in config:
                         self.game_folder = Path(config['game_folder'])
                         if hasattr(self, 'path_input'):
@@ -9660,9 +10507,19 @@ class MainWindow(QMainWindow):
         else:
             print(f"🌍 save_config: No current_language attribute")
         
+        # Компактный JSON (через orjson, если он есть)
+        payload = _dumps(config)
+        payload_hash = hash(payload)
+        # Ничего не изменилось с прошлого сохранения - не трогаем диск
+        if payload_hash == getattr(self, '_last_saved_config_hash', None):
+            return
+        
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            # Пишем во временный файл и атомарно подменяем (конфиг не повредится при сбое записи)
+            tmp_file = CONFIG_FILE.with_suffix('.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._last_saved_config_hash = payload_hash
         except Exception as e:
             print(f"Ошибка сохранения конфига: {e}")
     
@@ -9700,7 +10557,8 @@ class MainWindow(QMainWindow):
     
     def auto_detect_paths(self):
         """Автоопределение путей Steam"""
-        possible_paths = [
+        # Библиотеки Steam из реестра и libraryfolders.vdf; стандартные пути - только если Steam не найден
+        possible_paths = _steam_game_paths() or [
             Path("C:/Program Files (x86)/Steam/steamapps/common/Left 4 Dead 2"),
             Path("D:/Steam/steamapps/common/Left 4 Dead 2"),
             Path("E:/Steam/steamapps/common/Left 4 Dead 2"),
@@ -9721,12 +10579,16 @@ class MainWindow(QMainWindow):
             self.update_checker = StandardUpdateChecker(self)
             self.update_checker.update_available.connect(self.show_standard_update_dialog)
             
+            # Тихая проверка - связанный метод через partial, без лямбды, захватывающей окно
+            self._check_silent = functools.partial(self.update_checker.check_for_updates, silent=True)
+            
             # Автоматическая проверка обновлений при запуске (через 30 секунд)
-            QTimer.singleShot(30000, lambda: self.update_checker.check_for_updates(silent=True))
+            QTimer.singleShot(30000, self._check_silent)
             
-            # Периодическая проверка обновлений каждые 24 часа
-            self.update_timer = QTimer()
-            self.update_timer.timeout.connect(lambda: self.update_checker.check_for_updates(silent=True))
+            # Периодическая проверка обновлений каждые 24 часа (точность не важна - ОС может объединять пробуждения)
+            self.update_timer = QTimer(self)
+            self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+            self.update_timer.timeout.connect(self._check_silent)
             self.update_timer.start(24 * 60 * 60 * 1000)  # 24 часа
     
     def check_for_updates(self):
@@ -9744,23 +10606,7 @@ class MainWindow(QMainWindow):
                 "• update_config.py"
             )
             msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #2d2d2d;
-                    color: white;
-                }
-                QMessageBox QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #5dade2;
-                }
-            """)
+            msg.setStyleSheet(UPDATE_ERROR_MSG_CSS)
             msg.exec()
     
     def show_standard_update_dialog(self, version_info):
@@ -9780,7 +10626,6 @@ class MainWindow(QMainWindow):
                 # Если система обновлений недоступна, используем стандартный URL
                 github_url = "https://github.com/your-username/l4d2-addon-manager"
             
-            import webbrowser
             webbrowser.open(github_url)
             
         except Exception as e:
@@ -9797,22 +10642,34 @@ class MainWindow(QMainWindow):
             )
 
     def apply_dark_styles(self):
-        """Применяет темную тему"""
-        self.setStyleSheet(DARK_STYLES)
+        """Применяет общие стили темной темы (стили шапки, карточек и вкладок задаются на их контейнерах)"""
+        app = QApplication.instance()
+        dark_styles = load_stylesheet("dark.qss")
+        if app.styleSheet() != dark_styles:
+            app.setStyleSheet(dark_styles)
     
     def closeEvent(self, event):
         """При закрытии программы проверяем gameinfo.txt"""
-        # Проверяем синхронизацию перед закрытием
-        self.check_gameinfo_sync()
+        # Проверяем синхронизацию перед закрытием (только если что-то менялось после последней проверки)
+        if self._dirty_gameinfo:
+            self.check_gameinfo_sync()
+        
+        # Фоновые запросы к Steam API больше не нужны; удаление временных папок (remove_tree_async)
+        # идет в глобальном QThreadPool, который Qt дожидается при выходе
+        self._addon_info_pool.shutdown(wait=False, cancel_futures=True)
+        close_steam_session()
         event.accept()
 
 
 class PirateAddonCard(QFrame):
     """Карточка мода для пиратки с анимациями"""
     
+    _cached_fm = None  # Общая метрика шрифта названия (одинакова для всех карточек)
+    
     def __init__(self, addon_data, index, parent=None, two_column_mode=False):
         super().__init__(parent)
         self.addon_data = addon_data
+        self._name_lc = addon_data['name'].lower()
         self.index = index
         self.parent_window = parent
         self.two_column_mode = two_column_mode
@@ -9849,8 +10706,10 @@ class PirateAddonCard(QFrame):
         # Индикатор статуса
         indicator = QLabel("●")
         indicator.setObjectName("statusIndicator")
+        self.status_indicator = indicator  # Прямая ссылка, чтобы не искать через findChildren
         indicator.setAutoFillBackground(False)
-        indicator.setStyleSheet(f"color: {'#3498db' if self.addon_data['enabled'] else '#95a5a6'}; font-size: 16px; background: transparent; border: none;")
+        # Цвет задается правилами #statusIndicator[enabled_state=...] в cards.qss
+        indicator.setProperty("enabled_state", bool(self.addon_data['enabled']))
         
         # Информация о файле - с центрированием через stretch
         info_layout = QVBoxLayout()
@@ -9880,14 +10739,17 @@ class PirateAddonCard(QFrame):
             # 460 (ширина карточки) - 12*2 (margins) - 45 (icon) - 16 (indicator) - 60 (toggle) - 30 (delete) - 12*4 (spacing) = ~230
             name_label.setMaximumWidth(230)
             
-            # Создаем метрику шрифта для обрезки текста
-            font_metrics = name_label.fontMetrics()
-            elided_text = font_metrics.elidedText(self.addon_data['name'], Qt.TextElideMode.ElideRight, 230)
-            name_label.setText(elided_text)
-            name_label.setToolTip(self.addon_data['name'])  # Показываем полное название в подсказке
-        else:
-            # В режиме 1 столбца показываем полное название
-            name_label.setText(self.addon_data['name'])
+            # Короткие названия заведомо помещаются - метрика шрифта не нужна
+            name = self.addon_data['name']
+            if len(name) > 20:
+                font_metrics = PirateAddonCard._cached_fm
+                if font_metrics is None:
+                    font_metrics = PirateAddonCard._cached_fm = name_label.fontMetrics()
+                elided_text = font_metrics.elidedText(name, Qt.TextElideMode.ElideRight, 230)
+                if elided_text != name:
+                    name_label.setText(elided_text)
+                    name_label.setToolTip(name)  # Показываем полное название в подсказке
+        # В режиме 1 столбца показываем полное название (уже задано в конструкторе QLabel)
         
         title_layout.addWidget(name_label, 1)
         info_layout.addLayout(title_layout)
@@ -9895,7 +10757,7 @@ class PirateAddonCard(QFrame):
         # Цвет текста для темной темы
         text_color = "#d0d0d0"
         
-        size_mb = self.addon_data['path'].stat().st_size / (1024 * 1024)
+        size_mb = self.addon_data['size_bytes'] / (1024 * 1024)
         size_label = QLabel()
         size_label.setTextFormat(Qt.TextFormat.RichText)
         
@@ -9927,7 +10789,6 @@ class PirateAddonCard(QFrame):
         try:
             self.parent_window.delete_pirate_addon(self.addon_data['path'])
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             print(f"[ERROR] Failed to delete addon: {error_details}")
             try:
@@ -9979,670 +10840,23 @@ class PirateAddonCard(QFrame):
         self.scale_anim.start()
 
 
-DARK_STYLES = """
-QMainWindow {
-    background: #0a0a0a;
-}
-
-#header {
-    background: #0f0f0f;
-    border-bottom: 1px solid #1a1a1a;
-}
-
-#headerTitle {
-    font-size: 18px;
-    font-weight: 500;
-    color: white;
-    letter-spacing: 0.5px;
-    width: 350px;
-    max-width: 350px;
-    min-width: 350px;
-    text-overflow: visible;
-    overflow: visible;
-}
-
-#donateButton {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #3498db, stop:1 #2980b9);
-    border: none;
-    border-radius: 20px;
-    color: white;
-    padding: 6px 12px;
-    font-size: 11px;
-    font-weight: 600;
-}
-
-#donateButton:hover {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #5dade2, stop:1 #3498db);
-}
-
-#donateButton:pressed {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #2980b9, stop:1 #21618c);
-}
-
-#updateButton {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #bb86fc, stop:0.5 #9333ea, stop:1 #7c3aed);
-    border: none;
-    border-radius: 20px;
-    color: white;
-    padding: 5px 10px;
-    font-size: 11px;
-    font-weight: 600;
-}
-
-#updateButton:hover {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #d1a7ff, stop:0.5 #bb86fc, stop:1 #9333ea);
-}
-
-#updateButton:pressed {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #9333ea, stop:0.5 #7c3aed, stop:1 #6b21a8);
-}
-
-#githubButton {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #4a5568, stop:0.5 #2d3748, stop:1 #1a202c);
-    border: none;
-    border-radius: 20px;
-    color: white;
-    padding: 5px 10px;
-    font-size: 11px;
-    font-weight: 600;
-}
-
-#githubButton:hover {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #718096, stop:0.5 #4a5568, stop:1 #2d3748);
-}
-
-#githubButton:pressed {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #2d3748, stop:0.5 #1a202c, stop:1 #171923);
-}
-
-#telegramButton {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #0088cc, stop:0.5 #0088cc, stop:1 #006699);
-    border: none;
-    border-radius: 16px;  /* Круглая кнопка (половина от размера 32px) */
-    color: white;
-    font-weight: 600;
-    font-size: 12px;
-}
-
-#telegramButton:hover {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #33aadd, stop:0.5 #0099dd, stop:1 #0088cc);
-}
-
-#telegramButton:pressed {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #006699, stop:0.5 #005577, stop:1 #004466);
-}
-
-#workshopBtn {
-    background: transparent;
-    border: 1px solid #9b59b6;
-    border-radius: 22px;
-    color: #9b59b6;
-    font-size: 10px;
-    font-weight: 500;
-}
-
-#workshopBtn:hover {
-    background: #9b59b6;
-    color: white;
-    border: 1px solid #af7ac5;
-}
-
-#reloadBtn {
-    background: transparent;
-    border: 1px solid #e67e22;
-    border-radius: 22px;
-    color: #e67e22;
-    font-size: 13px;
-    font-weight: 500;
-}
-
-#reloadBtn:hover {
-    background: #e67e22;
-    color: white;
-    border: 1px solid #f39c12;
-}
-
-#reloadBtn:pressed {
-    background: #d35400;
-    border: 1px solid #e67e22;
-}
-
-#tabBtn {
-    background: transparent;
-    border: none;
-    border-bottom: 2px solid transparent;
-    border-radius: 0px;
-    color: #7f8c8d;
-    padding: 12px 25px;
-    margin: 0 5px;
-    font-size: 11px;
-    font-weight: 500;
-    letter-spacing: 1px;
-}
-
-#tabBtn:checked {
-    background: transparent;
-    border-bottom: 2px solid #3498db;
-    color: white;
-}
-
-#tabBtn:hover {
-    background: transparent;
-    color: #bdc3c7;
-}
-
-#searchBox {
-    background: #2a2a2a;
-    border: 2px solid transparent;
-    border-radius: 20px;
-    padding: 0px 20px;
-    color: #d0d0d0;
-    font-size: 13px;
-    font-weight: 400;
-    height: 41px;
-    max-height: 41px;
-    min-height: 41px;
-}
-
-#searchBox:focus {
-    border: 2px solid #3498db;
-    background: #2d2d2d;
-}
-
-#clearSearchBtn {
-    background: transparent;
-    border: none;
-    color: #7f8c8d;
-    font-size: 16px;
-    font-weight: 300;
-    padding: 0px;
-    margin: 2px;
-}
-
-#clearSearchBtn:hover {
-    background: transparent;
-}
-
-#clearSearchBtn:pressed {
-    background: transparent;
-}
-
-#clearSearchBtn:focus {
-    outline: none;
-    border: none;
-}
-
-#sortCombo {
-    background: #1a1a1a;
-    border: 1px solid #2a2a2a;
-    border-radius: 10px;
-    padding: 10px 15px 10px 45px;
-    color: #d0d0d0;
-    font-size: 13px;
-    font-weight: 500;
-}
-
-#sortCombo:hover {
-    border: 1px solid #3498db;
-    background: #1f1f1f;
-}
-
-#sortCombo:focus {
-    border: 1px solid #3498db;
-    outline: none;
-}
-
-#sortCombo::drop-down {
-    border: none;
-    width: 30px;
-    subcontrol-origin: padding;
-    subcontrol-position: center right;
-    padding-right: 8px;
-}
-
-#sortCombo::down-arrow {
-    image: none;
-    border-left: 5px solid transparent;
-    border-right: 5px solid transparent;
-    border-top: 7px solid #7f8c8d;
-}
-
-#sortCombo::down-arrow:hover {
-    border-top-color: #3498db;
-}
-
-#sortCombo QAbstractItemView {
-    background: #1a1a1a;
-    border: 2px solid #3498db;
-    border-radius: 10px;
-    selection-background-color: #3498db;
-    selection-color: white;
-    color: #d0d0d0;
-    padding: 8px;
-    outline: none;
-}
-
-#sortCombo QAbstractItemView::item {
-    padding: 12px 20px;
-    border-radius: 8px;
-    margin: 3px;
-    min-height: 30px;
-}
-
-#sortCombo QAbstractItemView::item:hover {
-    background: rgba(52, 152, 219, 0.2);
-    color: white;
-}
-
-#sortCombo QAbstractItemView::item:selected {
-    background: #3498db;
-    color: white;
-    font-weight: 600;
-}
-
-QMenu#sortMenu {
-    background: #1a1a1a;
-    border: 2px solid #3498db;
-    border-radius: 12px;
-    padding: 10px;
-}
-
-QMenu#sortMenu::item {
-    background: transparent;
-    color: #d0d0d0;
-    padding: 10px 18px;
-    border-radius: 8px;
-    margin: 2px 4px;
-    font-size: 10px;
-}
-
-QMenu#sortMenu::item:selected {
-    background: rgba(52, 152, 219, 0.15);
-    color: white;
-}
-
-QMenu#sortMenu::item:checked {
-    background: #3498db;
-    color: white;
-    font-weight: 500;
-}
-
-QMenu#sortMenu::indicator {
-    width: 0px;
-    height: 0px;
-}
-
-QMenu#sortMenu::separator {
-    height: 0px;
-}
-
-#iconBtn {
-    background: transparent;
-    border: 1px solid #2a2a2a;
-    border-radius: 22px;
-    color: #7f8c8d;
-    font-size: 20px;
-    font-weight: 300;
-}
-
-#iconBtn:hover {
-    background: #1a1a1a;
-    border: 1px solid #3498db;
-    color: #3498db;
-}
-
-#refreshBtn {
-    background: #1a1a1a;
-    border: 2px solid #2a2a2a;
-    border-radius: 22px;
-}
-
-#refreshBtn:hover {
-    background: #1a1a1a;
-    border: 2px solid #3498db;
-}
-
-#addVpkBtn {
-    background: transparent;
-    border: 1px solid #3498db;
-    border-radius: 22px;
-    color: #3498db;
-    font-size: 10px;
-    font-weight: 500;
-}
-
-#addVpkBtn:hover {
-    background: #3498db;
-    color: white;
-    border: 1px solid #5dade2;
-}
-
-#enableAllBtn {
-    background: #3498db;
-    border: none;
-    border-radius: 22px;
-    color: white;
-    font-size: 10px;
-    font-weight: 600;
-}
-
-#enableAllBtn:hover {
-    background: #5dade2;
-}
-
-#enableAllBtn:pressed {
-    background: #2980b9;
-}
-
-#disableAllBtn {
-    background: #3498db;
-    border: none;
-    border-radius: 22px;
-    color: white;
-    font-size: 10px;
-    font-weight: 600;
-}
-
-#disableAllBtn:hover {
-    background: #5dade2;
-}
-
-#disableAllBtn:pressed {
-    background: #2980b9;
-}
-
-#counter {
-    background: #191919;
-    border-radius: 10px;
-    padding: 12px 20px;
-    color: #d0d0d0;
-    font-size: 13px;
-    font-weight: 500;
-}
-
-#modCard {
-    background: #191919;
-    border: 2px solid #252525;
-    border-radius: 15px;
-    padding: 5px;
-}
-
-#modCard:hover {
-    border: 2px solid #3498db;
-    background: #242424;
-}
-
-#addonIcon {
-    border-radius: 10px;
-    background: #1a1a1a;
-    border: 1px solid #3a3a3a;
-}
-
-#cardTitle {
-    font-size: 14px;
-    font-weight: 600;
-    color: white;
-    padding: 0px;
-    margin: 0px;
-}
-
-#cardSubtitle {
-    font-size: 12px;
-    color: #d0d0d0;
-    line-height: 1.4;
-    font-weight: 400;
-}
-
-#cardStatus {
-    font-size: 12px;
-    color: #27ae60;
-    font-weight: 500;
-}
-
-#toggleBtn {
-    background: transparent;
-    border: 1px solid #27ae60;
-    border-radius: 8px;
-    color: #27ae60;
-    font-size: 13px;
-    font-weight: 500;
-    padding: 8px 15px;
-}
-
-#toggleBtn:hover {
-    background: #27ae60;
-    color: white;
-}
-
-#disableBtn {
-    background: transparent;
-    border: 1px solid #e74c3c;
-    border-radius: 8px;
-    color: #e74c3c;
-    font-size: 13px;
-    font-weight: 500;
-    padding: 8px 15px;
-}
-
-#disableBtn:hover {
-    background: #e74c3c;
-    color: white;
-}
-
-QScrollArea {
-    border: none;
-    background: #0a0a0a;
-}
-
-QScrollArea QWidget {
-    background: #0a0a0a;
-}
-
-QScrollBar:vertical {
-    background: #1a1a1a;
-    width: 10px;
-    border-radius: 5px;
-}
-
-QScrollBar::handle:vertical {
-    background: #3498db;
-    border-radius: 5px;
-    min-height: 30px;
-}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-    height: 0px;
-}
-
-#sectionTitle {
-    font-size: 20px;
-    font-weight: 500;
-    color: white;
-    letter-spacing: 3px;
-    margin-bottom: 5px;
-    line-height: 24px;
-    padding: 0px;
-}
-
-#settingsCard {
-    background: #191919;
-    border: 2px solid #252525;
-    border-radius: 15px;
-}
-
-#settingsCard:hover {
-    border: 2px solid #3498db;
-    background: #242424;
-}
-
-#settingsInput {
-    background: #0f0f0f;
-    border: 1px solid #2a2a2a;
-    border-radius: 8px;
-    padding: 10px 12px;
-    color: white;
-    font-size: 13px;
-    font-weight: 400;
-}
-
-#settingsInput:hover {
-    border: 1px solid #3a3a3a;
-    background: #121212;
-}
-
-#settingsInput:focus {
-    border: 1px solid #3498db;
-    background: #141414;
-}
-
-#settingsBtn {
-    background: transparent;
-    border: 1px solid #3498db;
-    border-radius: 8px;
-    color: #3498db;
-    padding: 10px 18px;
-    font-size: 13px;
-    font-weight: 500;
-    letter-spacing: 1px;
-}
-
-#settingsBtn:hover {
-    background: #3498db;
-    color: white;
-    border: 1px solid #5dade2;
-}
-
-#settingsBtn:pressed {
-    background: #2980b9;
-    border: 1px solid #2980b9;
-}
-
-#glassBtn {
-    background: #0a0a0a;
-    border: 2px solid #3498db;
-    border-radius: 12px;
-    color: #3498db;
-    padding: 8px 16px;
-    font-size: 13px;
-    font-weight: 500;
-}
-
-#glassBtn:hover {
-    background: #0a0a0a;
-    border: 2px solid #5dade2;
-    color: #5dade2;
-}
-
-#glassBtn:pressed {
-    background: #0f0f0f;
-    border: 2px solid #3498db;
-}
-
-#dangerBtn {
-    background: transparent;
-    border: 1px solid #e74c3c;
-    border-radius: 8px;
-    color: #e74c3c;
-    padding: 10px 18px;
-    font-size: 13px;
-    font-weight: 500;
-    letter-spacing: 1px;
-}
-
-#dangerBtn:hover {
-    background: #e74c3c;
-    color: white;
-    border: 1px solid #ec7063;
-}
-
-#dangerBtn:pressed {
-    background: #c0392b;
-    border: 1px solid #c0392b;
-}
-
-#statusLabel {
-    font-size: 13px;
-    font-weight: 500;
-    padding: 5px 0;
-}
-
-#settingsScroll {
-    border: none;
-    background: transparent;
-}
-
-#languageBtn {
-    background: rgba(40, 40, 40, 0.8);
-    border: 2px solid rgba(52, 152, 219, 0.3);
-    border-radius: 12px;
-    color: white;
-    padding: 10px 20px;
-    font-size: 13px;
-    font-weight: 500;
-    min-width: 120px;
-}
-
-#languageBtn:hover {
-    background: rgba(52, 152, 219, 0.2);
-    border: 2px solid rgba(52, 152, 219, 0.6);
-}
-
-#languageBtn:checked {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #3498db, stop:1 #2980b9);
-    border: 2px solid #3498db;
-    color: white;
-}
-
-#languageBtn:checked:hover {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #5dade2, stop:1 #3498db);
-}
-
-#languageHeaderBtn {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #27ae60, stop:0.5 #2ecc71, stop:1 #27ae60);
-    border: none;
-    border-radius: 20px;
-    color: white;
-    font-size: 12px;
-    font-weight: 600;
-    padding: 0 15px;
-    min-width: 60px;
-}
-
-#languageHeaderBtn:hover {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #2ecc71, stop:0.5 #58d68d, stop:1 #2ecc71);
-}
-
-#languageHeaderBtn:pressed {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #229954, stop:0.5 #27ae60, stop:1 #229954);
-}
-
-#languageCard {
-    background: #191919;
-    border: 2px solid #252525;
-    border-radius: 15px;
-}
-
-#languageCard:hover {
-    border: 2px solid #3498db;
-    background: #242424;
-}
+# Стиль сообщения о недоступной системе обновлений
+UPDATE_ERROR_MSG_CSS = """
+    QMessageBox {
+        background-color: #2d2d2d;
+        color: white;
+    }
+    QMessageBox QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #5dade2;
+    }
 """
 
 
@@ -446,7 +446,11 @@ class Localization:
                 "installation_completed_errors": "Установка завершена с ошибками",
                 "deleting_folder": "Удаление папки: {addon_id}\n({current} из {total})",
                 "enabled_addons_count": "Включено аддонов: {count}",
+                "bulk_completed_errors": "Завершено с ошибками",
+                "bulk_failed_header": "Не удалось обработать: {count}",
+                "bulk_failed_more": "... и еще {count}",
                 "all_addons_disabled": "Все аддоны выключены и удалены.",
+                "deleted_folders_count": "Аддоны выключены. Удалено папок: {count} из {total}",
                 "enabling_addons": "Включение аддонов...",
                 "disabling_addons": "Выключение аддонов...",
                 "enabling_addon": "Включение: {name}\n({current} из {total})",
@@ -527,6 +531,9 @@ class Localization:
                 "content_check_error": "Ошибка при проверке контента:\n{error}\n\n{traceback}",
                 "download_multiple_title": "Скачать несколько модов?",
                 "download_multiple_message": "Будет скачано модов: {count}\n\nПродолжить?",
+                "duplicates_removed": "Дубликатов удалено: {count}",
+                "skip_installed_title": "Пропустить установленные?",
+                "skip_installed_message": "Уже установлено через Steam Workshop: {count}\n\nПропустить эти моды?",
                 "downloading_mods": "Скачивание модов...",
                 "download_completed": "Скачивание завершено!\n\nУспешно: {success}\nОшибок: {failed}",
                 
@@ -966,7 +973,11 @@ class Localization:
                 "installation_completed_errors": "Installation Completed with Errors",
                 "deleting_folder": "Deleting folder: {addon_id}\n({current} of {total})",
                 "enabled_addons_count": "Enabled addons: {count}",
+                "bulk_completed_errors": "Completed with Errors",
+                "bulk_failed_header": "Failed: {count}",
+                "bulk_failed_more": "... and {count} more",
                 "all_addons_disabled": "All addons disabled and deleted.",
+                "deleted_folders_count": "Addons disabled. Folders deleted: {count} of {total}",
                 "enabling_addons": "Enabling addons...",
                 "disabling_addons": "Disabling addons...",
                 "enabling_addon": "Enabling: {name}\n({current} of {total})",
@@ -1047,6 +1058,9 @@ class Localization:
                 "content_check_error": "Error checking content:\n{error}\n\n{traceback}",
                 "download_multiple_title": "Download multiple mods?",
                 "download_multiple_message": "Mods to download: {count}\n\nContinue?",
+                "duplicates_removed": "Duplicates removed: {count}",
+                "skip_installed_title": "Skip installed mods?",
+                "skip_installed_message": "Already installed via Steam Workshop: {count}\n\nSkip these mods?",
                 "downloading_mods": "Downloading mods...",
                 "download_completed": "Download completed!\n\nSuccessful: {success}\nErrors: {failed}",
                 